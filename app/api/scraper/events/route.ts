@@ -0,0 +1,51 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { openScraperDaemonEvents } from '@/lib/scraper-daemon'
+
+export const dynamic = 'force-dynamic'
+
+// Live scraper progress as Server-Sent Events (use with EventSource)
+// Query: run_id (default: latest run), since (resume after this event id)
+export async function GET(request: NextRequest) {
+  try {
+    const { searchParams } = new URL(request.url)
+    const query = new URLSearchParams()
+    for (const key of ['run_id', 'since']) {
+      const value = searchParams.get(key)
+      if (value) query.set(key, value)
+    }
+    const lastEventId = request.headers.get('last-event-id')
+    if (lastEventId && !query.has('since')) query.set('since', lastEventId)
+
+    const upstream = await openScraperDaemonEvents(query.toString(), request.signal)
+
+    if (!upstream.ok || !upstream.body) {
+      const data = await upstream.json().catch(() => ({}))
+      return NextResponse.json(
+        {
+          success: false,
+          error: data.error || 'No progress events available'
+        },
+        { status: upstream.status }
+      )
+    }
+
+    return new Response(upstream.body, {
+      headers: {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache, no-transform',
+        Connection: 'keep-alive'
+      }
+    })
+
+  } catch (error: any) {
+    console.error('Scraper events error:', error)
+    
+    return NextResponse.json(
+      { 
+        success: false, 
+        error: error?.message || 'Failed to open scraper event stream'
+      },
+      { status: 500 }
+    )
+  }
+}
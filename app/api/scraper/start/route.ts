@@ -1,8 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server'
-import { exec } from 'child_process'
-import { promisify } from 'util'
-
-const execAsync = promisify(exec)
+import { callScraperDaemon } from '@/lib/scraper-daemon'
 
 export async function POST(request: NextRequest) {
   try {
@@ -14,33 +11,34 @@ export async function POST(request: NextRequest) {
       parallel = false
     } = body
 
-    // Build command arguments
-    const sourceArgs = sources.includes('gktoday') && sources.includes('drishti') 
-      ? '--gktoday --drishti' 
-      : sources.includes('gktoday') 
-        ? '--gktoday' 
-        : '--drishti'
-
-    const parallelArg = parallel ? '--parallel' : ''
-
-    const command = `cd production_scrapers && python cli.py start ${sourceArgs} --max-pages ${maxPages} --max-articles ${maxArticles} ${parallelArg}`
+    const options = {
+      gktoday_enabled: sources.includes('gktoday'),
+      drishti_enabled: sources.includes('drishti'),
+      max_pages: Number(maxPages),
+      max_articles: Number(maxArticles),
+      parallel: Boolean(parallel)
+    }
     
-    console.log(`Starting background scraper: ${command}`)
+    console.log('Starting background scraper:', options)
     
-    // Start the scraper in background (don't wait for completion)
-    const { stdout, stderr } = await execAsync(command, {
-      timeout: 10000, // Just wait for startup confirmation
-      cwd: process.cwd()
-    })
+    // The daemon starts the run in the background and answers immediately
+    const { status, data } = await callScraperDaemon('/start', { method: 'POST', body: options })
 
-    if (stderr && !stderr.includes('warning')) {
-      console.error('Scraper start stderr:', stderr)
+    if (!data.success) {
+      return NextResponse.json(
+        { 
+          success: false, 
+          error: data.message || data.error || 'Failed to start scraper',
+          status: data.status
+        },
+        { status: status === 409 || status === 400 ? status : 500 }
+      )
     }
 
     return NextResponse.json({
       success: true,
       message: 'Background scraping started',
-      command: command,
+      options,
       timestamp: new Date().toISOString(),
       note: 'Use /api/scraper/status to monitor progress'
     })
@@ -52,7 +50,7 @@ export async function POST(request: NextRequest) {
       { 
         success: false, 
         error: error?.message || 'Failed to start scraper',
-        details: error?.stderr || 'Unknown error'
+        details: error?.cause?.message || 'Unknown error'
       },
       { status: 500 }
     )
@@ -61,15 +59,17 @@ export async function POST(request: NextRequest) {
 
 export async function DELETE() {
   try {
-    const command = `cd production_scrapers && python cli.py cancel`
-    
-    const { stdout, stderr } = await execAsync(command, {
-      timeout: 10000,
-      cwd: process.cwd()
-    })
+    const { status, data } = await callScraperDaemon('/cancel', { method: 'POST' })
 
-    if (stderr && !stderr.includes('warning')) {
-      console.error('Scraper cancel stderr:', stderr)
+    if (!data.success) {
+      return NextResponse.json(
+        { 
+          success: false, 
+          error: data.message || 'Failed to cancel scraper',
+          status: data.status
+        },
+        { status: status === 409 ? 409 : 500 }
+      )
     }
 
     return NextResponse.json({
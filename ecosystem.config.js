@@ -21,14 +21,16 @@ module.exports = {
     {
       name: 'scraper-service',
       script: '/var/www/educational-platform/venv/bin/python',
-      args: '/var/www/educational-platform/production_scrapers/scraper_service.py',
+      args: '/var/www/educational-platform/production_scrapers/scraper_daemon.py',
       cwd: '/var/www/educational-platform',
       instances: 1,
       autorestart: true,
       watch: false,
       max_memory_restart: '512M',
       env: {
-        PYTHONPATH: '/var/www/educational-platform'
+        PYTHONPATH: '/var/www/educational-platform',
+        SCRAPER_SERVICE_HOST: '127.0.0.1',
+        SCRAPER_SERVICE_PORT: 8765
       },
       error_file: '/var/log/educational-platform/scraper-error.log',
       out_file: '/var/log/educational-platform/scraper-out.log',
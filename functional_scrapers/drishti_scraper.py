@@ -4,13 +4,19 @@ from datetime import datetime, timedelta
 from urllib.parse import urljoin
 import logging
 import os
-import psycopg2
+import sys
 from psycopg2.extras import DictCursor, register_uuid
 import uuid
 import re
 import time
 from dotenv import load_dotenv
 
+# production_scrapers (after this directory) for the shared content locator, connection pool and schema migrations
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'production_scrapers'))
+from content_locator import largest_text_container
+from db_pool import get_pool
+from migrations import ensure_schema
+
 # Load environment variables
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 dotenv_path = os.path.join(root_dir, '.env.local')
@@ -44,74 +50,25 @@ class EnhancedDrishtiScraperFixed:
     def init_database(self):
         """Initialize database connection"""
         try:
-            database_url = os.getenv('DATABASE_URL')
-            if not database_url:
+            if not os.getenv('DATABASE_URL'):
                 raise ValueError("DATABASE_URL not found in environment variables")
             
-            self.conn = psycopg2.connect(database_url)
+            self.conn = get_pool().getconn()
             self.cursor = self.conn.cursor(cursor_factory=DictCursor)
             register_uuid()
-            self._create_tables()
+            ensure_schema(self.conn)
             logger.info("Database connection established")
         except Exception as e:
             logger.error(f"Error initializing database: {e}")
             raise
 
-    def _create_tables(self):
-        """Create tables if they don't exist"""
-        try:
-            # Create articles table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS gk_today_content (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    title TEXT NOT NULL,
-                    url TEXT UNIQUE NOT NULL,
-                    image_url TEXT,
-                    published_date DATE,
-                    source_name TEXT DEFAULT 'DrishtiIAS',
-                    scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    intro TEXT,
-                    sequence_order INTEGER,
-                    date TEXT,
-                    importance_rating VARCHAR(10)
-                )
-            """)
-
-            # Create sections table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sections (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    article_id UUID REFERENCES gk_today_content(id),
-                    heading TEXT,
-                    content TEXT,
-                    type TEXT CHECK (type IN ('paragraph', 'list')),
-                    sequence_order INTEGER
-                )
-            """)
-
-            # Create section_bullets table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS section_bullets (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    section_id UUID REFERENCES sections(id),
-                    content TEXT NOT NULL,
-                    bullet_order INTEGER
-                )
-            """)
-
-            self.conn.commit()
-            logger.info("Database tables created successfully")
-        except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error creating tables: {e}")
-            raise
-
     def close(self):
         if self.cursor:
             self.cursor.close()
         if self.conn:
-            self.conn.close()
-            logger.info("Database connection closed")
+            get_pool().putconn(self.conn)
+            self.conn = None
+            logger.info("Database connection returned to pool")
 
     def fetch_page(self, url, max_retries=3):
         """Fetch webpage with retry logic"""
@@ -214,9 +171,7 @@ class EnhancedDrishtiScraperFixed:
         
         if not article_detail:
             # Fallback: find the largest div with text content
-            all_divs = soup.find_all('div')
-            if all_divs:
-                article_detail = max(all_divs, key=lambda x: len(x.get_text()), default=None)
+            article_detail = largest_text_container(soup)
         
         if not article_detail:
             return intro, sections
@@ -16,6 +16,12 @@ import logging
 # Database configuration - using the DATABASE_URL from .env.local
 from dotenv import load_dotenv
 
+# production_scrapers (after this directory) for the shared content locator, connection pool and schema migrations
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'production_scrapers'))
+from content_locator import largest_text_container
+from db_pool import get_pool
+from migrations import ensure_schema
+
 # Load environment variables from .env.local
 root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 dotenv_path = os.path.join(root_dir, '.env.local')
@@ -46,62 +52,14 @@ class DatabaseManager:
         
     def connect(self):
         try:
-            self.conn = psycopg2.connect(DATABASE_URL)
+            self.conn = get_pool().getconn()
             self.cursor = self.conn.cursor(cursor_factory=DictCursor)
-            self._create_tables()
+            ensure_schema(self.conn)
             logger.info("Successfully connected to the database")
         except Exception as e:
             logger.error(f"Error connecting to the database: {e}")
             raise
 
-    def _create_tables(self):
-        try:
-            # Create articles table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS gk_today_content (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    title TEXT NOT NULL,
-                    url TEXT UNIQUE NOT NULL,
-                    image_url TEXT,
-                    published_date DATE,
-                    source_name TEXT DEFAULT 'GKToday',
-                    scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                    intro TEXT,
-                    sequence_order INTEGER,
-                    date TEXT,
-                    importance_rating VARCHAR(10)
-                )
-            """)
-
-            # Create sections table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sections (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    article_id UUID REFERENCES gk_today_content(id),
-                    heading TEXT,
-                    content TEXT,
-                    type TEXT CHECK (type IN ('paragraph', 'list')),
-                    sequence_order INTEGER
-                )
-            """)
-
-            # Create section_bullets table
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS section_bullets (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    section_id UUID REFERENCES sections(id),
-                    content TEXT NOT NULL,
-                    bullet_order INTEGER
-                )
-            """)
-
-            self.conn.commit()
-            logger.info("Database tables created successfully")
-        except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error creating tables: {e}")
-            raise
-
     def check_article_exists(self, url):
         """Check if an article already exists in the database"""
         try:
@@ -195,8 +153,9 @@ class DatabaseManager:
         if self.cursor:
             self.cursor.close()
         if self.conn:
-            self.conn.close()
-            logger.info("Database connection closed")
+            get_pool().putconn(self.conn)
+            self.conn = None
+            logger.info("Database connection returned to pool")
 
 class EnhancedGKTodayScraper:
     def __init__(self):
@@ -308,8 +267,7 @@ class EnhancedGKTodayScraper:
             
             if not main_content:
                 # Fallback to largest text container
-                all_divs = soup.find_all('div')
-                main_content = max(all_divs, key=lambda x: len(x.get_text()), default=None)
+                main_content = largest_text_container(soup)
             
             if main_content:
                 # Find the first paragraph and image
@@ -10,12 +10,12 @@ import os
 import logging
 import argparse
 import time
-import psycopg2
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
-# Add functional_scrapers to path
+# Add functional_scrapers to path, and production_scrapers (after it) for the shared connection pool
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'production_scrapers'))
 
 # Load environment variables
 root_dir = os.path.dirname(__file__)
@@ -38,34 +38,38 @@ DATABASE_URL = os.getenv('DATABASE_URL')
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
+from db_pool import get_pool
+from migrations import migrate, reset_schema_cache
+
 def wipe_database():
     """Wipe the PostgreSQL database tables completely"""
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-        
-        logger.info("Wiping database tables...")
-        
-        # Drop tables in correct order (considering foreign key constraints)
-        tables_to_drop = [
-            'section_bullets',
-            'sections', 
-            'gk_today_content',
-            'quiz_attempts',
-            'student_invitations',
-            'scraped_content'
-        ]
-        
-        for table in tables_to_drop:
-            try:
-                cursor.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
-                logger.info(f"Dropped table: {table}")
-            except Exception as e:
-                logger.warning(f"Could not drop table {table}: {e}")
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pool().connection() as conn:
+            cursor = conn.cursor()
+            
+            logger.info("Wiping database tables...")
+            
+            # Drop tables in correct order (considering foreign key constraints)
+            tables_to_drop = [
+                'section_bullets',
+                'sections', 
+                'gk_today_content',
+                'quiz_attempts',
+                'student_invitations',
+                'scraped_content',
+                'schema_migrations'
+            ]
+            
+            for table in tables_to_drop:
+                try:
+                    cursor.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
+                    logger.info(f"Dropped table: {table}")
+                except Exception as e:
+                    logger.warning(f"Could not drop table {table}: {e}")
+            
+            conn.commit()
+            cursor.close()
+        reset_schema_cache()
         logger.info("Database wiped successfully")
         return True
     except Exception as e:
@@ -73,66 +77,11 @@ def wipe_database():
         return False
 
 def initialize_database():
-    """Initialize a fresh database with required tables"""
+    """Initialize a fresh database by applying the schema migrations"""
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-        
         logger.info("Initializing database tables...")
-        
-        # Create main content table for both GKToday and DrishtiIAS
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS gk_today_content (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                title TEXT NOT NULL,
-                url TEXT UNIQUE NOT NULL,
-                image_url TEXT,
-                published_date DATE,
-                source_name TEXT DEFAULT 'GKToday',
-                scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                intro TEXT,
-                sequence_order INTEGER,
-                date TEXT,
-                importance_rating VARCHAR(10)
-            )
-        ''')
-        
-        # Create sections table for structured content
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sections (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                article_id UUID REFERENCES gk_today_content(id) ON DELETE CASCADE,
-                heading TEXT,
-                content TEXT,
-                type TEXT CHECK (type IN ('paragraph', 'list')),
-                sequence_order INTEGER
-            )
-        ''')
-        
-        # Create section_bullets table for bullet points
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS section_bullets (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                section_id UUID REFERENCES sections(id) ON DELETE CASCADE,
-                content TEXT NOT NULL,
-                bullet_order INTEGER
-            )
-        ''')
-        
-        # Create indexes for better performance
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_gk_today_content_source_name ON gk_today_content(source_name);
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_gk_today_content_published_date ON gk_today_content(published_date);
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_gk_today_content_scraped_at ON gk_today_content(scraped_at);
-        ''')
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pool().connection() as conn:
+            migrate(conn)
         logger.info("Database initialized successfully")
         return True
     except Exception as e:
@@ -142,31 +91,30 @@ def initialize_database():
 def get_database_stats():
     """Get current database statistics"""
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-        
-        # Get article counts by source
-        cursor.execute("""
-            SELECT source_name, COUNT(*) 
-            FROM gk_today_content 
-            GROUP BY source_name
-        """)
-        source_counts = dict(cursor.fetchall())
-        
-        # Get total count
-        cursor.execute("SELECT COUNT(*) FROM gk_today_content")
-        total_count = cursor.fetchone()[0]
-        
-        # Get latest article dates
-        cursor.execute("""
-            SELECT source_name, MAX(scraped_at) 
-            FROM gk_today_content 
-            GROUP BY source_name
-        """)
-        latest_scrapes = dict(cursor.fetchall())
-        
-        cursor.close()
-        conn.close()
+        with get_pool().connection() as conn:
+            cursor = conn.cursor()
+            
+            # Get article counts by source
+            cursor.execute("""
+                SELECT source_name, COUNT(*) 
+                FROM gk_today_content 
+                GROUP BY source_name
+            """)
+            source_counts = dict(cursor.fetchall())
+            
+            # Get total count
+            cursor.execute("SELECT COUNT(*) FROM gk_today_content")
+            total_count = cursor.fetchone()[0]
+            
+            # Get latest article dates
+            cursor.execute("""
+                SELECT source_name, MAX(scraped_at) 
+                FROM gk_today_content 
+                GROUP BY source_name
+            """)
+            latest_scrapes = dict(cursor.fetchall())
+            
+            cursor.close()
         
         return {
             'total_articles': total_count,
@@ -0,0 +1,35 @@
+// Client for the resident scraper daemon (production_scrapers/scraper_daemon.py)
+// The daemon listens on loopback only; override the address with SCRAPER_SERVICE_URL
+
+const SCRAPER_SERVICE_URL = process.env.SCRAPER_SERVICE_URL || 'http://127.0.0.1:8765'
+
+export interface ScraperDaemonResponse<T = any> {
+  status: number
+  data: T
+}
+
+export async function callScraperDaemon<T = any>(
+  path: string,
+  options: { method?: 'GET' | 'POST'; body?: unknown; timeoutMs?: number } = {}
+): Promise<ScraperDaemonResponse<T>> {
+  const { method = 'GET', body, timeoutMs = 10000 } = options
+
+  const response = await fetch(`${SCRAPER_SERVICE_URL}${path}`, {
+    method,
+    headers: { 'Content-Type': 'application/json' },
+    body: body === undefined ? undefined : JSON.stringify(body),
+    signal: AbortSignal.timeout(timeoutMs),
+    cache: 'no-store'
+  })
+
+  return { status: response.status, data: await response.json() }
+}
+
+// Open the daemon's live progress event stream (Server-Sent Events) for proxying to the browser
+export async function openScraperDaemonEvents(query: string, signal?: AbortSignal): Promise<Response> {
+  return fetch(`${SCRAPER_SERVICE_URL}/events?format=sse${query ? `&${query}` : ''}`, {
+    headers: { Accept: 'text/event-stream' },
+    signal,
+    cache: 'no-store'
+  })
+}
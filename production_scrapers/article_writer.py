@@ -0,0 +1,157 @@
+"""
+Batched article writer shared by the production scrapers
+Builds the article/section/bullet graph client-side and writes it with
+multi-row statements: at most three round-trips per batch of articles
+"""
+
+import logging
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from psycopg2.extras import execute_values, register_uuid
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+register_uuid()
+
+ARTICLE_COLUMNS = (
+    'id', 'title', 'url', 'image_url', 'published_date', 'intro',
+    'sequence_order', 'source_name', 'date', 'importance_rating'
+)
+
+def make_article_record(
+    title: str,
+    url: str,
+    source_name: str,
+    sections: Optional[List[Dict]] = None,
+    **columns
+) -> Dict:
+    """
+    Build a normalized article record for insert_articles
+
+    Sections are dicts with 'heading', 'content' and 'bullet_points'. Columns
+    that are not given are written as NULL, matching the single-row inserts
+    the scrapers used before.
+    """
+    record = {column: columns.get(column) for column in ARTICLE_COLUMNS}
+    record.update({
+        'id': columns.get('id') or uuid.uuid4(),
+        'title': title,
+        'url': url,
+        'source_name': source_name,
+        'sections': sections or []
+    })
+    return record
+
+def build_article_graph(records: List[Dict]) -> Tuple[List[tuple], Dict[uuid.UUID, List[tuple]], Dict[uuid.UUID, List[tuple]]]:
+    """
+    Turn article records into row tuples with client-generated UUIDs
+
+    Returns (article_rows, section_rows_by_article, bullet_rows_by_article) so
+    rows belonging to articles that hit ON CONFLICT can be dropped.
+    """
+    article_rows = []
+    section_rows = {}
+    bullet_rows = {}
+
+    for record in records:
+        article_id = record['id']
+        article_rows.append(tuple(record[column] for column in ARTICLE_COLUMNS))
+        section_rows[article_id] = []
+        bullet_rows[article_id] = []
+
+        for section_order, section in enumerate(record['sections']):
+            section_id = uuid.uuid4()
+            bullets = section.get('bullet_points') or []
+            section_rows[article_id].append((
+                section_id,
+                article_id,
+                section.get('heading', ''),
+                section.get('content', ''),
+                'list' if bullets else 'paragraph',
+                section_order
+            ))
+            for bullet_order, bullet in enumerate(bullets):
+                bullet_rows[article_id].append((section_id, bullet, bullet_order))
+
+    return article_rows, section_rows, bullet_rows
+
+def insert_articles(cursor, records: List[Dict]) -> Dict[str, uuid.UUID]:
+    """
+    Insert a batch of article records with their sections and bullets
+
+    Does not commit. Articles whose URL already exists are skipped via
+    ON CONFLICT (url) DO NOTHING together with their sections and bullets.
+
+    Returns:
+        Dict mapping url -> id for the articles actually inserted
+    """
+    if not records:
+        return {}
+
+    article_rows, section_rows, bullet_rows = build_article_graph(records)
+
+    inserted = execute_values(cursor, f"""
+        INSERT INTO gk_today_content ({', '.join(ARTICLE_COLUMNS)})
+        VALUES %s
+        ON CONFLICT (url) DO NOTHING
+        RETURNING id, url
+    """, article_rows, page_size=len(article_rows), fetch=True)
+    inserted_ids = {row[1]: row[0] for row in inserted}
+
+    sections = [row for article_id in inserted_ids.values() for row in section_rows[article_id]]
+    if sections:
+        execute_values(cursor, """
+            INSERT INTO sections (id, article_id, heading, content, type, sequence_order)
+            VALUES %s
+        """, sections, page_size=len(sections))
+
+    bullets = [row for article_id in inserted_ids.values() for row in bullet_rows[article_id]]
+    if bullets:
+        execute_values(cursor, """
+            INSERT INTO section_bullets (section_id, content, bullet_order)
+            VALUES %s
+        """, bullets, page_size=len(bullets))
+
+    logger.debug(f"Inserted {len(inserted_ids)}/{len(records)} articles, {len(sections)} sections, {len(bullets)} bullets")
+    return inserted_ids
+
+def insert_articles_isolated(cursor, records: List[Dict]) -> Tuple[Dict[str, uuid.UUID], Dict[str, str]]:
+    """
+    Insert a page of article records inside the caller's transaction
+
+    The whole page is first written as one batch under a savepoint. If that
+    fails, it is rolled back and each article is retried under its own
+    savepoint so one bad article does not take its siblings down with it.
+    Does not commit.
+
+    Returns:
+        (inserted url -> id, failed url -> error message)
+    """
+    if not records:
+        return {}, {}
+
+    cursor.execute("SAVEPOINT article_page")
+    try:
+        inserted = insert_articles(cursor, records)
+        cursor.execute("RELEASE SAVEPOINT article_page")
+        return inserted, {}
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT article_page")
+        logger.warning(f"Batch insert failed, retrying {len(records)} articles individually: {e}")
+
+    inserted = {}
+    failed = {}
+    for record in records:
+        cursor.execute("SAVEPOINT article_write")
+        try:
+            inserted.update(insert_articles(cursor, [record]))
+            cursor.execute("RELEASE SAVEPOINT article_write")
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT article_write")
+            failed[record['url']] = str(e)
+            logger.error(f"Error inserting article {record['url']}: {e}")
+
+    cursor.execute("RELEASE SAVEPOINT article_page")
+    return inserted, failed
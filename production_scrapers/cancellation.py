@@ -0,0 +1,93 @@
+"""
+Cooperative cancellation for scraping runs
+A CancellationToken is passed from ScraperService through CombinedScraper into
+the scrapers' loops and fetch calls; cancelling it (or letting its timeout
+expire) stops the run at the next page/day boundary or pending fetch
+"""
+
+import logging
+import threading
+from typing import Callable, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+class ScrapeCancelled(Exception):
+    """Raised inside a scraper when its cancellation token has been cancelled"""
+
+class CancellationToken:
+    """
+    Thread-safe cancellation flag with callbacks
+
+    A token may have a parent (cancelling the parent cancels it) and a timeout
+    after which it cancels itself. Call close() once the work it guards is done
+    to stop the timer and detach from the parent.
+    """
+
+    def __init__(self, parent: Optional['CancellationToken'] = None, timeout: Optional[float] = None):
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self._parent = parent
+        self._parent_callback = None
+        self._timer: Optional[threading.Timer] = None
+
+        if parent is not None:
+            self._parent_callback = parent.add_callback(lambda: self.cancel(parent.reason))
+        if timeout is not None:
+            self._timer = threading.Timer(timeout, self.cancel, args=(f"timed out after {timeout:g}s",))
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called"""
+        return self._event.is_set()
+
+    def cancel(self, reason: Optional[str] = None):
+        """Cancel the token and run its callbacks (only the first call has any effect)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason or "cancelled"
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        logger.info(f"Cancellation requested: {self.reason}")
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in cancellation callback: {e}")
+
+    def raise_if_cancelled(self):
+        """Raise ScrapeCancelled if the token has been cancelled"""
+        if self._event.is_set():
+            raise ScrapeCancelled(self.reason)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout; returns whether the token is cancelled"""
+        return self._event.wait(timeout)
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Run callback on cancellation (immediately if already cancelled); returns it for remove_callback()"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return callback
+        callback()
+        return callback
+
+    def remove_callback(self, callback: Callable[[], None]):
+        """Unregister a callback added with add_callback()"""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def close(self):
+        """Stop the timeout timer and detach from the parent token"""
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._parent is not None:
+            self._parent.remove_callback(self._parent_callback)
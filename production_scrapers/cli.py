@@ -4,16 +4,18 @@ Command-line interface for the production scraper service
 Usage examples:
   python cli.py start --gktoday --drishti --max-pages 3
   python cli.py status
+  python cli.py runs --limit 5
   python cli.py result
   python cli.py quick --max-articles 10
   python cli.py latest --limit 5
+  python cli.py migrate
 """
 
 import argparse
 import json
 import sys
 import time
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 from scraper_service import (
     get_scraper_service,
@@ -22,54 +24,77 @@ from scraper_service import (
     ScrapingStatus
 )
 from combined_scraper import CombinedScraper
+from db_pool import get_pool
+from migrations import current_version, latest_version, load_migrations, migrate
+from scraper_daemon import DaemonUnavailable, call_daemon, stream_daemon_events
+import progress_events
+
+def control(method: str, path: str, local: Callable[[], Any], payload: Optional[Dict] = None) -> Any:
+    """
+    Run a control request against the resident daemon if one is running,
+    otherwise against an in-process ScraperService
+    """
+    try:
+        return call_daemon(method, path, payload)
+    except DaemonUnavailable:
+        return local()
 
 def start_scraping_command(args):
     """Start a scraping operation"""
     service = get_scraper_service()
+    options = {
+        "gktoday_enabled": args.gktoday,
+        "drishti_enabled": args.drishti,
+        "max_pages": args.max_pages,
+        "max_articles": args.max_articles,
+        "parallel": args.parallel
+    }
     
-    if service.is_running():
-        print(json.dumps({
-            "success": False,
-            "error": "Scraping operation already in progress"
-        }))
-        return 1
-    
-    result = service.start_scraping(
-        gktoday_enabled=args.gktoday,
-        drishti_enabled=args.drishti,
-        max_pages=args.max_pages,
-        max_articles=args.max_articles,
-        parallel=args.parallel
-    )
-    
+    result = control('POST', '/start', lambda: service.start_scraping(**options), options)
     print(json.dumps(result))
+    if not result.get("success"):
+        return 1
     
     # If --wait flag is set, wait for completion and show progress
     if args.wait:
         print("Waiting for scraping to complete...", file=sys.stderr)
-        while service.is_running():
-            status = service.get_status()
+        while True:
+            status = control('GET', '/status', service.get_status)
+            if status['status'] != ScrapingStatus.RUNNING.value:
+                break
             print(f"Progress: {status['progress_percentage']:.1f}% - {status['status']}", file=sys.stderr)
             time.sleep(2)
         
-        final_result = service.get_result()
-        if final_result:
+        final_result = control('GET', '/result', service.get_result)
+        if final_result and 'message' not in final_result:
             print("Final result:", file=sys.stderr)
             print(json.dumps(final_result, indent=2))
     
     return 0
 
 def status_command(args):
-    """Get current scraping status"""
+    """Get current scraping status (or the status of a specific run)"""
     service = get_scraper_service()
-    status = service.get_status()
+    if args.run_id:
+        status = control('GET', f'/runs/{args.run_id}', lambda: service.get_run(args.run_id) or {
+            "success": False, "error": "Run not found"
+        })
+    else:
+        status = control('GET', '/status', service.get_status)
     print(json.dumps(status, indent=2 if args.pretty else None))
     return 0
 
+def runs_command(args):
+    """List recent scraping runs"""
+    service = get_scraper_service()
+    runs = control('GET', f'/runs?limit={args.limit}', lambda: service.list_runs(args.limit))
+    print(json.dumps(runs, indent=2 if args.pretty else None))
+    return 0
+
 def result_command(args):
     """Get last scraping result"""
     service = get_scraper_service()
-    result = service.get_result()
+    result = control('GET', '/result', service.get_result)
     if result:
         print(json.dumps(result, indent=2 if args.pretty else None))
     else:
@@ -79,7 +104,7 @@ def result_command(args):
 def cancel_command(args):
     """Cancel current scraping operation"""
     service = get_scraper_service()
-    result = service.cancel_scraping()
+    result = control('POST', '/cancel', service.cancel_scraping)
     print(json.dumps(result))
     return 0
 
@@ -132,7 +157,7 @@ def quick_command(args):
 def latest_command(args):
     """Get latest articles from database"""
     try:
-        articles = get_latest_articles(limit=args.limit)
+        articles = control('GET', f'/latest?limit={args.limit}', lambda: get_latest_articles(limit=args.limit))
         print(json.dumps(articles, indent=2 if args.pretty else None))
         return 0
     except Exception as e:
@@ -142,37 +167,108 @@ def latest_command(args):
         }))
         return 1
 
+def migrate_command(args):
+    """Apply pending database schema migrations"""
+    try:
+        with get_pool().connection() as conn:
+            if args.status:
+                version = current_version(conn)
+                print(json.dumps({
+                    "success": True,
+                    "current_version": version,
+                    "latest_version": latest_version(),
+                    "pending": [f"{m.version:04d}_{m.name}" for m in load_migrations() if m.version > version]
+                }, indent=2 if args.pretty else None))
+                return 0
+            
+            applied = migrate(conn)
+            print(json.dumps({
+                "success": True,
+                "applied": [f"{m.version:04d}_{m.name}" for m in applied],
+                "current_version": current_version(conn)
+            }, indent=2 if args.pretty else None))
+            return 0
+    except Exception as e:
+        print(json.dumps({
+            "success": False,
+            "error": str(e)
+        }))
+        return 1
+
+def print_status_screen(status: Dict[str, Any], show_errors: bool, activity: Optional[Dict[str, int]] = None):
+    """Redraw the monitor screen for a status dict"""
+    # Clear screen (works on most terminals)
+    print("\033[2J\033[H", end="")
+    
+    print("=== SCRAPER STATUS MONITOR ===")
+    print(f"Status: {status['status']}")
+    print(f"Progress: {status['progress_percentage']:.1f}%")
+    print(f"Articles Scraped: {status['articles_scraped']}")
+    print(f"Articles Skipped: {status['articles_skipped']}")
+    
+    if status.get('current_scraper'):
+        print(f"Current Scraper: {status['current_scraper']}")
+    
+    if status['errors']:
+        print(f"Errors: {len(status['errors'])}")
+        if show_errors:
+            for error in status['errors'][:3]:
+                print(f"  - {error}")
+    
+    if status.get('articles_per_second') is not None:
+        print(f"Throughput: {status['articles_per_second']:.2f} articles/s")
+    
+    if status['estimated_remaining_seconds']:
+        print(f"Estimated remaining: {status['estimated_remaining_seconds']}s")
+    
+    if activity:
+        print("Activity: " + ", ".join(f"{count} {event_type}" for event_type, count in activity.items()))
+    
+    print(f"\nLast updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+
+def follow_events(status: Dict[str, Any], show_errors: bool) -> bool:
+    """
+    Render the daemon's live event stream until the run finishes
+    
+    Returns False (without printing) if the daemon is not running or has no
+    events for the current run, so the caller can fall back to polling.
+    """
+    activity: Dict[str, int] = {}
+    received = False
+    try:
+        for event in stream_daemon_events('/events'):
+            received = True
+            if event['type'] in progress_events.SCRAPER_EVENTS:
+                activity[event['type']] = activity.get(event['type'], 0) + 1
+                if event['type'] == progress_events.ERROR and event.get('message'):
+                    status['errors'] = status['errors'] + [event['message']]
+            elif event['type'] == progress_events.PROGRESS:
+                status.update(event['data'])
+                print_status_screen(status, show_errors, activity)
+            elif event['type'] == progress_events.RUN_FINISHED:
+                status['status'] = event['message']
+                status['progress_percentage'] = 100.0
+                status['estimated_remaining_seconds'] = 0
+                status.update({key: value for key, value in event.get('data', {}).items() if key.startswith('articles_')})
+                print_status_screen(status, show_errors, activity)
+    except DaemonUnavailable:
+        return False
+    return received
+
 def monitor_command(args):
     """Monitor scraping progress in real-time"""
     service = get_scraper_service()
     
     print("Monitoring scraper status... Press Ctrl+C to exit")
     try:
+        status = control('GET', '/status', service.get_status)
+        if status['status'] == 'running' and not args.poll and follow_events(status, args.show_errors):
+            print("Scraping finished. Exiting monitor.")
+            return 0
+        
         while True:
-            status = service.get_status()
-            
-            # Clear screen (works on most terminals)
-            print("\033[2J\033[H", end="")
-            
-            print("=== SCRAPER STATUS MONITOR ===")
-            print(f"Status: {status['status']}")
-            print(f"Progress: {status['progress_percentage']:.1f}%")
-            print(f"Articles Scraped: {status['articles_scraped']}")
-            print(f"Articles Skipped: {status['articles_skipped']}")
-            
-            if status['current_scraper']:
-                print(f"Current Scraper: {status['current_scraper']}")
-            
-            if status['errors']:
-                print(f"Errors: {len(status['errors'])}")
-                if args.show_errors:
-                    for error in status['errors'][:3]:
-                        print(f"  - {error}")
-            
-            if status['estimated_remaining_seconds']:
-                print(f"Estimated remaining: {status['estimated_remaining_seconds']}s")
-            
-            print(f"\nLast updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+            status = control('GET', '/status', service.get_status)
+            print_status_screen(status, args.show_errors)
             
             if status['status'] not in ['running']:
                 print("Scraping is not running. Exiting monitor.")
@@ -196,6 +292,7 @@ Examples:
   python cli.py status --pretty
   python cli.py latest --limit 5
   python cli.py monitor --interval 3
+  python cli.py migrate --status
         """
     )
     
@@ -213,9 +310,16 @@ Examples:
     
     # Status command
     status_parser = subparsers.add_parser('status', help='Get scraping status')
+    status_parser.add_argument('--run-id', help='Show a specific run instead of the latest one')
     status_parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
     status_parser.set_defaults(func=status_command)
     
+    # Runs command
+    runs_parser = subparsers.add_parser('runs', help='List recent scraping runs')
+    runs_parser.add_argument('--limit', type=int, default=20, help='Number of runs to list')
+    runs_parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
+    runs_parser.set_defaults(func=runs_command)
+    
     # Result command
     result_parser = subparsers.add_parser('result', help='Get last scraping result')
     result_parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
@@ -240,9 +344,16 @@ Examples:
     latest_parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
     latest_parser.set_defaults(func=latest_command)
     
+    # Migrate command
+    migrate_parser = subparsers.add_parser('migrate', help='Apply pending database schema migrations')
+    migrate_parser.add_argument('--status', action='store_true', help='Show schema version and pending migrations only')
+    migrate_parser.add_argument('--pretty', action='store_true', help='Pretty print JSON')
+    migrate_parser.set_defaults(func=migrate_command)
+    
     # Monitor command
     monitor_parser = subparsers.add_parser('monitor', help='Monitor scraping progress')
-    monitor_parser.add_argument('--interval', type=int, default=2, help='Update interval in seconds')
+    monitor_parser.add_argument('--interval', type=int, default=2, help='Update interval in seconds (when polling)')
+    monitor_parser.add_argument('--poll', action='store_true', help='Poll status instead of following the daemon event stream')
     monitor_parser.add_argument('--show-errors', action='store_true', help='Show error details')
     monitor_parser.set_defaults(func=monitor_command)
     
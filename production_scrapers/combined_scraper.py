@@ -8,7 +8,7 @@ import sys
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 from dataclasses import dataclass
 import concurrent.futures
 import threading
@@ -18,12 +18,18 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+from cancellation import CancellationToken
 from gktoday_scraper import EnhancedGKTodayScraper, ScrapingResult as GKTodayResult
 from drishti_scraper import EnhancedDrishtiScraperFixed, ScrapingResult as DrishtiResult
+from pipeline import format_metrics
+from progress_events import ProgressEvent
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Each source is cancelled if it runs longer than this many seconds
+SOURCE_TIMEOUT = float(os.getenv('SCRAPER_SOURCE_TIMEOUT', '300'))
+
 @dataclass
 class CombinedScrapingResult:
     """Result of combined scraping operation"""
@@ -51,6 +57,8 @@ class CombinedScrapingResult:
             lines.append(f"  Articles Scraped: {self.gktoday_result.articles_scraped}")
             lines.append(f"  Articles Skipped: {self.gktoday_result.articles_skipped}")
             lines.append(f"  Runtime: {self.gktoday_result.runtime_seconds:.2f}s")
+            if self.gktoday_result.stage_metrics:
+                lines.append(f"  Stages: {format_metrics(self.gktoday_result.stage_metrics)}")
             if self.gktoday_result.errors:
                 lines.append(f"  Errors: {len(self.gktoday_result.errors)}")
         
@@ -60,6 +68,8 @@ class CombinedScrapingResult:
             lines.append(f"  Articles Scraped: {self.drishti_result.articles_scraped}")
             lines.append(f"  Articles Skipped: {self.drishti_result.articles_skipped}")
             lines.append(f"  Runtime: {self.drishti_result.runtime_seconds:.2f}s")
+            if self.drishti_result.stage_metrics:
+                lines.append(f"  Stages: {format_metrics(self.drishti_result.stage_metrics)}")
             if self.drishti_result.errors:
                 lines.append(f"  Errors: {len(self.drishti_result.errors)}")
         
@@ -79,12 +89,34 @@ class CombinedScraper:
         self.gktoday_scraper = None
         self.drishti_scraper = None
         
-    def _run_gktoday_scraper(self, max_pages: int, max_articles: int) -> GKTodayResult:
+    @staticmethod
+    def _source_progress(source: str, progress_callback: Optional[Callable]) -> Optional[Callable]:
+        """Bind a combined progress callback to one source"""
+        if progress_callback is None:
+            return None
+        return lambda snapshot: progress_callback(source, 'running', snapshot)
+    
+    def _run_gktoday_scraper(
+        self,
+        max_pages: int,
+        max_articles: int,
+        progress_callback: Optional[Callable] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        event_callback: Optional[Callable[[ProgressEvent], None]] = None
+    ) -> GKTodayResult:
         """Run GKToday scraper in a separate thread"""
+        # Child token: SOURCE_TIMEOUT stops only this source, cancel_token stops every source
+        token = CancellationToken(parent=cancel_token, timeout=SOURCE_TIMEOUT)
         try:
             logger.info("Starting GKToday scraper...")
             scraper = EnhancedGKTodayScraper()
-            result = scraper.sync_articles(max_pages=max_pages, max_articles=max_articles)
+            result = scraper.sync_articles(
+                max_pages=max_pages,
+                max_articles=max_articles,
+                progress_callback=self._source_progress('gktoday', progress_callback),
+                cancel_token=token,
+                event_callback=event_callback
+            )
             scraper.close()
             logger.info(f"GKToday scraper completed: {result.articles_scraped} articles")
             return result
@@ -97,13 +129,30 @@ class CombinedScraper:
                 errors=[f"GKToday scraper failed: {e}"],
                 runtime_seconds=0
             )
+        finally:
+            token.close()
     
-    def _run_drishti_scraper(self, max_days: int, max_articles: int) -> DrishtiResult:
+    def _run_drishti_scraper(
+        self,
+        max_days: int,
+        max_articles: int,
+        progress_callback: Optional[Callable] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        event_callback: Optional[Callable[[ProgressEvent], None]] = None
+    ) -> DrishtiResult:
         """Run DrishtiIAS scraper in a separate thread"""
+        # Child token: SOURCE_TIMEOUT stops only this source, cancel_token stops every source
+        token = CancellationToken(parent=cancel_token, timeout=SOURCE_TIMEOUT)
         try:
             logger.info("Starting DrishtiIAS scraper...")
             scraper = EnhancedDrishtiScraperFixed()
-            result = scraper.sync_articles(max_days=max_days, max_articles=max_articles)
+            result = scraper.sync_articles(
+                max_days=max_days,
+                max_articles=max_articles,
+                progress_callback=self._source_progress('drishti', progress_callback),
+                cancel_token=token,
+                event_callback=event_callback
+            )
             scraper.close()
             logger.info(f"DrishtiIAS scraper completed: {result.articles_scraped} articles")
             return result
@@ -116,6 +165,8 @@ class CombinedScraper:
                 errors=[f"DrishtiIAS scraper failed: {e}"],
                 runtime_seconds=0
             )
+        finally:
+            token.close()
     
     def sync_articles(
         self,
@@ -123,7 +174,10 @@ class CombinedScraper:
         max_days: int = 3,
         max_articles_per_source: int = 50,
         max_pages_gktoday: int = 10,
-        parallel: bool = True
+        parallel: bool = True,
+        progress_callback: Optional[Callable[[str, str, Optional[GKTodayResult]], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        event_callback: Optional[Callable[[ProgressEvent], None]] = None
     ) -> CombinedScrapingResult:
         """
         Sync articles from specified sources
@@ -134,6 +188,14 @@ class CombinedScraper:
             max_articles_per_source: Maximum articles per source
             max_pages_gktoday: Maximum pages for GKToday
             parallel: Whether to run scrapers in parallel
+            progress_callback: Optional callback(source, status, result) called when a
+                source starts ('running', None), after each page/day ('running', running
+                totals) and when it finishes ('completed', 'failed' or 'cancelled', final result)
+            cancel_token: Optional token; cancelling it stops every source at its next
+                page/day or pending fetch. Each source also gets its own child token
+                that is cancelled once it has run for SOURCE_TIMEOUT seconds.
+            event_callback: Optional callback receiving each scraper's ProgressEvents
+                (page discovered, URL resolved, fetched, parsed, written, skipped, error)
         
         Returns:
             CombinedScrapingResult with results from all sources
@@ -141,6 +203,10 @@ class CombinedScraper:
         start_time = time.time()
         logger.info(f"Starting combined scraper for sources: {sources}")
         
+        if progress_callback:
+            for source in sources:
+                progress_callback(source, 'running', None)
+        
         gktoday_result = None
         drishti_result = None
         
@@ -155,41 +221,30 @@ class CombinedScraper:
                     futures['gktoday'] = executor.submit(
                         self._run_gktoday_scraper,
                         max_pages_gktoday,
-                        max_articles_per_source
+                        max_articles_per_source,
+                        progress_callback,
+                        cancel_token,
+                        event_callback
                     )
                 
                 if 'drishti' in sources:
                     futures['drishti'] = executor.submit(
                         self._run_drishti_scraper,
                         max_days,
-                        max_articles_per_source
+                        max_articles_per_source,
+                        progress_callback,
+                        cancel_token,
+                        event_callback
                     )
                 
-                # Collect results
+                # Collect results; timed-out or cancelled scrapers stop on their own
+                # at the next page or fetch, so no worker thread is abandoned
                 for source, future in futures.items():
                     try:
                         if source == 'gktoday':
-                            gktoday_result = future.result(timeout=300)  # 5 minute timeout
+                            gktoday_result = future.result()
                         elif source == 'drishti':
-                            drishti_result = future.result(timeout=300)  # 5 minute timeout
-                    except concurrent.futures.TimeoutError:
-                        logger.error(f"{source} scraper timed out")
-                        if source == 'gktoday':
-                            gktoday_result = GKTodayResult(
-                                success=False,
-                                articles_scraped=0,
-                                articles_skipped=0,
-                                errors=[f"{source} scraper timed out"],
-                                runtime_seconds=300
-                            )
-                        elif source == 'drishti':
-                            drishti_result = DrishtiResult(
-                                success=False,
-                                articles_scraped=0,
-                                articles_skipped=0,
-                                errors=[f"{source} scraper timed out"],
-                                runtime_seconds=300
-                            )
+                            drishti_result = future.result()
                     except Exception as e:
                         logger.error(f"Error getting result from {source}: {e}")
         
@@ -200,15 +255,32 @@ class CombinedScraper:
             if 'gktoday' in sources:
                 gktoday_result = self._run_gktoday_scraper(
                     max_pages_gktoday,
-                    max_articles_per_source
+                    max_articles_per_source,
+                    progress_callback,
+                    cancel_token,
+                    event_callback
                 )
             
             if 'drishti' in sources:
                 drishti_result = self._run_drishti_scraper(
                     max_days,
-                    max_articles_per_source
+                    max_articles_per_source,
+                    progress_callback,
+                    cancel_token,
+                    event_callback
                 )
         
+        if progress_callback:
+            for source, source_result in (('gktoday', gktoday_result), ('drishti', drishti_result)):
+                if source in sources and source_result is not None:
+                    if source_result.success:
+                        status = 'completed'
+                    elif cancel_token and cancel_token.cancelled:
+                        status = 'cancelled'
+                    else:
+                        status = 'failed'
+                    progress_callback(source, status, source_result)
+        
         # Calculate combined results
         total_articles_scraped = 0
         total_articles_skipped = 0
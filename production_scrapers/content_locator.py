@@ -0,0 +1,45 @@
+"""
+Main content detection for article pages without a known content container
+Picks the element with the most text beneath it, the choice
+max(soup.find_all('div'), key=lambda x: len(x.get_text())) makes, but
+computes every subtree's text length bottom-up in one pass instead of
+re-joining the text of each nested div, which is quadratic in DOM depth
+"""
+
+from typing import Dict, Optional
+
+from bs4 import CData, NavigableString, Tag
+
+# String types get_text() includes (exact types: comments, scripts and styles are skipped)
+TEXT_TYPES = (NavigableString, CData)
+
+def text_lengths(root: Tag) -> Dict[int, int]:
+    """
+    len(tag.get_text()) for root and every tag under it, keyed by id(tag)
+    
+    <script>, <style> and <template> get 0 rather than the length of the
+    code get_text() returns for them alone; that code doesn't count towards
+    their ancestors' text either way.
+    """
+    lengths = {id(root): 0}
+    nodes = list(root.descendants)
+    for node in nodes:
+        if isinstance(node, Tag):
+            lengths[id(node)] = 0
+    # Reversed document order visits every node after all of its descendants
+    for node in reversed(nodes):
+        if isinstance(node, Tag):
+            lengths[id(node.parent)] += lengths[id(node)]
+        elif type(node) in TEXT_TYPES:
+            lengths[id(node.parent)] += len(node)
+    return lengths
+
+def largest_text_container(root: Tag, name: str = 'div') -> Optional[Tag]:
+    """The name tag under root with the most text, the first one on ties (None if there is none)"""
+    lengths = text_lengths(root)
+    best = None
+    best_length = -1
+    for tag in root.find_all(name):
+        if lengths[id(tag)] > best_length:
+            best, best_length = tag, lengths[id(tag)]
+    return best
@@ -0,0 +1,124 @@
+"""
+Date extraction and parsing shared by the GKToday and DrishtiIAS scrapers
+Patterns are compiled once at import and text without a four-digit year is
+rejected before any of them runs. Parsing goes through an LRU cache keyed on
+the whitespace-normalized string, so the handful of distinct dates on a site
+("29 Jan, 2025", "May 5, 2025", ...) are parsed once per process; the common
+month-name and ISO forms are parsed directly by regex, for any year, before
+falling back to dateutil
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Optional
+
+from dateutil import parser as date_parser
+
+MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+          'August', 'September', 'October', 'November', 'December']
+MONTH_NUMBERS = {name.lower(): number for number, name in enumerate(MONTHS, 1)}
+MONTH_NUMBERS.update({name[:3].lower(): number for name, number in list(MONTH_NUMBERS.items())})
+MONTH_NUMBERS['sept'] = 9
+
+FULL_MONTH = '|'.join(MONTHS)
+SHORT_MONTH = '|'.join(name[:3] for name in MONTHS)
+# Month names dateutil accepts, longest first so the alternation doesn't stop at a prefix
+MONTH_NAME = '|'.join(sorted(MONTH_NUMBERS, key=len, reverse=True))
+
+# Dates in page text, in the order they are preferred when a text has several
+# kinds: (regex, whether the month is a 'name' or a 'number')
+TEXT_DATE_PATTERNS = [
+    # Standard formats: "29 January, 2025" or "January 29, 2025"
+    (rf'(?P<day>\d{{1,2}})\s+(?P<month>{SHORT_MONTH})[a-z]*,?\s+(?P<year>\d{{4}})', 'name'),
+    (rf'(?P<month>{SHORT_MONTH})[a-z]*\s+(?P<day>\d{{1,2}}),?\s+(?P<year>\d{{4}})', 'name'),
+    # Full month names: "29 January 2025" or "January 29 2025"
+    (rf'(?P<day>\d{{1,2}})\s+(?P<month>{FULL_MONTH}),?\s+(?P<year>\d{{4}})', 'name'),
+    (rf'(?P<month>{FULL_MONTH})\s+(?P<day>\d{{1,2}}),?\s+(?P<year>\d{{4}})', 'name'),
+    # Date with ordinal: "29th January, 2025"
+    (rf'(?P<day>\d{{1,2}})(?:st|nd|rd|th)\s+(?P<month>{SHORT_MONTH})[a-z]*,?\s+(?P<year>\d{{4}})', 'name'),
+    (rf'(?P<day>\d{{1,2}})(?:st|nd|rd|th)\s+(?P<month>{FULL_MONTH}),?\s+(?P<year>\d{{4}})', 'name'),
+    # Numeric formats: "29/01/2025" (DD/MM, the Indian order), "2025-01-29", "29-01-2025"
+    (r'(?P<day>\d{1,2})/(?P<month>\d{1,2})/(?P<year>\d{4})', 'number'),
+    (r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})', 'number'),
+    (r'(?P<day>\d{1,2})-(?P<month>\d{1,2})-(?P<year>\d{4})', 'number'),
+]
+
+TEXT_DATE_RES = [(re.compile(pattern, re.IGNORECASE), kind) for pattern, kind in TEXT_DATE_PATTERNS]
+
+# Every date above contains a four-digit year
+YEAR_RE = re.compile(r'\d{4}')
+
+# GKToday listing dates: "May 5, 2025" or "May 5 2025"
+LISTING_DATE_RE = re.compile(rf'(?P<month_day>(?:{FULL_MONTH})\s+\d{{1,2}}),?\s+(?P<year>\d{{4}})\b')
+
+# Whole-string forms parsed without dateutil
+NAME_FIRST_RE = re.compile(rf'(?P<month>{MONTH_NAME})\.?\s+(?P<day>\d{{1,2}}),?\s+(?P<year>\d{{4}})', re.IGNORECASE)
+DAY_FIRST_RE = re.compile(rf'(?P<day>\d{{1,2}})\s+(?P<month>{MONTH_NAME})\.?,?\s+(?P<year>\d{{4}})', re.IGNORECASE)
+ISO_DATE_RE = re.compile(r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})')
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+def extract_date(text: str) -> Optional[str]:
+    """
+    First date in text, by pattern preference, as "Mon D, YYYY" (month as
+    written) for month-name dates and "Month DD, YYYY" for numeric ones
+    """
+    if not text:
+        return None
+
+    # Most page text has no date at all
+    if not YEAR_RE.search(text):
+        return None
+
+    for regex, kind in TEXT_DATE_RES:
+        match = regex.search(text)
+        if not match:
+            continue
+        day, month, year = match.group('day', 'month', 'year')
+        if kind == 'name':
+            return f"{month} {day}, {year}"
+        try:
+            return datetime(int(year), int(month), int(day)).strftime('%B %d, %Y')
+        except ValueError:
+            continue
+    return None
+
+def find_listing_date(text: str) -> Optional[str]:
+    """First "Month D, YYYY" date in a listing item's text, with the comma added if missing"""
+    match = LISTING_DATE_RE.search(text)
+    if not match:
+        return None
+    if ',' in match.group(0):
+        return match.group(0)
+    return f"{match.group('month_day')}, {match.group('year')}"
+
+def parse_date(date_string: str, dayfirst: bool = False) -> Optional[datetime]:
+    """
+    Parse a date string the way dateutil does (None if it can't be parsed)
+
+    dayfirst reads "05/01/2025" as 5 January; ISO "2025-01-05" is always
+    year-month-day (dateutil would swap it too).
+    """
+    if not date_string:
+        return None
+    normalized = WHITESPACE_RE.sub(' ', date_string).strip()
+    # dateutil fills missing fields from today, so cached results are per day
+    return _parse_normalized(normalized, dayfirst, date.today())
+
+@lru_cache(maxsize=4096)
+def _parse_normalized(normalized: str, dayfirst: bool, today: date) -> Optional[datetime]:
+    """parse_date for a whitespace-normalized string"""
+    for regex in (NAME_FIRST_RE, DAY_FIRST_RE, ISO_DATE_RE):
+        match = regex.fullmatch(normalized)
+        if match:
+            month = match.group('month')
+            month = int(month) if month.isdigit() else MONTH_NUMBERS[month.lower()]
+            try:
+                return datetime(int(match.group('year')), month, int(match.group('day')))
+            except ValueError:
+                break
+    try:
+        return date_parser.parse(normalized, dayfirst=dayfirst)
+    except (ValueError, OverflowError):
+        return None
@@ -5,7 +5,6 @@ Database management script for wiping and setting up the articles database
 
 import os
 import sys
-import psycopg2
 from psycopg2.extras import DictCursor
 from dotenv import load_dotenv
 
@@ -15,12 +14,17 @@ root_dir = os.path.dirname(current_dir)
 dotenv_path = os.path.join(root_dir, '.env.local')
 load_dotenv(dotenv_path)
 
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from db_pool import get_pool
+from migrations import migrate, reset_schema_cache
+
 def get_db_connection():
-    """Get database connection"""
-    database_url = os.getenv('DATABASE_URL')
-    if not database_url:
+    """Borrow a pooled database connection (use as a context manager)"""
+    if not os.getenv('DATABASE_URL'):
         raise ValueError("DATABASE_URL not found in .env.local")
-    return psycopg2.connect(database_url)
+    return get_pool().connection()
 
 def list_tables():
     """List all tables in the database"""
@@ -89,6 +93,7 @@ def wipe_database():
                 cursor.execute("SET session_replication_role = 'origin';")
                 
                 conn.commit()
+                reset_schema_cache()
                 print("✅ Database wiped successfully")
                 return True
                 
@@ -97,36 +102,16 @@ def wipe_database():
         return False
 
 def create_articles_table():
-    """Create the articles table with proper schema"""
+    """Create the articles table (and the rest of the schema) by applying migrations"""
     print("🏗️  Creating articles table...")
     
     try:
         with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS articles (
-                        id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                        title TEXT NOT NULL,
-                        content TEXT NOT NULL,
-                        source TEXT NOT NULL,
-                        url TEXT UNIQUE NOT NULL,
-                        published_date DATE,
-                        importance TEXT,
-                        tags TEXT[],
-                        created_at TIMESTAMP DEFAULT NOW(),
-                        updated_at TIMESTAMP DEFAULT NOW()
-                    )
-                """)
-                
-                # Create indexes for better performance
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_published_date ON articles(published_date)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_articles_url ON articles(url)")
-                
-                conn.commit()
-                print("✅ Articles table created successfully")
-                return True
+            applied = migrate(conn)
+            for migration in applied:
+                print(f"  📄 Applied migration {migration.version:04d}_{migration.name}")
+            print("✅ Articles table created successfully")
+            return True
                 
     except Exception as e:
         print(f"❌ Error creating articles table: {e}")
@@ -0,0 +1,212 @@
+"""
+Process-wide Postgres connection pool shared by the production scrapers
+Keeps warm connections to DATABASE_URL so scrapers, the service and the
+maintenance scripts stop paying the TLS/auth handshake on every connect
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+class ConnectionPool:
+    """
+    Thread-safe, bounded pool of psycopg2 connections
+
+    Connections are opened lazily up to max_size; callers block (up to
+    timeout seconds) when all of them are checked out. Idle connections
+    are health-checked with SELECT 1 before being handed out once they
+    have been idle for health_check_after seconds, and closed once they
+    have been idle for longer than idle_timeout.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        idle_timeout: Optional[float] = None,
+        health_check_after: Optional[float] = None
+    ):
+        self.dsn = dsn
+        self.max_size = max_size or int(os.getenv('SCRAPER_DB_POOL_SIZE', '5'))
+        self.timeout = timeout if timeout is not None else float(os.getenv('SCRAPER_DB_POOL_TIMEOUT', '30'))
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None
+            else float(os.getenv('SCRAPER_DB_POOL_IDLE_TIMEOUT', '300'))
+        )
+        self.health_check_after = (
+            health_check_after if health_check_after is not None
+            else float(os.getenv('SCRAPER_DB_HEALTH_CHECK_AFTER', '30'))
+        )
+
+        self._idle: List[Tuple[extensions.connection, float]] = []  # (conn, returned_at), most recent last
+        self._in_use: Dict[int, extensions.connection] = {}
+        self._opening = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _connect(self) -> extensions.connection:
+        """Open a new server connection"""
+        conn = psycopg2.connect(self.dsn)
+        logger.debug("Opened new database connection")
+        return conn
+
+    @staticmethod
+    def _discard(conn: extensions.connection):
+        """Close a connection, ignoring errors from dead sockets"""
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_healthy(conn: extensions.connection) -> bool:
+        """Round-trip a trivial query to detect connections the server dropped"""
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding unhealthy database connection: {e}")
+            return False
+
+    def _take_idle(self) -> Optional[Tuple[extensions.connection, float]]:
+        """Pop the most recently used idle connection, recycling stale ones (lock held)"""
+        now = time.monotonic()
+        # Oldest connections sit at the front; drop them once past idle_timeout
+        while self._idle and now - self._idle[0][1] > self.idle_timeout:
+            conn, _ = self._idle.pop(0)
+            self._discard(conn)
+            logger.debug("Recycled idle database connection")
+        while self._idle:
+            conn, returned_at = self._idle.pop()
+            if not conn.closed:
+                return conn, returned_at
+            self._discard(conn)
+        return None
+
+    def getconn(self, timeout: Optional[float] = None) -> extensions.connection:
+        """Check a connection out of the pool, opening one if below max_size"""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolError("connection pool is closed")
+                    idle = self._take_idle()
+                    if idle is not None:
+                        conn, returned_at = idle
+                        self._in_use[id(conn)] = conn
+                        break
+                    if len(self._in_use) + self._opening < self.max_size:
+                        self._opening += 1
+                        conn, returned_at = None, None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolError(f"timed out after {timeout}s waiting for a database connection")
+                    self._cond.wait(remaining)
+
+            if conn is None:
+                # Connect outside the lock so slow handshakes don't serialize callers
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._opening -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._opening -= 1
+                    self._in_use[id(conn)] = conn
+                return conn
+
+            if time.monotonic() - returned_at < self.health_check_after or self._is_healthy(conn):
+                return conn
+
+            with self._cond:
+                self._in_use.pop(id(conn), None)
+                self._cond.notify()
+            self._discard(conn)
+
+    def putconn(self, conn: extensions.connection, close: bool = False):
+        """Return a connection to the pool, rolling back any open transaction"""
+        with self._cond:
+            if self._in_use.pop(id(conn), None) is None:
+                raise PoolError("trying to put a connection that was not checked out from this pool")
+            self._cond.notify()
+
+        if not close and not conn.closed:
+            try:
+                if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception as e:
+                logger.warning(f"Discarding database connection after failed rollback: {e}")
+                close = True
+        else:
+            close = True
+
+        with self._cond:
+            if close or self._closed:
+                self._discard(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for the duration of a with block
+
+        Commits on success and rolls back on error, like psycopg2's own
+        connection context manager, then returns the connection to the pool.
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self.putconn(conn)
+
+    def closeall(self):
+        """Close idle connections and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._discard(conn)
+        logger.debug("Database connection pool closed")
+
+# Process-wide pool so every scraper and the service share warm connections
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> ConnectionPool:
+    """Get the global connection pool for DATABASE_URL"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            database_url = os.getenv('DATABASE_URL')
+            if not database_url:
+                raise ValueError("DATABASE_URL environment variable is not set")
+            _pool = ConnectionPool(database_url)
+            atexit.register(_pool.closeall)
+        return _pool
@@ -5,10 +5,10 @@ Handles multiple articles per day correctly
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from datetime import datetime, timedelta
 from dateutil import parser
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 import logging
 import os
 import psycopg2
@@ -17,8 +17,8 @@ import uuid
 import re
 import time
 import sys
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import Callable, List, Dict, Set, Tuple, Optional, Iterable
+from dataclasses import dataclass, field
 
 # Load environment variables from parent directory
 try:
@@ -30,9 +30,44 @@ except ImportError:
     # Handle case where python-dotenv is not installed
     pass
 
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import article_writer
+from cancellation import CancellationToken, ScrapeCancelled
+from content_locator import TEXT_TYPES
+from date_extraction import extract_date, parse_date
+from db_pool import get_pool
+from fetcher import get_fetch_engine
+from migrations import ensure_schema
+from parse_pool import get_parse_pool
+from parser_backend import TagFilter, make_soup, resolve_backend
+from pipeline import FETCH_WORKERS, PARSE_WORKERS, Pipeline, Stage, format_metrics
+import progress_events
+from progress_events import ProgressEvent
+from rate_limiter import get_scheduler, source_rate_limit
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Article elements extract_content_sections leaves out, and the tags it reads
+SECTION_SKIP_CLASSES = ('next-post', 'tags-new', 'starRating', 'actions')
+SECTION_HEADINGS = ('h2', 'h3', 'h4')
+LIST_TAGS = ('ul', 'ol')
+
+# Headings whose first link names an article, and the content areas whose
+# article links are listed too (a detail-content div before an article-detail one)
+DAY_PAGE_HEADINGS = ('h1', 'h2', 'h3')
+CONTENT_AREA_CLASSES = ('detail-content', 'article-detail')
+
+# Parts of a day page extract_article_links reads: headings and the content area
+DAY_PAGE_FILTER = TagFilter(names=DAY_PAGE_HEADINGS, class_substrings=CONTENT_AREA_CLASSES)
+
+# Take articles a day page renders in full from the day page instead of fetching them (0 = always fetch)
+DAY_PAGE_ARTICLES = os.getenv('SCRAPER_DRISHTI_DAY_PAGE_ARTICLES', '1') != '0'
+
 @dataclass
 class ScrapingResult:
     """Result of a scraping operation"""
@@ -41,171 +76,51 @@ class ScrapingResult:
     articles_skipped: int
     errors: List[str]
     runtime_seconds: float
+    stage_metrics: Dict[str, Dict] = field(default_factory=dict)  # pipeline stage -> StageMetrics.to_dict()
 
 class EnhancedDrishtiScraperFixed:
     """Production-ready DrishtiIAS scraper with smart sync capabilities"""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        self.fetcher = get_fetch_engine()
+        self.cancel_token: Optional[CancellationToken] = None
+        self.event_callback: Optional[Callable[[ProgressEvent], None]] = None
         self.base_url = "https://www.drishtiias.com"
         self.conn = None
         self.cursor = None
-        self.rate_limit_delay = int(os.getenv('SCRAPER_RATE_LIMIT', '2'))
+        self.html_parser = resolve_backend()
+        self.rate_limit_delay = source_rate_limit('drishti')
+        get_scheduler().configure(urlparse(self.base_url).netloc, self.rate_limit_delay)
         
     def init_database(self) -> bool:
         """Initialize database connection"""
         try:
-            database_url = os.getenv('DATABASE_URL')
-            if not database_url:
-                raise ValueError("DATABASE_URL not found in environment variables")
-            
-            self.conn = psycopg2.connect(database_url)
+            self.conn = get_pool().getconn()
             self.cursor = self.conn.cursor(cursor_factory=DictCursor)
             register_uuid()
             
-            self._ensure_tables()
+            ensure_schema(self.conn)
             logger.info("Database connection established successfully")
             return True
             
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
+            self.close()
             return False
     
-    def _ensure_tables(self):
-        """Ensure all required tables exist"""
-        try:
-            # Check if main table exists
-            self.cursor.execute("""
-                SELECT EXISTS(
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'gk_today_content'
-                )
-            """)
-            
-            table_exists = self.cursor.fetchone()[0]
-            
-            # If table exists, ensure it has all required columns
-            if table_exists:
-                self._ensure_columns()
-            
-            self.cursor.execute("""
-                SELECT EXISTS(
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'gk_today_content'
-                )
-            """)
-            
-            if not self.cursor.fetchone()[0]:
-                logger.info("Creating database tables...")
-                self._create_tables()
-            else:
-                logger.debug("Database tables already exist")
-                
-        except Exception as e:
-            logger.error(f"Error checking/creating tables: {e}")
-            raise
-    
-    def _create_tables(self):
-        """Create all required tables"""
-        tables_sql = [
-            """
-            CREATE TABLE IF NOT EXISTS gk_today_content (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                title TEXT NOT NULL,
-                url TEXT UNIQUE NOT NULL,
-                image_url TEXT,
-                published_date DATE,
-                source_name TEXT DEFAULT 'DrishtiIAS',
-                scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                intro TEXT,
-                sequence_order INTEGER,
-                importance_rating TEXT,
-                date TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS sections (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                article_id UUID REFERENCES gk_today_content(id) ON DELETE CASCADE,
-                heading TEXT,
-                content TEXT,
-                type TEXT CHECK (type IN ('paragraph', 'list')),
-                sequence_order INTEGER
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS section_bullets (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                section_id UUID REFERENCES sections(id) ON DELETE CASCADE,
-                content TEXT NOT NULL,
-                bullet_order INTEGER
-            )
-            """
-        ]
-        
-        for sql in tables_sql:
-            self.cursor.execute(sql)
-        
-        self.conn.commit()
-        logger.info("Database tables created successfully")
-    
-    def _ensure_columns(self):
-        """Ensure all required columns exist in gk_today_content table"""
-        required_columns = [
-            ('date', 'TEXT'),
-            ('importance_rating', 'TEXT'),
-            ('image_url', 'TEXT'),
-            ('intro', 'TEXT'),
-            ('sequence_order', 'INTEGER'),
-            ('scraped_at', 'TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP')
-        ]
-        
-        for column_name, column_type in required_columns:
-            try:
-                self.cursor.execute(f"""
-                    SELECT column_name 
-                    FROM information_schema.columns 
-                    WHERE table_name = 'gk_today_content' AND column_name = %s
-                """, (column_name,))
-                
-                if not self.cursor.fetchone():
-                    logger.info(f"Adding missing column: {column_name}")
-                    self.cursor.execute(f"ALTER TABLE gk_today_content ADD COLUMN {column_name} {column_type}")
-                    
-            except Exception as e:
-                logger.warning(f"Could not add column {column_name}: {e}")
-        
-        self.conn.commit()
-    
     def get_date_url(self, days_ago: int = 0) -> str:
         """Generate URL for a specific date"""
         date = datetime.now() - timedelta(days=days_ago)
         return f"https://www.drishtiias.com/current-affairs-news-analysis-editorials/news-analysis/{date.strftime('%d-%m-%Y')}"
     
+    def emit(self, event_type: str, **fields):
+        """Report a progress event to the event callback, if any"""
+        if self.event_callback:
+            self.event_callback(ProgressEvent(event_type, source='drishti', **fields))
+    
     def fetch_page(self, url: str, max_retries: int = 3) -> Optional[requests.Response]:
         """Fetch webpage with retry logic"""
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"Fetching {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                logger.warning(f"Fetch attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-        return None
+        return self.fetcher.fetch_sync(url, retries=max_retries, token=self.cancel_token)
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
@@ -217,67 +132,7 @@ class EnhancedDrishtiScraperFixed:
     
     def extract_date(self, text: str) -> Optional[str]:
         """Extract and parse date from text with enhanced patterns"""
-        if not text:
-            return None
-        
-        # Enhanced date patterns for DrishtiIAS
-        date_patterns = [
-            # Standard formats: "29 January, 2025" or "January 29, 2025"
-            r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*,?\s+(\d{4})',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),?\s+(\d{4})',
-            
-            # Full month names: "29 January 2025" or "January 29 2025"
-            r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December),?\s+(\d{4})',
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})',
-            
-            # Date with ordinal: "29th January, 2025"
-            r'(\d{1,2})(st|nd|rd|th)\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*,?\s+(\d{4})',
-            r'(\d{1,2})(st|nd|rd|th)\s+(January|February|March|April|May|June|July|August|September|October|November|December),?\s+(\d{4})',
-            
-            # Numeric formats: "29/01/2025", "01/29/2025", "2025-01-29"
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',
-            r'(\d{1,2})-(\d{1,2})-(\d{4})'
-        ]
-        
-        for i, pattern in enumerate(date_patterns):
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                
-                try:
-                    if i < 4:  # Standard and full month name patterns
-                        if pattern.startswith(r'(\d'):  # Day first
-                            day, month, year = groups[0], groups[1], groups[2]
-                        else:  # Month first
-                            month, day, year = groups[0], groups[1], groups[2]
-                        return f"{month} {day}, {year}"
-                    
-                    elif i < 6:  # Ordinal patterns
-                        day, ordinal, month, year = groups[0], groups[1], groups[2], groups[3]
-                        return f"{month} {day}, {year}"
-                    
-                    else:  # Numeric patterns
-                        if i == 6:  # DD/MM/YYYY or MM/DD/YYYY
-                            part1, part2, year = groups
-                            # Assume DD/MM/YYYY for DrishtiIAS (Indian format)
-                            day, month = part1, part2
-                        elif i == 7:  # YYYY-MM-DD
-                            year, month, day = groups
-                        else:  # DD-MM-YYYY
-                            day, month, year = groups
-                        
-                        # Convert to readable format
-                        try:
-                            date_obj = datetime(int(year), int(month), int(day))
-                            return date_obj.strftime('%B %d, %Y')
-                        except ValueError:
-                            continue
-                            
-                except (ValueError, IndexError):
-                    continue
-        
-        return None
+        return extract_date(text)
     
     def extract_metadata(self, soup: BeautifulSoup) -> Dict:
         """Extract article metadata with enhanced date extraction"""
@@ -316,13 +171,10 @@ class EnhancedDrishtiScraperFixed:
                 meta_date = soup.find('meta', {'name': 'publish-date'})
             
             if meta_date and meta_date.get('content'):
-                try:
-                    from dateutil import parser as date_parser
-                    parsed_date = date_parser.parse(meta_date['content'])
+                parsed_date = parse_date(meta_date['content'])
+                if parsed_date:
                     metadata['date'] = parsed_date.strftime('%B %d, %Y')
                     date_found = True
-                except:
-                    pass
         
         # Strategy 3: Look for date patterns in the page text
         if not date_found:
@@ -386,77 +238,126 @@ class EnhancedDrishtiScraperFixed:
     
     def extract_content_sections(self, soup: BeautifulSoup) -> Tuple[str, List[Dict]]:
         """Extract main content sections"""
-        intro = ""
-        sections = []
-        
         # Find the main article content
         article_detail = soup.find('div', class_='article-detail')
         if not article_detail:
             article_detail = soup.find('div', class_='detail-content')
         if not article_detail:
-            return intro, sections
-        
-        # Get the intro paragraph
-        intro_p = article_detail.find('p')
-        if intro_p:
-            intro = self.clean_text(intro_p.get_text())
-        
-        current_section = {"heading": "", "content": "", "bullet_points": []}
+            return "", []
+        return self.extract_article_sections(article_detail)
+    
+    def extract_article_sections(self, article_detail: Tag) -> Tuple[str, List[Dict]]:
+        """
+        Extract the intro and content sections of an article body
+        
+        One walk over the article: headings, paragraphs and lists take their
+        place in document order when they open, and the strings below them are
+        gathered into part buffers until they close. A bullet's own text leaves
+        out nested lists, and the items of a list directly inside a bullet follow
+        it as "  • " sub-points (nested lists are also listed again in their own
+        right, as they always have been).
+        """
+        intro = ""
+        sections = []
         
-        # Process all elements in order
-        for element in article_detail.find_all(['h2', 'h3', 'h4', 'p', 'ul', 'ol']):
-            # Skip navigation and metadata elements
-            if element.get('class') and any(cls in element.get('class', []) for cls in ['next-post', 'tags-new', 'starRating', 'actions']):
+        blocks = []        # ('heading' | 'p', parts) or ('list', [(bullet parts, sub-point parts)])
+        intro_parts = None  # the first paragraph, skipped or not
+        full = []          # buffers taking every string below their element
+        own = []           # (buffer, list depth) of bullets, taking strings outside nested lists
+        list_bullets = {}  # id(list) -> its bullets, for lists that are processed
+        sub_points = {}    # id(li) -> sub-point buffers of a processed bullet
+        list_depth = 0
+        
+        stack = [(child, None) for child in reversed(article_detail.contents)]
+        while stack:
+            node, opened = stack.pop()
+            if opened is not None:
+                opened_full, opened_own = opened
+                del full[len(full) - opened_full:]
+                del own[len(own) - opened_own:]
+                if node.name in LIST_TAGS:
+                    list_depth -= 1
                 continue
             
-            # Handle headings
-            if element.name in ['h2', 'h3', 'h4']:
-                # Save previous section if it has content
-                if current_section["content"] or current_section["bullet_points"]:
-                    sections.append(current_section)
-                
-                # Start new section
-                heading_text = self.clean_text(element.get_text())
-                current_section = {
-                    "heading": heading_text,
-                    "content": "",
-                    "bullet_points": []
-                }
+            if not isinstance(node, Tag):
+                if type(node) in TEXT_TYPES:
+                    for parts in full:
+                        parts.append(node)
+                    for parts, depth in own:
+                        if depth == list_depth:
+                            parts.append(node)
+                continue
             
-            # Handle paragraphs
-            elif element.name == 'p':
-                text = self.clean_text(element.get_text())
-                if text and len(text) > 10:  # Filter out very short paragraphs
-                    if current_section["content"]:
-                        current_section["content"] += " " + text
-                    else:
-                        current_section["content"] = text
+            name = node.name
+            # Skip navigation and metadata elements (their contents are still walked)
+            skip = any(cls in SECTION_SKIP_CLASSES for cls in node.get('class') or [])
+            opened_full = opened_own = 0
+            if name in SECTION_HEADINGS and not skip:
+                parts = []
+                blocks.append(('heading', parts))
+                full.append(parts)
+                opened_full += 1
+            elif name == 'p' and (intro_parts is None or not skip):
+                parts = []
+                if intro_parts is None:
+                    intro_parts = parts
+                if not skip:
+                    blocks.append(('p', parts))
+                full.append(parts)
+                opened_full += 1
+            elif name in LIST_TAGS:
+                list_depth += 1
+                if not skip:
+                    list_bullets[id(node)] = []
+                    blocks.append(('list', list_bullets[id(node)]))
+            elif name == 'li':
+                parent = node.parent
+                bullets = list_bullets.get(id(parent))
+                if bullets is not None:
+                    parts, subs = [], []
+                    bullets.append((parts, subs))
+                    sub_points[id(node)] = subs
+                    own.append((parts, list_depth))
+                    opened_own += 1
+                # Item of a list directly inside a processed bullet
+                subs = sub_points.get(id(parent.parent)) if parent.name in LIST_TAGS and parent.parent is not None else None
+                if subs is not None:
+                    parts = []
+                    subs.append(parts)
+                    full.append(parts)
+                    opened_full += 1
             
-            # Handle lists - EXACT COPY from working legacy scraper
-            elif element.name in ['ul', 'ol']:
-                # Extract list items with proper nesting
-                for li in element.find_all('li', recursive=False):
-                    # Get direct text content (excluding nested lists)
-                    li_clone = li.__copy__()
-                    for nested in li_clone.find_all(['ul', 'ol']):
-                        nested.decompose()
-                    
-                    main_text = self.clean_text(li_clone.get_text())
+            stack.append((node, (opened_full, opened_own)))
+            stack.extend((child, None) for child in reversed(node.contents))
+        
+        if intro_parts is not None:
+            intro = self.clean_text(''.join(intro_parts))
+        
+        heading, content, bullet_points = "", [], []
+        for kind, parts in blocks:
+            if kind == 'heading':
+                # Save previous section if it has content
+                if content or bullet_points:
+                    sections.append({"heading": heading, "content": " ".join(content), "bullet_points": bullet_points})
+                heading, content, bullet_points = self.clean_text(''.join(parts)), [], []
+            elif kind == 'p':
+                text = self.clean_text(''.join(parts))
+                if text and len(text) > 10:  # Filter out very short paragraphs
+                    content.append(text)
+            else:
+                for bullet_parts, sub_parts in parts:
+                    main_text = self.clean_text(''.join(bullet_parts))
                     if main_text and len(main_text) > 5:
-                        current_section["bullet_points"].append(main_text)
-                        
-                        # Handle nested lists as sub-points
-                        nested_lists = li.find_all(['ul', 'ol'], recursive=False)
-                        for nested_list in nested_lists:
-                            for nested_li in nested_list.find_all('li', recursive=False):
-                                nested_text = self.clean_text(nested_li.get_text())
-                                if nested_text and len(nested_text) > 5:
-                                    # Add as indented sub-point
-                                    current_section["bullet_points"].append(f"  • {nested_text}")
+                        bullet_points.append(main_text)
+                        for nested_parts in sub_parts:
+                            nested_text = self.clean_text(''.join(nested_parts))
+                            if nested_text and len(nested_text) > 5:
+                                # Add as indented sub-point
+                                bullet_points.append(f"  • {nested_text}")
         
         # Add the last section
-        if current_section["content"] or current_section["bullet_points"]:
-            sections.append(current_section)
+        if content or bullet_points:
+            sections.append({"heading": heading, "content": " ".join(content), "bullet_points": bullet_points})
         
         return intro, sections
     
@@ -490,105 +391,188 @@ class EnhancedDrishtiScraperFixed:
         return main_image
     
     def extract_article_links(self, soup: BeautifulSoup) -> List[Dict]:
-        """Extract article links from news analysis page"""
+        """
+        Extract article links from news analysis page
+        
+        One walk over the page sorts links by where they sit, in order of
+        precedence: the first link of each <h1 id="dynamic-title">, the first
+        link of each h1/h2/h3 if it is an article link, and the article links
+        in the content area with meaningful text. Each URL is listed once, at
+        its first candidate with a title.
+        """
         if not soup:
             return []
         
-        articles = []
-        
-        # Method 1: Look for h1 tags with id='dynamic-title' containing links
-        for h1 in soup.find_all('h1', id='dynamic-title'):
-            a_tag = h1.find('a')
-            if a_tag and a_tag.get('href'):
-                articles.append({
-                    "title": a_tag.get_text(strip=True),
-                    "link": urljoin(self.base_url, a_tag['href'])
-                })
-        
-        # Method 2: Look for all h1, h2, h3 tags with links (for multiple articles per day)
-        for heading in soup.find_all(['h1', 'h2', 'h3']):
-            a_tag = heading.find('a')
-            if a_tag and a_tag.get('href'):
-                href = a_tag.get('href')
-                # Only include daily-news-analysis or daily-updates links
-                if '/daily-news-analysis/' in href or '/daily-updates/' in href:
-                    articles.append({
-                        "title": a_tag.get_text(strip=True),
-                        "link": urljoin(self.base_url, href)
-                    })
-        
-        # Method 3: Look for links in the main content area
-        content_area = soup.find('div', class_='detail-content') or soup.find('div', class_='article-detail')
-        if content_area:
-            for a_tag in content_area.find_all('a', href=True):
-                href = a_tag.get('href')
-                if '/daily-news-analysis/' in href or '/daily-updates/' in href:
-                    # Make sure it's not a duplicate and has meaningful text
-                    title = a_tag.get_text(strip=True)
-                    if title and len(title) > 10:  # Filter out short/meaningless links
-                        articles.append({
-                            "title": title,
-                            "link": urljoin(self.base_url, href)
-                        })
+        first_links = []     # first <a> under each h1/h2/h3 in page order (None if it has none)
+        dynamic_titles = []  # indexes into first_links of the h1#dynamic-title headings
+        area_links = {}      # content area class -> <a href> tags under the first such div
+        waiting = []         # indexes into first_links of the open headings still without a link
+        open_areas = []      # link lists of the content areas the walk is inside
+        
+        stack = [(child, None) for child in reversed(soup.contents) if isinstance(child, Tag)]
+        while stack:
+            node, opened = stack.pop()
+            if opened is not None:
+                heading_index, opened_areas = opened
+                if waiting and waiting[-1] == heading_index:
+                    waiting.pop()
+                del open_areas[len(open_areas) - opened_areas:]
+                continue
+            
+            name = node.name
+            heading_index = None
+            opened_areas = 0
+            if name == 'a':
+                for index in waiting:
+                    first_links[index] = node
+                waiting.clear()
+                if node.get('href') is not None:
+                    for links in open_areas:
+                        links.append(node)
+            elif name in DAY_PAGE_HEADINGS:
+                heading_index = len(first_links)
+                first_links.append(None)
+                waiting.append(heading_index)
+                if name == 'h1' and node.get('id') == 'dynamic-title':
+                    dynamic_titles.append(heading_index)
+            elif name == 'div':
+                classes = node.get('class') or []
+                for area_class in CONTENT_AREA_CLASSES:
+                    if area_class in classes and area_class not in area_links:
+                        area_links[area_class] = []
+                        open_areas.append(area_links[area_class])
+                        opened_areas += 1
+            
+            stack.append((node, (heading_index, opened_areas)))
+            stack.extend((child, None) for child in reversed(node.contents) if isinstance(child, Tag))
+        
+        # Method 1: h1 tags with id='dynamic-title' containing links
+        candidates = [(first_links[index], 0) for index in dynamic_titles]
+        
+        # Method 2: h1, h2, h3 tags with links (for multiple articles per day),
+        # only daily-news-analysis or daily-updates links
+        candidates += [(a_tag, 0) for a_tag in first_links if a_tag and self.is_article_href(a_tag.get('href'))]
+        
+        # Method 3: links in the main content area, filtering out short/meaningless links
+        content_area = next((area_links[area_class] for area_class in CONTENT_AREA_CLASSES if area_class in area_links), [])
+        candidates += [(a_tag, 10) for a_tag in content_area if self.is_article_href(a_tag['href'])]
         
         # Remove duplicates based on URL
         seen = set()
         unique_articles = []
-        for art in articles:
-            if art["link"] not in seen and art["title"]:
-                unique_articles.append(art)
-                seen.add(art["link"])
+        for a_tag, min_title_length in candidates:
+            if not a_tag or not a_tag.get('href'):
+                continue
+            link = urljoin(self.base_url, a_tag['href'])
+            if link in seen:
+                continue
+            title = a_tag.get_text(strip=True)
+            if title and len(title) > min_title_length:
+                unique_articles.append({"title": title, "link": link})
+                seen.add(link)
         
         return unique_articles
     
+    @staticmethod
+    def is_article_href(href: Optional[str]) -> bool:
+        """Whether a link points at a daily news analysis article"""
+        return bool(href) and ('/daily-news-analysis/' in href or '/daily-updates/' in href)
+    
     def scrape_article_content(self, url: str) -> Optional[Dict]:
         """Scrape individual article and format data for database insertion"""
+        return self.parse_article_content(url, self.fetch_page(url))
+    
+    def parse_article_content(self, url: str, response: Optional[requests.Response]) -> Optional[Dict]:
+        """Parse a fetched article page and format data for database insertion"""
+        if not response:
+            return None
+        return self.parse_article_html(url, response.content)
+    
+    def parse_article_html(self, url: str, content: bytes) -> Optional[Dict]:
+        """Parse an article page's raw HTML and format data for database insertion"""
         try:
-            # Fetch the page
-            response = self.fetch_page(url)
-            if not response:
-                return None
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract metadata
-            metadata = self.extract_metadata(soup)
-            
-            # Extract content
-            intro, content_sections = self.extract_content_sections(soup)
-            
-            # Extract main image
-            image_url = self.extract_images(soup)
-            
-            # Convert date string to date object if possible
-            published_date = None
-            date_string = metadata['date']
-            if date_string != "N/A":
-                try:
-                    from dateutil import parser as date_parser
-                    published_date = date_parser.parse(date_string).date()
-                except:
-                    published_date = None
-            
-            # Format article data for database
-            article_data = {
-                'title': metadata['title'],
-                'url': url,
-                'date': date_string,  # Keep original date string
-                'published_date': published_date,
-                'image_url': image_url,
-                'intro': intro[:500] if intro else '',  # Limit intro length
-                'importance_rating': metadata.get('importance_rating', 'N/A'),
-                'sections': content_sections
-            }
-            
-            logger.debug(f"Successfully scraped article: {metadata['title']} - Date: {date_string}")
+            soup = make_soup(content, self.html_parser)
+            article_data = self.extract_article(url, soup)
+            logger.debug(f"Successfully scraped article: {article_data['title']} - Date: {article_data['date']}")
             return article_data
             
         except Exception as e:
             logger.error(f"Error scraping article {url}: {e}")
             return None
     
+    def extract_article(self, url: str, root: Tag, article_detail: Optional[Tag] = None) -> Dict:
+        """
+        Format the article under root for database insertion
+        
+        The intro and sections are read from article_detail if given, otherwise
+        from the article container found under root.
+        """
+        # Extract metadata
+        metadata = self.extract_metadata(root)
+        
+        # Extract content
+        if article_detail is not None:
+            intro, content_sections = self.extract_article_sections(article_detail)
+        else:
+            intro, content_sections = self.extract_content_sections(root)
+        
+        # Extract main image
+        image_url = self.extract_images(root)
+        
+        # Convert date string to date object if possible
+        published_date = None
+        date_string = metadata['date']
+        if date_string != "N/A":
+            parsed_date = parse_date(date_string)
+            published_date = parsed_date.date() if parsed_date else None
+        
+        # Format article data for database
+        return {
+            'title': metadata['title'],
+            'url': url,
+            'date': date_string,  # Keep original date string
+            'published_date': published_date,
+            'image_url': image_url,
+            'intro': intro[:500] if intro else '',  # Limit intro length
+            'importance_rating': metadata.get('importance_rating', 'N/A'),
+            'sections': content_sections
+        }
+    
+    def extract_day_page_articles(self, soup: BeautifulSoup, article_links: List[Dict]) -> Dict[str, Dict]:
+        """
+        Articles of article_links that the day page renders in full, keyed by URL
+        
+        Each innermost div.article-detail on the page is one article: it is
+        matched to its link by the href of its <h1> title, or else by the
+        title text, and formatted as its own page would be. Articles without a
+        date or a headed section there (teasers: a title and a summary) are
+        left out and fetched from their own pages.
+        """
+        links_by_title = {self.clean_text(link["title"]): link["link"] for link in article_links}
+        linked = {link["link"] for link in article_links}
+        
+        articles = {}
+        for block in soup.find_all('div', class_='article-detail'):
+            title_elem = block.find('h1')
+            if not title_elem or block.find('div', class_='article-detail'):
+                continue
+            a_tag = title_elem.find('a', href=True)
+            if a_tag:
+                url = urljoin(self.base_url, a_tag['href'])
+            else:
+                url = links_by_title.get(self.clean_text(title_elem.get_text()))
+            if url not in linked or url in articles:
+                continue
+            
+            try:
+                article_data = self.extract_article(url, block, block)
+            except Exception as e:
+                logger.warning(f"Could not read article {url} from its day page: {e}")
+                continue
+            if article_data['date'] != "N/A" and any(section['heading'] for section in article_data['sections']):
+                articles[url] = article_data
+        return articles
+    
     def article_exists(self, url: str) -> bool:
         """Check if article already exists in database"""
         try:
@@ -598,75 +582,194 @@ class EnhancedDrishtiScraperFixed:
             logger.error(f"Error checking article existence: {e}")
             return False
     
-    def insert_article(self, article_data: Dict) -> Optional[str]:
-        """Insert article into database"""
+    def existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        """Return the subset of urls already in the database using a single query"""
+        urls = list(urls)
+        if not urls:
+            return set()
         try:
-            # Check if article already exists
-            if self.article_exists(article_data['url']):
+            self.cursor.execute("SELECT url FROM gk_today_content WHERE url = ANY(%s)", (urls,))
+            return {row[0] for row in self.cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Error checking article existence: {e}")
+            return set()
+    
+    def _to_record(self, article_data: Dict) -> Dict:
+        """Map scraped article data to a batched writer record"""
+        return article_writer.make_article_record(
+            title=article_data['title'],
+            url=article_data['url'],
+            source_name='DrishtiIAS',
+            image_url=article_data.get('image_url', ''),
+            published_date=article_data.get('published_date'),  # Already parsed date object
+            intro=article_data.get('intro', ''),
+            date=article_data.get('date', 'N/A'),  # Original date string
+            importance_rating=article_data.get('importance_rating', 'N/A'),
+            sections=article_data.get('sections', [])
+        )
+    
+    def insert_articles(self, articles: List[Dict]) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Insert a day's articles in a single transaction
+        
+        Each article is isolated by a savepoint, so a failing article is
+        reported in the second return value without rolling back its siblings.
+        
+        Returns:
+            (inserted url -> id, failed url -> error message)
+        """
+        if not articles:
+            return {}, {}
+        
+        try:
+            # Existing URLs are skipped by ON CONFLICT
+            records = [self._to_record(a) for a in articles]
+            inserted, failed = article_writer.insert_articles_isolated(self.cursor, records)
+            self.conn.commit()
+        except Exception as e:
+            self.conn.rollback()
+            logger.error(f"Error inserting articles: {e}")
+            return {}, {a['url']: str(e) for a in articles}
+        
+        for article_data in articles:
+            if article_data['url'] in inserted:
+                logger.info(f"Successfully inserted article: {article_data['title']}")
+            elif article_data['url'] not in failed:
                 logger.debug(f"Article already exists: {article_data['title']}")
-                return None
-            
-            # Generate ID
-            article_id = uuid.uuid4()
-            
-            # Insert main article with proper date handling
-            self.cursor.execute("""
-                INSERT INTO gk_today_content 
-                (id, title, url, image_url, published_date, intro, source_name, date, importance_rating)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
-                article_id,
-                article_data['title'],
-                article_data['url'],
-                article_data.get('image_url', ''),
-                article_data.get('published_date'),  # Already parsed date object
-                article_data.get('intro', ''),
-                'DrishtiIAS',
-                article_data.get('date', 'N/A'),  # Original date string
-                article_data.get('importance_rating', 'N/A')
-            ))
+        return {url: str(article_id) for url, article_id in inserted.items()}, failed
+    
+    def insert_article(self, article_data: Dict) -> Optional[str]:
+        """Insert article into database"""
+        inserted, _ = self.insert_articles([article_data])
+        return inserted.get(article_data['url'])
+    
+    def fetch_day_pages(self, max_days: int) -> List[Tuple[int, str, str, Optional[List[Dict]]]]:
+        """
+        Fetch the day pages of the last max_days days concurrently
+        
+        Returns:
+            (days_ago, date, url, article links) per day, newest first; links
+            already listed on a newer day are dropped, and links is None when
+            the page could not be fetched. A link carries its formatted
+            'article' when the day page renders it in full (DAY_PAGE_ARTICLES).
+        """
+        date_urls = [self.get_date_url(days_ago) for days_ago in range(max_days)]
+        responses = self.fetcher.fetch_many(date_urls, token=self.cancel_token)
+        
+        days = []
+        seen = set()
+        for days_ago, (date_url, response) in enumerate(zip(date_urls, responses)):
+            current_date = (datetime.now() - timedelta(days=days_ago)).strftime('%d-%m-%Y')
+            logger.info(f"Checking articles for {current_date} at {date_url}")
             
-            # Insert sections if available
-            if 'sections' in article_data:
-                for section_order, section in enumerate(article_data['sections']):
-                    section_id = uuid.uuid4()
-                    self.cursor.execute("""
-                        INSERT INTO sections 
-                        (id, article_id, heading, content, type, sequence_order)
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                    """, (
-                        section_id,
-                        article_id,
-                        section.get('heading', ''),
-                        section.get('content', ''),
-                        'list' if section.get('bullet_points') else 'paragraph',
-                        section_order
-                    ))
-                    
-                    # Insert bullet points if available
-                    if 'bullet_points' in section:
-                        for bullet_order, bullet in enumerate(section['bullet_points']):
-                            self.cursor.execute("""
-                                INSERT INTO section_bullets 
-                                (section_id, content, bullet_order)
-                                VALUES (%s, %s, %s)
-                            """, (section_id, bullet, bullet_order))
+            if not response:
+                logger.warning(f"Could not access page for {current_date}")
+                self.emit(progress_events.PAGE_DISCOVERED, url=date_url, page=days_ago + 1, count=0)
+                self.emit(progress_events.ERROR, url=date_url, message=f"Could not access page for {current_date}")
+                days.append((days_ago, current_date, date_url, None))
+                continue
             
-            self.conn.commit()
-            logger.info(f"Successfully inserted article: {article_data['title']}")
-            return str(article_id)
+            soup = make_soup(response.content, self.html_parser, parse_only=DAY_PAGE_FILTER)
+            article_links = [link for link in self.extract_article_links(soup) if link["link"] not in seen]
+            seen.update(link["link"] for link in article_links)
+            if DAY_PAGE_ARTICLES:
+                day_page_articles = self.extract_day_page_articles(soup, article_links)
+                for link in article_links:
+                    if link["link"] in day_page_articles:
+                        link["article"] = day_page_articles[link["link"]]
+                logger.info(f"{len(day_page_articles)} of them are complete on the day page")
             
-        except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error inserting article: {e}")
-            return None
+            logger.info(f"Found {len(article_links)} articles for {current_date}")
+            self.emit(progress_events.PAGE_DISCOVERED, url=date_url, page=days_ago + 1, count=len(article_links))
+            days.append((days_ago, current_date, date_url, article_links))
+        return days
     
-    def sync_articles(self, max_days: int = 7, max_articles: int = 100) -> ScrapingResult:
+    def parse_day_articles(
+        self,
+        work: Tuple[Tuple, Dict[str, Optional[requests.Response]], Dict[str, Dict]]
+    ) -> Tuple[Tuple, Dict[str, Optional[Dict]]]:
+        """
+        Pipeline parse stage: parse a day's fetched article pages, keyed by URL
+        
+        Articles already read from the day page are passed through, in their
+        place among the day's links.
+        """
+        day, responses, day_page_articles = work
+        _, _, _, article_links = day
+        parsed = {
+            link["link"]: day_page_articles.get(link["link"])
+            for link in article_links or []
+            if link["link"] in responses or link["link"] in day_page_articles
+        }
+        fetched = [url for url, response in responses.items() if response]
+        pool = get_parse_pool()
+        if pool:
+            parsed.update(zip(fetched, pool.map(parse_article_page, [(self.base_url, url, responses[url].content) for url in fetched])))
+        else:
+            parsed.update((url, self.parse_article_content(url, responses[url])) for url in fetched)
+        for url in fetched:
+            if parsed[url]:
+                self.emit(progress_events.PARSED, url=url)
+        for url in day_page_articles:
+            self.emit(progress_events.PARSED, url=url)
+        return day, parsed
+    
+    @staticmethod
+    def plan_detail_fetches(
+        days: List[Tuple[int, str, str, Optional[List[Dict]]]],
+        existing_urls: Set[str],
+        max_articles: int,
+        max_consecutive_existing: int
+    ) -> List[str]:
+        """
+        New article URLs the sync will reach, in order
+        
+        Mirrors sync_articles' stopping rules (max_articles, and the
+        consecutive-existing check after each day) so articles beyond the
+        point where the sync stops are never fetched.
+        """
+        planned = []
+        consecutive_existing = 0
+        for _, _, _, article_links in days:
+            for link in article_links or []:
+                if len(planned) >= max_articles:
+                    return planned
+                if link["link"] in existing_urls:
+                    consecutive_existing += 1
+                else:
+                    planned.append(link["link"])
+                    consecutive_existing = 0
+            if consecutive_existing >= max_consecutive_existing:
+                break
+        return planned
+    
+    def sync_articles(
+        self,
+        max_days: int = 7,
+        max_articles: int = 100,
+        progress_callback: Optional[Callable[[ScrapingResult], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        event_callback: Optional[Callable[[ProgressEvent], None]] = None
+    ) -> ScrapingResult:
         """
         Sync latest articles from DrishtiIAS
         This is the main method for production use
+        
+        Day pages are fetched concurrently and their new articles share one detail
+        fetch queue, so a multi-day catch-up takes about as long as its slowest day
+        rather than the sum of all days; articles a day page renders in full are
+        taken from it without a detail fetch. Days then run through a fetch -> parse ->
+        write Pipeline and are written in order; the result's stage_metrics show
+        where the time went.
+        
+        progress_callback, if given, receives a running ScrapingResult after each day.
+        cancel_token, if given, stops the sync at the next day or pending fetch once
+        cancelled; articles already written are kept.
+        event_callback, if given, receives a ProgressEvent for each day and article step.
         """
         start_time = time.time()
+        self.cancel_token = cancel_token
+        self.event_callback = event_callback
         logger.info(f"Starting DrishtiIAS article sync (max_days: {max_days}, max_articles: {max_articles})")
         
         if not self.init_database():
@@ -683,86 +786,139 @@ class EnhancedDrishtiScraperFixed:
         errors = []
         consecutive_existing = 0
         max_consecutive_existing = 5  # Stop after 5 consecutive existing articles
-        
-        try:
-            for days_ago in range(max_days):
-                if articles_scraped >= max_articles:
-                    break
-                
-                current_date = (datetime.now() - timedelta(days=days_ago)).strftime('%d-%m-%Y')
-                date_url = self.get_date_url(days_ago)
-                
-                logger.info(f"Checking articles for {current_date} at {date_url}")
-                
-                # Fetch the page for this day
-                response = self.fetch_page(date_url)
-                if not response:
-                    logger.warning(f"Could not access page for {current_date}")
+        finished = False
+        
+        existing_urls: Set[str] = set()
+        detail_futures = {}
+        day_page_articles: Dict[str, Dict] = {}  # new articles read from their day page, not fetched
+        
+        def fetch_day(day: Tuple[int, str, str, Optional[List[Dict]]]) -> Tuple[Tuple, Dict, Dict]:
+            """Pipeline fetch stage: collect a day's new article pages from the shared fetch queue"""
+            _, _, _, article_links = day
+            responses = {}
+            articles = {}
+            for link in article_links or []:
+                url = link["link"]
+                if url in existing_urls:
                     continue
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                article_links = self.extract_article_links(soup)
-                
-                logger.info(f"Found {len(article_links)} articles for {current_date}")
-                
-                if not article_links:
+                if url in day_page_articles:
+                    articles[url] = day_page_articles.pop(url)
+                elif url in detail_futures:
+                    responses[url] = self.fetcher.wait(detail_futures.pop(url), pipeline.token)
+                    if responses[url] is not None:
+                        self.emit(progress_events.FETCHED, url=url)
+            return day, responses, articles
+        
+        def write_day(work: Tuple[Tuple, Dict[str, Optional[Dict]]]):
+            """Pipeline write stage: store a day's new articles in one transaction and account for them"""
+            nonlocal articles_scraped, articles_skipped, consecutive_existing, finished
+            (days_ago, current_date, date_url, article_links), parsed = work
+            if finished:
+                return
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            
+            if not article_links:
+                if article_links is not None:
                     logger.info(f"No articles found for {current_date}")
-                    continue
+                return
+            
+            day_scraped = 0
+            day_existing = 0
+            inserted, failed = self.insert_articles([data for data in parsed.values() if data])
+            
+            for i, article_link in enumerate(article_links):
+                if articles_scraped >= max_articles:
+                    break
                 
-                day_scraped = 0
-                day_existing = 0
+                article_url = article_link["link"]
+                article_title = article_link["title"]
                 
-                for i, article_link in enumerate(article_links):
-                    if articles_scraped >= max_articles:
-                        break
-                    
-                    try:
-                        article_url = article_link["link"]
-                        article_title = article_link["title"]
-                        
-                        logger.debug(f"Processing article {i+1}/{len(article_links)}: {article_title}")
-                        
-                        # Check if article already exists
-                        if self.article_exists(article_url):
-                            articles_skipped += 1
-                            day_existing += 1
-                            consecutive_existing += 1
-                            logger.debug(f"Skipping existing article: {article_title}")
-                            continue
-                        
-                        # Scrape the article
-                        article_data = self.scrape_article_content(article_url)
-                        
-                        if not article_data:
-                            logger.warning(f"Could not scrape article: {article_title}")
-                            continue
-                        
-                        # Insert into database
-                        article_id = self.insert_article(article_data)
-                        if article_id:
-                            articles_scraped += 1
-                            day_scraped += 1
-                            consecutive_existing = 0  # Reset counter
-                            logger.info(f"✓ Scraped new article: {article_data['title']}")
-                        
-                        # Rate limiting
-                        time.sleep(self.rate_limit_delay)
-                        
-                    except Exception as e:
-                        error_msg = f"Error processing article {article_link.get('title', 'Unknown')}: {e}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
+                logger.debug(f"Processing article {i+1}/{len(article_links)}: {article_title}")
                 
-                logger.info(f"Day {current_date} summary: {day_scraped} new articles, {day_existing} existing articles")
-                
-                # Stop if we've found too many consecutive existing articles
-                if consecutive_existing >= max_consecutive_existing:
-                    logger.info(f"Found {consecutive_existing} consecutive existing articles. Stopping sync.")
+                # Check if article already exists
+                if article_url in existing_urls:
+                    articles_skipped += 1
+                    day_existing += 1
+                    consecutive_existing += 1
+                    logger.debug(f"Skipping existing article: {article_title}")
+                    self.emit(progress_events.SKIPPED, url=article_url)
+                elif article_url not in parsed:
                     break
-                
-                # Add delay between days
-                if days_ago < max_days - 1:
-                    time.sleep(self.rate_limit_delay + 1)
+                elif not parsed[article_url]:
+                    logger.warning(f"Could not scrape article: {article_title}")
+                    self.emit(progress_events.ERROR, url=article_url, message=f"Could not scrape article: {article_title}")
+                elif article_url in failed:
+                    error_msg = f"Error processing article {article_title}: {failed[article_url]}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+                    self.emit(progress_events.ERROR, url=article_url, message=error_msg)
+                elif article_url in inserted:
+                    inserted.pop(article_url)
+                    articles_scraped += 1
+                    day_scraped += 1
+                    consecutive_existing = 0  # Reset counter
+                    logger.info(f"✓ Scraped new article: {parsed[article_url]['title']}")
+                    self.emit(progress_events.WRITTEN, url=article_url)
+                else:
+                    # Stored by another runner since the existence check (ON CONFLICT DO NOTHING)
+                    articles_skipped += 1
+                    day_existing += 1
+                    consecutive_existing += 1
+                    logger.debug(f"Article already exists: {article_title}")
+                    self.emit(progress_events.SKIPPED, url=article_url)
+            
+            logger.info(f"Day {current_date} summary: {day_scraped} new articles, {day_existing} existing articles")
+            
+            if progress_callback:
+                progress_callback(ScrapingResult(
+                    success=len(errors) == 0,
+                    articles_scraped=articles_scraped,
+                    articles_skipped=articles_skipped,
+                    errors=list(errors),
+                    runtime_seconds=time.time() - start_time
+                ))
+            
+            # Stop if we've found too many consecutive existing articles
+            if consecutive_existing >= max_consecutive_existing:
+                logger.info(f"Found {consecutive_existing} consecutive existing articles. Stopping sync.")
+                finished = True
+            elif articles_scraped >= max_articles:
+                finished = True
+        
+        pipeline = Pipeline([
+            Stage('fetch', fetch_day, FETCH_WORKERS),
+            Stage('parse', self.parse_day_articles, PARSE_WORKERS),
+            Stage('write', write_day, ordered=True)
+        ], token=cancel_token)
+        # Closing the pipeline also cancels the detail pages it no longer needs
+        self.cancel_token = pipeline.token
+        
+        try:
+            # All day pages at once, then one existence query for every linked article
+            days = self.fetch_day_pages(max_days)
+            existing_urls.update(self.existing_urls(link["link"] for _, _, _, links in days for link in links or []))
+            
+            # Start every detail fetch the sync will need; the fetch stage collects them day by day
+            planned_urls = self.plan_detail_fetches(days, existing_urls, max_articles, max_consecutive_existing)
+            complete = {link["link"]: link["article"] for _, _, _, links in days for link in links or [] if "article" in link}
+            for url in planned_urls:
+                self.emit(progress_events.URL_RESOLVED, url=url)
+                if url in complete:
+                    day_page_articles[url] = complete[url]
+                else:
+                    detail_futures[url] = self.fetcher.submit(url, token=pipeline.token)
+            if day_page_articles:
+                logger.info(f"{len(day_page_articles)} of {len(planned_urls)} new articles read from their day pages")
+            
+            for _ in pipeline.run(days):
+                if finished:
+                    break
+        
+        except ScrapeCancelled as e:
+            error_msg = f"DrishtiIAS sync cancelled: {e}"
+            logger.warning(error_msg)
+            errors.append(error_msg)
         
         except Exception as e:
             error_msg = f"Critical error during scraping: {e}"
@@ -770,6 +926,12 @@ class EnhancedDrishtiScraperFixed:
             errors.append(error_msg)
         
         finally:
+            pipeline.close()
+            # Detail pages planned for days the sync never reached
+            for future in detail_futures.values():
+                future.cancel()
+            self.cancel_token = None
+            self.event_callback = None
             self.close()
         
         runtime = time.time() - start_time
@@ -779,9 +941,11 @@ class EnhancedDrishtiScraperFixed:
             articles_scraped=articles_scraped,
             articles_skipped=articles_skipped,
             errors=errors,
-            runtime_seconds=runtime
+            runtime_seconds=runtime,
+            stage_metrics=pipeline.metrics_dict()
         )
         
+        logger.info(f"DrishtiIAS pipeline stages: {format_metrics(result.stage_metrics)}")
         logger.info(f"DrishtiIAS sync completed: {articles_scraped} new articles, {articles_skipped} skipped, {runtime:.2f}s")
         
         return result
@@ -790,9 +954,22 @@ class EnhancedDrishtiScraperFixed:
         """Close database connection"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
-        logger.debug("Database connection closed")
+            get_pool().putconn(self.conn)
+            self.conn = None
+        logger.debug("Database connection returned to pool")
+
+# Parsing-only scraper of a parse-pool worker process (see parse_pool.py)
+_pool_scraper: Optional[EnhancedDrishtiScraperFixed] = None
+
+def parse_article_page(base_url: str, url: str, content: bytes) -> Optional[Dict]:
+    """Parse-pool task: an article page formatted for database insertion"""
+    global _pool_scraper
+    if _pool_scraper is None:
+        _pool_scraper = EnhancedDrishtiScraperFixed()
+    _pool_scraper.base_url = base_url
+    return _pool_scraper.parse_article_html(url, content)
 
 def main():
     """Main function for testing"""
@@ -0,0 +1,263 @@
+"""
+Asyncio fetch engine shared by the production scrapers
+Bounded per-host concurrency, politeness scheduling, timeouts and
+retry/backoff behind a sync facade
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from cancellation import CancellationToken, ScrapeCancelled
+from rate_limiter import PolitenessScheduler, get_scheduler
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Response bodies are read in chunks so a cancelled fetch stops downloading
+CHUNK_SIZE = 64 * 1024
+
+class AsyncFetchEngine:
+    """
+    Asyncio-based HTTP fetch engine
+
+    The event loop runs in a dedicated background thread so synchronous callers
+    (the scrapers, CombinedScraper's worker threads) can share one engine and
+    therefore one set of per-host concurrency limits. Every attempt that
+    reaches the network is charged to the host's politeness token bucket.
+    Blocking requests calls run on a thread pool with one keep-alive session
+    per worker thread. Fetches given a CancellationToken return to the caller
+    as soon as it is cancelled; the worker drops the download at its next chunk.
+    """
+
+    def __init__(
+        self,
+        max_per_host: Optional[int] = None,
+        timeout: Optional[float] = None,
+        retries: int = 3,
+        headers: Optional[Dict[str, str]] = None,
+        scheduler: Optional[PolitenessScheduler] = None
+    ):
+        self.max_per_host = max_per_host or int(os.getenv('SCRAPER_MAX_CONCURRENCY_PER_HOST', '4'))
+        self.timeout = timeout or float(os.getenv('SCRAPER_FETCH_TIMEOUT', '30'))
+        self.retries = retries
+        self.headers = dict(headers or DEFAULT_HEADERS)
+        self.scheduler = scheduler or get_scheduler()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._sessions: List[requests.Session] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop on first use"""
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max(4, self.max_per_host * 4),
+                    thread_name_prefix='fetch-worker'
+                )
+                self._loop = asyncio.new_event_loop()
+                self._semaphores = {}
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(self._loop, ready),
+                    name='fetch-engine',
+                    daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        """Event loop thread body"""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def _get_session(self) -> requests.Session:
+        """Get the keep-alive session owned by the current worker thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def _get(self, url: str, token: Optional[CancellationToken] = None) -> requests.Response:
+        """Blocking GET executed on a worker thread"""
+        if token is None:
+            response = self._get_session().get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response
+
+        token.raise_if_cancelled()
+        response = self._get_session().get(url, timeout=self.timeout, stream=True)
+        try:
+            response.raise_for_status()
+            chunks = []
+            for chunk in response.iter_content(CHUNK_SIZE):
+                token.raise_if_cancelled()
+                chunks.append(chunk)
+            response._content = b''.join(chunks)
+        finally:
+            response.close()
+        return response
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """Per-host concurrency limit (only touched from the loop thread)"""
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_per_host)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    async def fetch(
+        self,
+        url: str,
+        retries: Optional[int] = None,
+        token: Optional[CancellationToken] = None
+    ) -> Optional[requests.Response]:
+        """Fetch a URL with retry logic and exponential backoff (retries=0 makes a single attempt)"""
+        retries = self.retries if retries is None else retries
+        host = urlparse(url).netloc
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(max(retries, 1)):
+            if token is not None:
+                token.raise_if_cancelled()
+            try:
+                logger.debug(f"Fetching {url} (attempt {attempt + 1})")
+                # Wait for the politeness token first so waiting requests don't hold the host's slots
+                await self.scheduler.acquire_async(host)
+                async with self._host_semaphore(host):
+                    return await loop.run_in_executor(self._executor, self._get, url, token)
+            except requests.RequestException as e:
+                logger.warning(f"Fetch attempt {attempt + 1} failed: {e}")
+                if attempt < retries - 1:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    logger.error(f"Failed to fetch {url} after {attempt + 1} attempts")
+        return None
+
+    async def fetch_all(
+        self,
+        urls: Iterable[str],
+        retries: Optional[int] = None,
+        token: Optional[CancellationToken] = None
+    ) -> List[Optional[requests.Response]]:
+        """Fetch several URLs concurrently, preserving input order"""
+        return await asyncio.gather(*(self.fetch(url, retries, token) for url in urls))
+
+    # Sync facade
+
+    @staticmethod
+    def wait(future: concurrent.futures.Future, token: Optional[CancellationToken] = None):
+        """
+        Block on a fetch future; cancelling the token cancels the pending fetch
+        (queued, rate-limited or backing off) and raises ScrapeCancelled at once
+        """
+        if token is None:
+            return future.result()
+
+        callback = token.add_callback(future.cancel)
+        try:
+            return future.result()
+        except concurrent.futures.CancelledError:
+            raise ScrapeCancelled(token.reason)
+        finally:
+            token.remove_callback(callback)
+
+    def submit(
+        self,
+        url: str,
+        retries: Optional[int] = None,
+        token: Optional[CancellationToken] = None
+    ) -> concurrent.futures.Future:
+        """Schedule a fetch and return a concurrent.futures.Future for its response"""
+        return asyncio.run_coroutine_threadsafe(self.fetch(url, retries, token), self._ensure_started())
+
+    def fetch_sync(
+        self,
+        url: str,
+        retries: Optional[int] = None,
+        token: Optional[CancellationToken] = None
+    ) -> Optional[requests.Response]:
+        """Fetch a single URL, blocking until done (raises ScrapeCancelled if token is cancelled)"""
+        return self.wait(self.submit(url, retries, token), token)
+
+    def fetch_many(
+        self,
+        urls: Iterable[str],
+        retries: Optional[int] = None,
+        token: Optional[CancellationToken] = None
+    ) -> List[Optional[requests.Response]]:
+        """Fetch several URLs concurrently, blocking until all are done (raises ScrapeCancelled if token is cancelled)"""
+        urls = list(urls)
+        if not urls:
+            return []
+        future = asyncio.run_coroutine_threadsafe(self.fetch_all(urls, retries, token), self._ensure_started())
+        return self.wait(future, token)
+
+    @staticmethod
+    async def _cancel_pending():
+        """Cancel fetches still running on the loop and let them unwind"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        """Stop the event loop and release pooled connections"""
+        with self._lock:
+            loop, thread, executor = self._loop, self._thread, self._executor
+            sessions, self._sessions = self._sessions, []
+            self._loop = self._thread = self._executor = None
+
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._cancel_pending(), loop).result(timeout=5)
+            except Exception as e:
+                logger.debug(f"Error cancelling pending fetches: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+        if executor is not None:
+            executor.shutdown(wait=False)
+        for session in sessions:
+            session.close()
+        logger.debug("Fetch engine closed")
+
+# Process-wide engine so concurrent scrapers share per-host limits
+_fetch_engine = None
+_fetch_engine_lock = threading.Lock()
+
+def get_fetch_engine() -> AsyncFetchEngine:
+    """Get the global fetch engine instance"""
+    global _fetch_engine
+    with _fetch_engine_lock:
+        if _fetch_engine is None:
+            _fetch_engine = AsyncFetchEngine()
+        return _fetch_engine
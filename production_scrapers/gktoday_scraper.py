@@ -4,20 +4,22 @@ Optimized for Next.js integration and production use
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import json
 from datetime import datetime
 import time
 import os
 import sys
 import re
-from dateutil import parser
+from urllib.parse import urlparse
 import psycopg2
 from psycopg2.extras import DictCursor, register_uuid
 import uuid
 import logging
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+import threading
+import concurrent.futures
+from typing import Callable, List, Dict, Set, Tuple, Optional, Iterable, Iterator
+from dataclasses import dataclass, field
 
 # Load environment variables from parent directory
 from dotenv import load_dotenv
@@ -25,9 +27,71 @@ root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 dotenv_path = os.path.join(root_dir, '.env.local')
 load_dotenv(dotenv_path)
 
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import article_writer
+from cancellation import CancellationToken, ScrapeCancelled
+from content_locator import TEXT_TYPES, largest_text_container
+from date_extraction import find_listing_date, parse_date
+from db_pool import get_pool
+from fetcher import get_fetch_engine
+from migrations import ensure_schema
+from parse_pool import get_parse_pool
+from parser_backend import TagFilter, make_soup, resolve_backend
+from pipeline import FETCH_WORKERS, PARSE_WORKERS, Pipeline, Stage, format_metrics
+import progress_events
+from progress_events import ProgressEvent
+from rate_limiter import get_scheduler, source_rate_limit
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Listing pages fetched ahead of the one being processed (1 = follow pagination serially)
+PAGE_CONCURRENCY = int(os.getenv('SCRAPER_GKTODAY_PAGE_CONCURRENCY', '1'))
+
+# Parts of a listing page parse_listing_html reads: every tag the article
+# selectors match (and .content-area, for 'content-area main article') plus the
+# pagination links get_next_page_url looks at
+LISTING_PAGE_FILTER = TagFilter(
+    names=['article'],
+    class_substrings=['post', 'news-item', 'entry', 'article', 'content-area', 'page-numbers', 'next'],
+    keep=lambda name, attrs: name == 'a' and (
+        '/page/' in attrs.get('href', '') or 'next' in attrs.get('rel', '').split()
+    )
+)
+
+# Article container selectors, most common first
+ARTICLE_SELECTORS = [
+    'article',  # Most common
+    '.post',    # Common WordPress
+    '.news-item', 
+    'div[class*="post"]',  # CRITICAL: This is what GKToday uses!
+    '.entry',   # Another common WordPress
+    '.article', 
+    '.type-post',
+    '.blog-post',
+    '.content-area main article'
+]
+
+# Headings that open a section of an article page
+DETAIL_HEADINGS = ('h2', 'h3', 'h4')
+
+# Selector that found most article containers, per site (tried first on later pages)
+_preferred_selectors: Dict[str, str] = {}
+_preferred_selectors_lock = threading.Lock()
+
+def _prefer_selector(base_url: str, selector: Optional[str]):
+    """Remember (or with None, forget) the selector tried first on base_url's listing pages"""
+    with _preferred_selectors_lock:
+        if selector is None:
+            _preferred_selectors.pop(base_url, None)
+        elif _preferred_selectors.get(base_url) != selector:
+            _preferred_selectors[base_url] = selector
+            logger.debug(f"Article selector for {base_url}: {selector!r}")
+
 @dataclass
 class ScrapingResult:
     """Result of a scraping operation"""
@@ -36,6 +100,7 @@ class ScrapingResult:
     articles_skipped: int
     errors: List[str]
     runtime_seconds: float
+    stage_metrics: Dict[str, Dict] = field(default_factory=dict)  # pipeline stage -> StageMetrics.to_dict()
 
 class DatabaseManager:
     """Enhanced database manager with production optimizations"""
@@ -43,90 +108,23 @@ class DatabaseManager:
     def __init__(self):
         self.conn = None
         self.cursor = None
+        # Pipeline fetch workers look up existing URLs while the write stage inserts
+        self.lock = threading.Lock()
         register_uuid()
         
     def connect(self):
         """Connect to database with proper error handling"""
         try:
-            database_url = os.getenv('DATABASE_URL')
-            if not database_url:
-                raise ValueError("DATABASE_URL environment variable is not set")
-            
-            self.conn = psycopg2.connect(database_url)
+            self.conn = get_pool().getconn()
             self.cursor = self.conn.cursor(cursor_factory=DictCursor)
-            self._ensure_tables()
+            ensure_schema(self.conn)
             logger.info("Database connection established successfully")
             return True
         except Exception as e:
             logger.error(f"Database connection failed: {e}")
+            self.close()
             return False
     
-    def _ensure_tables(self):
-        """Ensure all required tables exist"""
-        try:
-            # Check if main table exists
-            self.cursor.execute("""
-                SELECT EXISTS(
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'gk_today_content'
-                )
-            """)
-            
-            if not self.cursor.fetchone()[0]:
-                logger.info("Creating database tables...")
-                self._create_tables()
-            else:
-                logger.debug("Database tables already exist")
-                
-        except Exception as e:
-            logger.error(f"Error checking/creating tables: {e}")
-            raise
-    
-    def _create_tables(self):
-        """Create all required tables"""
-        tables_sql = [
-            """
-            CREATE TABLE IF NOT EXISTS gk_today_content (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                title TEXT NOT NULL,
-                url TEXT UNIQUE NOT NULL,
-                image_url TEXT,
-                published_date DATE,
-                source_name TEXT DEFAULT 'GKToday',
-                scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                intro TEXT,
-                sequence_order INTEGER,
-                importance_rating TEXT,
-                date TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS sections (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                article_id UUID REFERENCES gk_today_content(id) ON DELETE CASCADE,
-                heading TEXT,
-                content TEXT,
-                type TEXT CHECK (type IN ('paragraph', 'list')),
-                sequence_order INTEGER
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS section_bullets (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                section_id UUID REFERENCES sections(id) ON DELETE CASCADE,
-                content TEXT NOT NULL,
-                bullet_order INTEGER
-            )
-            """
-        ]
-        
-        for sql in tables_sql:
-            self.cursor.execute(sql)
-        
-        self.conn.commit()
-        logger.info("Database tables created successfully")
-    
     def article_exists(self, url: str) -> bool:
         """Check if article already exists in database"""
         try:
@@ -136,89 +134,126 @@ class DatabaseManager:
             logger.error(f"Error checking article existence: {e}")
             return False
     
-    def insert_article(self, article_data: Dict) -> Optional[str]:
-        """Insert article into database - EXACT COPY from working legacy scraper"""
+    def existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        """Return the subset of urls already in the database using a single query"""
+        urls = list(urls)
+        if not urls:
+            return set()
         try:
-            # First check if article already exists
-            self.cursor.execute("SELECT id FROM gk_today_content WHERE url = %s", (article_data['url'],))
-            existing = self.cursor.fetchone()
-            
-            if existing:
-                logger.info(f"Article already exists: {article_data['title']}")
-                return existing[0]  # Return existing article ID
-            
-            # Insert article using original schema
-            self.cursor.execute("""
-                INSERT INTO gk_today_content (title, url, image_url, published_date, intro, sequence_order, source_name)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (url) DO NOTHING
-                RETURNING id
-            """, (
-                article_data['title'],
-                article_data['url'],
-                article_data.get('image_url', ''),
-                parser.parse(article_data['date']).date() if article_data['date'] != "No date" else None,
-                article_data.get('content', ''),
-                article_data.get('sequence_order', 0),
-                'GKToday'
-            ))
-            
-            result = self.cursor.fetchone()
-            if not result:
-                logger.info(f"Article already exists (skipped): {article_data['title']}")
-                return None
-                
-            article_id = result[0]
-            logger.info(f"Inserted new article: {article_data['title']}")
-
-            # Insert sections and bullet points
-            if 'sections' in article_data:
-                for idx, section in enumerate(article_data['sections']):
-                    self.cursor.execute("""
-                        INSERT INTO sections (article_id, heading, content, type, sequence_order)
-                        VALUES (%s, %s, %s, %s, %s)
-                        RETURNING id
-                    """, (
-                        article_id,
-                        section['title'],
-                        section['content'],
-                        'list' if section['bullet_points'] else 'paragraph',
-                        idx
-                    ))
-                    
-                    section_id = self.cursor.fetchone()[0]
-
-                    # Insert bullet points if any
-                    if section['bullet_points']:
-                        for bullet_idx, bullet in enumerate(section['bullet_points']):
-                            self.cursor.execute("""
-                                INSERT INTO section_bullets (section_id, content, bullet_order)
-                                VALUES (%s, %s, %s)
-                            """, (section_id, bullet, bullet_idx))
-
-            self.conn.commit()
-            return article_id
-            
-        except psycopg2.IntegrityError as e:
-            self.conn.rollback()
-            if "duplicate key value violates unique constraint" in str(e):
-                logger.info(f"Duplicate article skipped: {article_data['title']}")
-                return None
-            else:
-                logger.error(f"Database integrity error: {e}")
-                raise
+            with self.lock:
+                self.cursor.execute("SELECT url FROM gk_today_content WHERE url = ANY(%s)", (urls,))
+                return {row[0] for row in self.cursor.fetchall()}
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Error inserting article data: {e}")
-            raise
+            logger.error(f"Error checking article existence: {e}")
+            return set()
+    
+    def _to_record(self, article_data: Dict) -> Dict:
+        """Map scraped article data to a batched writer record"""
+        published = parse_date(article_data['date']) if article_data['date'] != "No date" else None
+        return article_writer.make_article_record(
+            title=article_data['title'],
+            url=article_data['url'],
+            source_name='GKToday',
+            image_url=article_data.get('image_url', ''),
+            published_date=published.date() if published else None,
+            intro=article_data.get('content', ''),
+            sequence_order=article_data.get('sequence_order', 0),
+            sections=[
+                {
+                    'heading': section['title'],
+                    'content': section['content'],
+                    'bullet_points': section['bullet_points']
+                }
+                for section in article_data.get('sections', [])
+            ]
+        )
+    
+    def insert_articles(self, articles: List[Dict]) -> Tuple[Dict[str, uuid.UUID], Dict[str, str]]:
+        """
+        Insert a page of articles in a single transaction
+        
+        Each article is isolated by a savepoint, so a failing article is
+        reported in the second return value without rolling back its siblings.
+        
+        Returns:
+            (inserted url -> id, failed url -> error message)
+        """
+        records = []
+        failed = {}
+        for article_data in articles:
+            try:
+                records.append(self._to_record(article_data))
+            except Exception as e:
+                failed[article_data['url']] = str(e)
+                logger.error(f"Error preparing article {article_data['title']}: {e}")
+        
+        with self.lock:
+            try:
+                # Existing URLs are skipped by ON CONFLICT; callers resolve them in bulk beforehand
+                inserted, write_failed = article_writer.insert_articles_isolated(self.cursor, records)
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                logger.error(f"Error inserting article data: {e}")
+                raise
+        failed.update(write_failed)
+        
+        for article_data in articles:
+            if article_data['url'] in inserted:
+                logger.info(f"Inserted new article: {article_data['title']}")
+            elif article_data['url'] not in failed:
+                logger.info(f"Article already exists (skipped): {article_data['title']}")
+        return inserted, failed
+    
+    def insert_article(self, article_data: Dict) -> Optional[str]:
+        """Insert article into database"""
+        inserted, _ = self.insert_articles([article_data])
+        return inserted.get(article_data['url'])
     
     def close(self):
         """Close database connection"""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.conn:
-            self.conn.close()
-        logger.debug("Database connection closed")
+            get_pool().putconn(self.conn)
+            self.conn = None
+        logger.debug("Database connection returned to pool")
+
+class ListingPrefetcher:
+    """
+    Fetches GKToday listing pages /page/N/ ahead of the page being processed
+    
+    Up to window pages are in flight at once (still subject to the fetch
+    engine's per-host limits and politeness budget). close() cancels every
+    page not yet consumed, e.g. once the existing-article watermark is hit.
+    """
+    
+    def __init__(self, scraper: 'EnhancedGKTodayScraper', max_pages: int, window: int, token: Optional[CancellationToken] = None):
+        self.scraper = scraper
+        self.max_pages = max_pages
+        self.window = window
+        self.token = CancellationToken(parent=token)
+        self.futures: Dict[int, concurrent.futures.Future] = {}
+        self.next_page = 1
+    
+    def response(self, page: int) -> Optional[requests.Response]:
+        """Response for listing page number page (1-based), topping up the window first"""
+        while self.next_page <= min(page + self.window - 1, self.max_pages):
+            url = self.scraper.listing_page_url(self.next_page)
+            self.futures[self.next_page] = self.scraper.fetcher.submit(url, token=self.token)
+            self.next_page += 1
+        return self.scraper.fetcher.wait(self.futures.pop(page), self.token)
+    
+    def close(self):
+        """Cancel listing pages that were prefetched but not consumed"""
+        if self.futures:
+            logger.debug(f"Cancelling {len(self.futures)} prefetched listing pages")
+        self.token.cancel("listing prefetch no longer needed")
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+        self.token.close()
 
 class EnhancedGKTodayScraper:
     """Production-ready GKToday scraper with smart sync capabilities"""
@@ -233,30 +268,30 @@ class EnhancedGKTodayScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.fetcher = get_fetch_engine()
+        self.cancel_token: Optional[CancellationToken] = None
+        self.event_callback: Optional[Callable[[ProgressEvent], None]] = None
         self.db = DatabaseManager()
-        self.rate_limit_delay = int(os.getenv('SCRAPER_RATE_LIMIT', '2'))
+        self.html_parser = resolve_backend()
+        self.rate_limit_delay = source_rate_limit('gktoday')
+        get_scheduler().configure(urlparse(self.base_url).netloc, self.rate_limit_delay)
         
     def connect_to_db(self) -> bool:
         """Connect to database"""
         return self.db.connect()
     
+    def emit(self, event_type: str, **fields):
+        """Report a progress event to the event callback, if any"""
+        if self.event_callback:
+            self.event_callback(ProgressEvent(event_type, source='gktoday', **fields))
+    
     def fetch_page(self, url: str, retries: int = 3) -> Optional[requests.Response]:
         """Fetch page with retry logic"""
-        for attempt in range(retries):
-            try:
-                logger.debug(f"Fetching {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return response
-            except requests.RequestException as e:
-                logger.warning(f"Fetch attempt {attempt + 1} failed: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    logger.error(f"Failed to fetch {url} after {retries} attempts")
-        return None
+        return self.fetcher.fetch_sync(url, retries=retries, token=self.cancel_token)
+    
+    def listing_page_url(self, page: int) -> str:
+        """URL of listing page number page (1-based)"""
+        return self.base_url if page == 1 else f"{self.base_url}/page/{page}/"
     
     def get_next_page_url(self, soup: BeautifulSoup) -> Optional[str]:
         """Find next page URL - using robust legacy logic"""
@@ -316,30 +351,14 @@ class EnhancedGKTodayScraper:
         """Parse date string with multiple format support"""
         if not date_string:
             return None
-            
-        date_formats = [
-            '%B %d, %Y',
-            '%b %d, %Y', 
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%m/%d/%Y'
-        ]
         
         # Clean the date string
         date_string = re.sub(r'[^\w\s,/-]', '', date_string.strip())
         
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_string, fmt)
-            except ValueError:
-                continue
-        
-        # Try using dateutil parser as fallback
-        try:
-            return parser.parse(date_string)
-        except:
+        parsed = parse_date(date_string, dayfirst=True)
+        if parsed is None:
             logger.warning(f"Could not parse date: {date_string}")
-            return None
+        return parsed
     
     def extract_article_data(self, article_element) -> Optional[Dict]:
         """Extract article data from BS4 element - EXACT COPY from working legacy scraper"""
@@ -375,15 +394,7 @@ class EnhancedGKTodayScraper:
                 return None
             
             # Find date - look for the specific format "May dd, 2025"
-            date = "No date"
-            text_content = article_element.get_text()
-            date_pattern = r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+2025\b'
-            date_match = re.search(date_pattern, text_content)
-            if date_match:
-                date = date_match.group(0)
-                # Ensure consistent format
-                if ',' not in date:
-                    date = date.replace(' 2025', ', 2025')
+            date = find_listing_date(article_element.get_text()) or "No date"
             
             # Find content
             content = ""
@@ -391,7 +402,7 @@ class EnhancedGKTodayScraper:
             for p in paragraphs:
                 p_text = p.get_text(strip=True)
                 # Look for a substantial paragraph that's not just a date
-                if len(p_text) > 100 and not re.search(r'\b2025\b', p_text):
+                if len(p_text) > 100 and not find_listing_date(p_text):
                     content = p_text
                     break
             
@@ -412,12 +423,20 @@ class EnhancedGKTodayScraper:
         if not article_url:
             return {"content": "", "sections": [], "image_url": ""}
         
+        logger.info(f"Fetching detailed content from: {article_url}")
+        response = self.fetch_page(article_url)
+        return self.parse_detailed_content(response)
+    
+    def parse_detailed_content(self, response: Optional[requests.Response]) -> Dict:
+        """Parse detailed content from a fetched article page"""
+        if not response:
+            return {"content": "", "sections": [], "image_url": ""}
+        return self.parse_detailed_html(response.content)
+    
+    def parse_detailed_html(self, content: bytes) -> Dict:
+        """Parse detailed content from an article page's raw HTML"""
         try:
-            logger.info(f"Fetching detailed content from: {article_url}")
-            response = self.fetch_page(article_url)
-            if not response:
-                return {"content": "", "sections": [], "image_url": ""}
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(content, self.html_parser)
             
             article_content = {
                 "content": "",
@@ -437,90 +456,263 @@ class EnhancedGKTodayScraper:
             
             if not main_content:
                 # Fallback to largest text container
-                all_divs = soup.find_all('div')
-                main_content = max(all_divs, key=lambda x: len(x.get_text()), default=None)
+                main_content = largest_text_container(soup)
             
             if main_content:
-                # Find the first paragraph after the date and the image below date
-                date_element = main_content.find(string=lambda s: isinstance(s, str) and "2025" in s)
-                if date_element and date_element.parent:
-                    # Look for image after date
-                    img_element = date_element.parent.find_next('img')
-                    if img_element and 'src' in img_element.attrs:
-                        article_content["image_url"] = img_element['src']
-                        if not article_content["image_url"].startswith('http'):
-                            article_content["image_url"] = self.base_url + article_content["image_url"]
-                    
-                    next_p = date_element.parent.find_next('p')
-                    if next_p:
-                        article_content["content"] = next_p.get_text(strip=True)
-                
-                # Extract sections from headings with bulleted lists
-                headings = main_content.find_all(['h2', 'h3', 'h4'])
-                for heading in headings:
-                    section_title = heading.get_text(strip=True)
-                    section_content = ""
-                    bullet_points = []
-                    current = heading.find_next_sibling()
-                    
-                    while current and current.name not in ['h2', 'h3', 'h4']:
-                        if current.name == 'p':
-                            section_content += current.get_text(strip=True) + " "
-                        elif current.name == 'ul':
-                            # Extract bullet points
-                            for li in current.find_all('li'):
-                                bullet_point = li.get_text(strip=True)
-                                if bullet_point:
-                                    bullet_points.append(bullet_point)
-                        current = current.find_next_sibling()
-                    
-                    if section_content.strip() or bullet_points:
-                        section = {
-                            "title": section_title,
-                            "content": section_content.strip(),
-                            "bullet_points": bullet_points
-                        }
-                        article_content["sections"].append(section)
+                article_content.update(self.extract_detail_content(main_content))
             
             return article_content
         except Exception as e:
             logger.error(f"Error getting detailed content: {e}")
             return {"content": "", "sections": [], "image_url": ""}
     
+    def extract_detail_content(self, main_content: Tag) -> Dict:
+        """
+        Extract the intro paragraph, image and sections of an article's main content
+        
+        One walk over the container: the first string holding a listing date
+        anchors the image and intro (the first <img> and <p> after the date's
+        element), and each heading opens a section taking the paragraphs and
+        <ul> items among its following siblings, up to the next heading
+        sibling. Element text is gathered into part buffers while the walk is
+        inside the element and joined once at the end.
+        """
+        sections = []        # (title parts, paragraph parts, bullet parts) in heading order
+        open_sections = {}   # id(parent) -> section its next children belong to
+        list_sections = []   # sections of the open <ul>s whose items are bullets
+        active = []          # part buffers of the open elements whose text is needed
+        open_tags = []       # (tag, position) of the elements the walk is inside
+        paragraphs = []      # (position, tag, parts) of every <p>
+        images = []          # (position, tag) of every <img>
+        date_anchor = None   # (tag, position) of the first date's element
+        position = 0
+        
+        stack = [(child, None) for child in reversed(main_content.contents)]
+        while stack:
+            node, opened = stack.pop()
+            if opened is not None:
+                opened_parts, opened_list = opened
+                if opened_parts:
+                    active.pop()
+                if opened_list:
+                    list_sections.pop()
+                open_tags.pop()
+                continue
+            
+            if not isinstance(node, Tag):
+                if active and type(node) in TEXT_TYPES:
+                    text = node.strip()
+                    if text:
+                        for parts in active:
+                            parts.append(text)
+                # Find the first paragraph after the date and the image below date
+                if date_anchor is None and find_listing_date(node):
+                    date_anchor = open_tags[-1] if open_tags else (main_content, 0)
+                continue
+            
+            position += 1
+            name = node.name
+            parts = None
+            opened_list = False
+            if name in DETAIL_HEADINGS:
+                parts = []
+                open_sections[id(node.parent)] = (parts, [], [])
+                sections.append(open_sections[id(node.parent)])
+            elif name == 'p':
+                parts = []
+                paragraphs.append((position, node, parts))
+                section = open_sections.get(id(node.parent))
+                if section is not None:
+                    section[1].append(parts)
+            elif name == 'ul':
+                section = open_sections.get(id(node.parent))
+                if section is not None:
+                    list_sections.append(section)
+                    opened_list = True
+            elif name == 'li' and list_sections:
+                # Extract bullet points (items of nested lists too)
+                parts = []
+                for section in list_sections:
+                    section[2].append(parts)
+            elif name == 'img':
+                images.append((position, node))
+            
+            if parts is not None:
+                active.append(parts)
+            open_tags.append((node, position))
+            stack.append((node, (parts is not None, opened_list)))
+            stack.extend((child, None) for child in reversed(node.contents))
+        
+        detail = {"content": "", "sections": [], "image_url": ""}
+        if date_anchor:
+            # Past the end of the container only if nothing inside it follows the date
+            anchor, anchor_position = date_anchor
+            img_element = next((tag for tag_position, tag in images if tag_position > anchor_position), None)
+            if img_element is None:
+                img_element = anchor.find_next('img')
+            if img_element and 'src' in img_element.attrs:
+                detail["image_url"] = img_element['src']
+                if not detail["image_url"].startswith('http'):
+                    detail["image_url"] = self.base_url + detail["image_url"]
+            
+            next_p = next((''.join(parts) for tag_position, tag, parts in paragraphs if tag_position > anchor_position), None)
+            if next_p is None:
+                next_p_element = anchor.find_next('p')
+                next_p = next_p_element.get_text(strip=True) if next_p_element else None
+            if next_p is not None:
+                detail["content"] = next_p
+        
+        for title_parts, paragraph_parts, bullet_parts in sections:
+            section_content = " ".join(''.join(parts) for parts in paragraph_parts).strip()
+            bullet_points = [bullet for bullet in (''.join(parts) for parts in bullet_parts) if bullet]
+            if section_content or bullet_points:
+                detail["sections"].append({
+                    "title": ''.join(title_parts),
+                    "content": section_content,
+                    "bullet_points": bullet_points
+                })
+        return detail
+    
+    def mark_existing_articles(self, articles: List[Dict]):
+        """Flag listing items whose URL is already stored with 'exists': True"""
+        if not self.db.conn:
+            return
+        
+        existing = self.db.existing_urls(article['url'] for article in articles)
+        for article in articles:
+            article['exists'] = article['url'] in existing
+    
+    def fetch_detailed_content(self, articles: List[Dict]):
+        """Fetch and merge detailed content for several articles concurrently"""
+        self.merge_detailed_content(articles, self.fetch_detail_responses(articles))
+    
+    def fetch_detail_responses(self, articles: List[Dict]) -> Dict[str, Optional[requests.Response]]:
+        """Fetch the article pages of several articles concurrently, keyed by URL"""
+        urls = list(dict.fromkeys(article['url'] for article in articles))
+        if not urls:
+            return {}
+        logger.info(f"Fetching detailed content for {len(urls)} articles")
+        for url in urls:
+            self.emit(progress_events.URL_RESOLVED, url=url)
+        
+        responses = dict(zip(urls, self.fetcher.fetch_many(urls, token=self.cancel_token)))
+        for url, response in responses.items():
+            if response is not None:
+                self.emit(progress_events.FETCHED, url=url)
+            else:
+                self.emit(progress_events.ERROR, url=url, message="Could not fetch article page")
+        return responses
+    
+    def merge_detailed_content(self, articles: List[Dict], responses: Dict[str, Optional[requests.Response]]):
+        """Parse fetched article pages (once per URL) into their listing articles"""
+        detailed = {url: self.parse_detailed_content(None) for url, response in responses.items() if not response}
+        fetched = [url for url, response in responses.items() if response]
+        pool = get_parse_pool()
+        if pool:
+            detailed.update(zip(fetched, pool.map(parse_detail_page, [(self.base_url, responses[url].content) for url in fetched])))
+        else:
+            detailed.update((url, self.parse_detailed_content(responses[url])) for url in fetched)
+        for url, response in responses.items():
+            if response is not None:
+                self.emit(progress_events.PARSED, url=url)
+        for article_data in articles:
+            detailed_content = detailed.get(article_data['url'])
+            if detailed_content:
+                article_data.update(detailed_content)
+    
     def scrape_page(self, page_url: str, get_detailed_content: bool = True) -> Tuple[List[Dict], Optional[str]]:
         """Scrape articles from a single page"""
         logger.debug(f"Scraping page: {page_url}")
         
-        response = self.fetch_page(page_url)
+        return self.process_listing_page(page_url, self.fetch_page(page_url), get_detailed_content)
+    
+    def process_listing_page(
+        self,
+        page_url: str,
+        response: Optional[requests.Response],
+        get_detailed_content: bool = True
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Extract a fetched listing page's articles (and their detailed content) and the next page URL"""
         if not response:
             return [], None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find article containers - using robust legacy logic
-        article_selectors = [
-            'article',  # Most common
-            '.post',    # Common WordPress
-            '.news-item', 
-            'div[class*="post"]',  # CRITICAL: This is what GKToday uses!
-            '.entry',   # Another common WordPress
-            '.article', 
-            '.type-post',
-            '.blog-post',
-            '.content-area main article'
-        ]
+        pool = get_parse_pool()
+        if pool:
+            # Workers start from this process's selector and report the one that won
+            preferred = _preferred_selectors.get(self.base_url)
+            page_articles, next_page_url, winner = pool.map(
+                parse_listing_page, [(self.base_url, page_url, response.content, preferred)]
+            )[0]
+            if winner:
+                _prefer_selector(self.base_url, winner)
+        else:
+            page_articles, next_page_url = self.parse_listing_html(page_url, response.content)
+        
+        # Get detailed content if requested: resolve existence for the whole page
+        # first so detail pages are only fetched for articles we don't have yet
+        if get_detailed_content and page_articles:
+            self.mark_existing_articles(page_articles)
+            self.fetch_detailed_content([a for a in page_articles if not a.get('exists')])
+        
+        return page_articles, next_page_url
+    
+    def collect_article_containers(self, soup: BeautifulSoup) -> List[Tag]:
+        """
+        Article containers on a listing page, each article once
+        
+        The selectors overlap (an <article class="post type-post"> matches four
+        of them, its <div class="post-inner"> another), so a match is dropped
+        when it was already selected, sits inside a selected container or wraps
+        one, and a match wrapping several matches of its own selector is a list
+        wrapper. The selector that contributed most containers is remembered for
+        the site and tried first on later pages, so it decides which node
+        represents each article.
+        """
+        preferred = _preferred_selectors.get(self.base_url)
+        selectors = ARTICLE_SELECTORS if preferred is None else [preferred] + [s for s in ARTICLE_SELECTORS if s != preferred]
         
         articles = []
-        for selector in article_selectors:
+        selected = set()  # ids of selected containers
+        wrapping = set()  # ids of their ancestors
+        contributed = {}
+        for selector in selectors:
             found = soup.select(selector)
-            if found:
+            # A match wrapping several other matches is a list, not an article
+            matched = {id(element) for element in found}
+            nested = {}
+            for element in found:
+                for parent in element.parents:
+                    if id(parent) in matched:
+                        nested[id(parent)] = nested.get(id(parent), 0) + 1
+            for element in found:
                 # Filter out navigation elements
-                articles.extend([a for a in found if not any(cls in str(a.get('class', [])).lower() 
-                    for cls in ['nav', 'navigation', 'pagina', 'page-numbers'])])
+                if any(cls in str(element.get('class', [])).lower() for cls in ['nav', 'navigation', 'pagina', 'page-numbers']):
+                    continue
+                if id(element) in selected or id(element) in wrapping or nested.get(id(element), 0) > 1:
+                    continue
+                ancestors = [id(parent) for parent in element.parents]
+                if selected.intersection(ancestors):
+                    continue
+                articles.append(element)
+                selected.add(id(element))
+                wrapping.update(ancestors)
+                contributed[selector] = contributed.get(selector, 0) + 1
+        
+        if contributed:
+            _prefer_selector(self.base_url, max(selectors, key=lambda selector: contributed.get(selector, 0)))
+        return articles
+    
+    def parse_listing_html(self, page_url: str, content: bytes) -> Tuple[List[Dict], Optional[str]]:
+        """Extract a listing page's articles and the next page URL from its raw HTML"""
+        soup = make_soup(content, self.html_parser, parse_only=LISTING_PAGE_FILTER)
+        
+        articles = self.collect_article_containers(soup)
         
         # If no articles found with selectors, try finding all links that look like articles (FALLBACK LOGIC)
         if not articles:
             logger.debug("No articles found with selectors, trying fallback link discovery...")
+            # Link discovery walks up from any link, so it needs the whole page
+            soup = make_soup(content, self.html_parser)
             all_links = soup.find_all('a', href=True)
             potential_articles = []
             for link in all_links:
@@ -544,12 +736,6 @@ class EnhancedGKTodayScraper:
         for article_elem in articles:
             article_data = self.extract_article_data(article_elem)
             if article_data:
-                # Get detailed content if requested
-                if get_detailed_content:
-                    detailed_content = self.get_detailed_content(article_data['url'])
-                    if detailed_content:
-                        article_data.update(detailed_content)
-                
                 page_articles.append(article_data)
         
         # Find next page URL
@@ -558,12 +744,103 @@ class EnhancedGKTodayScraper:
         logger.info(f"Found {len(page_articles)} articles on page")
         return page_articles, next_page_url
     
-    def sync_articles(self, max_pages: int = 10, max_articles: int = 100) -> ScrapingResult:
+    def listing_pages(
+        self,
+        max_pages: int,
+        prefetcher: Optional[ListingPrefetcher] = None
+    ) -> Iterator[Tuple[int, str, List[Dict]]]:
+        """Follow the listing pagination, yielding (page number, page URL, listing articles)"""
+        current_url = self.base_url
+        page = 1
+        while current_url and page <= max_pages:
+            logger.info(f"Scraping page {page}: {current_url}")
+            if prefetcher:
+                page_articles, next_url = self.process_listing_page(current_url, prefetcher.response(page), get_detailed_content=False)
+                if next_url:
+                    # Follow the prefetched /page/N/ sequence while pagination continues
+                    next_url = self.listing_page_url(page + 1)
+            else:
+                page_articles, next_url = self.scrape_page(current_url, get_detailed_content=False)
+            self.emit(progress_events.PAGE_DISCOVERED, url=current_url, page=page, count=len(page_articles))
+            
+            yield page, current_url, page_articles
+            current_url = next_url
+            page += 1
+    
+    def plan_listing_pages(
+        self,
+        pages: Iterable[Tuple[int, str, List[Dict]]],
+        max_articles: int,
+        max_consecutive_existing: int
+    ) -> Iterator[Tuple[int, str, List[Dict]]]:
+        """
+        Listing pages with existing articles marked, cut to the articles the sync will reach
+        
+        Mirrors sync_articles' stopping rules (max_articles, and the
+        consecutive-existing check after each page) so the fetch stage never
+        fetches the article pages of articles past the point where the sync
+        stops, and no further listing page is requested once it would stop.
+        """
+        planned = 0
+        consecutive_existing = 0
+        for page, page_url, page_articles in pages:
+            self.mark_existing_articles(page_articles)
+            reached = 0
+            for article in page_articles:
+                if planned >= max_articles:
+                    break
+                if article.get('exists'):
+                    consecutive_existing += 1
+                else:
+                    planned += 1
+                    consecutive_existing = 0
+                reached += 1
+            
+            yield page, page_url, page_articles[:reached]
+            if planned >= max_articles or consecutive_existing >= max_consecutive_existing:
+                return
+    
+    def fetch_page_details(self, work: Tuple[int, str, List[Dict]]) -> Tuple[int, str, List[Dict], Dict]:
+        """Pipeline fetch stage: fetch the article pages of a page's new articles"""
+        page, page_url, page_articles = work
+        responses = self.fetch_detail_responses([a for a in page_articles if not a.get('exists')])
+        return page, page_url, page_articles, responses
+    
+    def parse_page_details(self, work: Tuple[int, str, List[Dict], Dict]) -> Tuple[int, str, List[Dict]]:
+        """Pipeline parse stage: merge a page's fetched article pages into its articles"""
+        page, page_url, page_articles, responses = work
+        self.merge_detailed_content(page_articles, responses)
+        return page, page_url, page_articles
+    
+    def sync_articles(
+        self,
+        max_pages: int = 10,
+        max_articles: int = 100,
+        progress_callback: Optional[Callable[[ScrapingResult], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        event_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        page_concurrency: Optional[int] = None
+    ) -> ScrapingResult:
         """
         Sync latest articles, stopping when existing articles are found
         This is the main method for production use
+        
+        progress_callback, if given, receives a running ScrapingResult after each page.
+        cancel_token, if given, stops the sync at the next page or pending fetch once
+        cancelled; articles already written are kept.
+        event_callback, if given, receives a ProgressEvent for each page and article step.
+        page_concurrency (default SCRAPER_GKTODAY_PAGE_CONCURRENCY) > 1 fetches up to that
+        many /page/N/ listing pages concurrently; pages are still processed in order and
+        the ones fetched ahead are cancelled once the sync stops.
+        
+        Pages run through a fetch -> parse -> write Pipeline, so later pages are fetched
+        and parsed while earlier ones are written; the result's stage_metrics show where
+        the time went. Pages are planned against the stopping rules before the fetch
+        stage (plan_listing_pages), so articles past the stop are never fetched.
         """
         start_time = time.time()
+        self.cancel_token = cancel_token
+        self.event_callback = event_callback
         logger.info(f"Starting GKToday article sync (max_pages: {max_pages}, max_articles: {max_articles})")
         
         if not self.connect_to_db():
@@ -578,71 +855,100 @@ class EnhancedGKTodayScraper:
         articles_scraped = 0
         articles_skipped = 0
         errors = []
-        current_url = self.base_url
-        pages_scraped = 0
         consecutive_existing = 0
         max_consecutive_existing = 5  # Stop after 5 consecutive existing articles
+        finished = False
+        page_concurrency = page_concurrency or PAGE_CONCURRENCY
         
-        try:
-            while current_url and pages_scraped < max_pages and articles_scraped < max_articles:
-                logger.info(f"Scraping page {pages_scraped + 1}: {current_url}")
-                
-                page_articles, next_url = self.scrape_page(current_url, get_detailed_content=True)
-                
-                if not page_articles:
-                    logger.warning("No articles found on page, continuing...")
-                    current_url = next_url
-                    pages_scraped += 1
-                    continue
-                
-                page_new_articles = 0
-                page_existing_articles = 0
-                
-                for article in page_articles:
-                    if articles_scraped >= max_articles:
-                        break
-                    
-                    try:
-                        # Check if article exists before processing
-                        if self.db.article_exists(article['url']):
-                            articles_skipped += 1
-                            page_existing_articles += 1
-                            consecutive_existing += 1
-                            logger.debug(f"Skipping existing article: {article['title']}")
-                        else:
-                            # Insert new article
-                            article_id = self.db.insert_article(article)
-                            if article_id:
-                                articles_scraped += 1
-                                page_new_articles += 1
-                                consecutive_existing = 0  # Reset counter
-                                logger.info(f"✓ Scraped new article: {article['title']}")
-                            else:
-                                articles_skipped += 1
-                                page_existing_articles += 1
-                                consecutive_existing += 1
-                        
-                        # Add rate limiting
-                        time.sleep(self.rate_limit_delay)
-                        
-                    except Exception as e:
-                        error_msg = f"Error processing article {article.get('title', 'Unknown')}: {e}"
-                        logger.error(error_msg)
-                        errors.append(error_msg)
-                
-                logger.info(f"Page {pages_scraped + 1} summary: {page_new_articles} new, {page_existing_articles} existing")
-                
-                # Stop if we've found too many consecutive existing articles
-                if consecutive_existing >= max_consecutive_existing:
-                    logger.info(f"Found {consecutive_existing} consecutive existing articles. Stopping sync.")
+        def write_page(work: Tuple[int, str, List[Dict]]):
+            """Pipeline write stage: store a page's new articles in one transaction and account for them"""
+            nonlocal articles_scraped, articles_skipped, consecutive_existing, finished
+            page, page_url, page_articles = work
+            if finished:
+                return
+            
+            if not page_articles:
+                logger.warning("No articles found on page, continuing...")
+                return
+            
+            page_new_articles = 0
+            page_existing_articles = 0
+            
+            # Write all new articles from this page in one transaction
+            new_articles = [a for a in page_articles if not a.get('exists')][:max_articles - articles_scraped]
+            if cancel_token:
+                cancel_token.raise_if_cancelled()
+            inserted, failed = self.db.insert_articles(new_articles) if new_articles else ({}, {})
+            attempted = {a['url'] for a in new_articles}
+            
+            for article in page_articles:
+                if articles_scraped >= max_articles:
                     break
                 
-                current_url = next_url
-                pages_scraped += 1
-                
-                # Add delay between pages
-                if current_url:
-                    time.sleep(self.rate_limit_delay + 1)
+                url = article['url']
+                if article.get('exists'):
+                    articles_skipped += 1
+                    page_existing_articles += 1
+                    consecutive_existing += 1
+                    logger.debug(f"Skipping existing article: {article['title']}")
+                    self.emit(progress_events.SKIPPED, url=url)
+                elif url not in attempted:
+                    break
+                elif url in failed:
+                    error_msg = f"Error processing article {article.get('title', 'Unknown')}: {failed[url]}"
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+                    self.emit(progress_events.ERROR, url=url, message=error_msg)
+                elif url in inserted:
+                    inserted.pop(url)
+                    articles_scraped += 1
+                    page_new_articles += 1
+                    consecutive_existing = 0  # Reset counter
+                    logger.info(f"✓ Scraped new article: {article['title']}")
+                    self.emit(progress_events.WRITTEN, url=url)
+                else:
+                    articles_skipped += 1
+                    page_existing_articles += 1
+                    consecutive_existing += 1
+                    self.emit(progress_events.SKIPPED, url=url)
+            
+            logger.info(f"Page {page} summary: {page_new_articles} new, {page_existing_articles} existing")
+            
+            if progress_callback:
+                progress_callback(ScrapingResult(
+                    success=len(errors) == 0,
+                    articles_scraped=articles_scraped,
+                    articles_skipped=articles_skipped,
+                    errors=list(errors),
+                    runtime_seconds=time.time() - start_time
+                ))
+            
+            # Stop if we've found too many consecutive existing articles
+            if consecutive_existing >= max_consecutive_existing:
+                logger.info(f"Found {consecutive_existing} consecutive existing articles. Stopping sync.")
+                finished = True
+            elif articles_scraped >= max_articles:
+                finished = True
+        
+        pipeline = Pipeline([
+            Stage('fetch', self.fetch_page_details, FETCH_WORKERS),
+            Stage('parse', self.parse_page_details, PARSE_WORKERS),
+            Stage('write', write_page, ordered=True)
+        ], token=cancel_token)
+        # Closing the pipeline also cancels whatever it fetched ahead
+        self.cancel_token = pipeline.token
+        prefetcher = ListingPrefetcher(self, max_pages, page_concurrency, pipeline.token) if page_concurrency > 1 else None
+        
+        try:
+            pages = self.plan_listing_pages(self.listing_pages(max_pages, prefetcher), max_articles, max_consecutive_existing)
+            for _ in pipeline.run(pages):
+                if finished:
+                    break
+        
+        except ScrapeCancelled as e:
+            error_msg = f"GKToday sync cancelled: {e}"
+            logger.warning(error_msg)
+            errors.append(error_msg)
         
         except Exception as e:
             error_msg = f"Critical error during scraping: {e}"
@@ -650,6 +956,11 @@ class EnhancedGKTodayScraper:
             errors.append(error_msg)
         
         finally:
+            pipeline.close()
+            if prefetcher:
+                prefetcher.close()
+            self.cancel_token = None
+            self.event_callback = None
             self.db.close()
         
         runtime = time.time() - start_time
@@ -659,9 +970,11 @@ class EnhancedGKTodayScraper:
             articles_scraped=articles_scraped,
             articles_skipped=articles_skipped,
             errors=errors,
-            runtime_seconds=runtime
+            runtime_seconds=runtime,
+            stage_metrics=pipeline.metrics_dict()
         )
         
+        logger.info(f"GKToday pipeline stages: {format_metrics(result.stage_metrics)}")
         logger.info(f"GKToday sync completed: {articles_scraped} new articles, {articles_skipped} skipped, {runtime:.2f}s")
         
         return result
@@ -671,6 +984,38 @@ class EnhancedGKTodayScraper:
         if self.db:
             self.db.close()
 
+# Parsing-only scraper of a parse-pool worker process (see parse_pool.py)
+_pool_scraper: Optional[EnhancedGKTodayScraper] = None
+
+def _pool_parser(base_url: str) -> EnhancedGKTodayScraper:
+    """This process's parsing scraper, pointed at base_url"""
+    global _pool_scraper
+    if _pool_scraper is None:
+        _pool_scraper = EnhancedGKTodayScraper()
+    _pool_scraper.base_url = base_url
+    return _pool_scraper
+
+def parse_listing_page(
+    base_url: str,
+    page_url: str,
+    content: bytes,
+    preferred: Optional[str] = None
+) -> Tuple[List[Dict], Optional[str], Optional[str]]:
+    """
+    Parse-pool task: a listing page's articles, next page URL and preferred article selector
+
+    The worker tries the parent's preferred selector first and returns the one
+    preferred after this page, so the choice doesn't depend on which worker
+    parsed the page.
+    """
+    _prefer_selector(base_url, preferred)
+    page_articles, next_page_url = _pool_parser(base_url).parse_listing_html(page_url, content)
+    return page_articles, next_page_url, _preferred_selectors.get(base_url)
+
+def parse_detail_page(base_url: str, content: bytes) -> Dict:
+    """Parse-pool task: an article page's detailed content"""
+    return _pool_parser(base_url).parse_detailed_html(content)
+
 def main():
     """Main function for testing"""
     import argparse
@@ -0,0 +1,303 @@
+"""
+Durable store for scrape runs shared by every process on the host
+A local SQLite file (WAL mode) so the daemon, cli.py and ad-hoc runs see the
+same job state, and status polling is a cheap indexed read
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import closing, contextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrape_runs.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrape_runs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    options TEXT,
+    current_scraper TEXT,
+    articles_scraped INTEGER NOT NULL DEFAULT 0,
+    articles_skipped INTEGER NOT NULL DEFAULT 0,
+    errors TEXT NOT NULL DEFAULT '[]',
+    progress_percentage REAL NOT NULL DEFAULT 0,
+    estimated_remaining_seconds INTEGER,
+    result TEXT,
+    pid INTEGER,
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    completed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scrape_runs_started_at ON scrape_runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_scrape_runs_status ON scrape_runs(status);
+
+CREATE TABLE IF NOT EXISTS scrape_run_sources (
+    run_id TEXT NOT NULL REFERENCES scrape_runs(id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    status TEXT NOT NULL,
+    articles_scraped INTEGER NOT NULL DEFAULT 0,
+    articles_skipped INTEGER NOT NULL DEFAULT 0,
+    errors TEXT NOT NULL DEFAULT '[]',
+    runtime_seconds REAL NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, source)
+);
+"""
+
+# Columns update_run() may set
+RUN_FIELDS = (
+    'status', 'current_scraper', 'articles_scraped', 'articles_skipped', 'errors',
+    'progress_percentage', 'estimated_remaining_seconds', 'result', 'completed_at'
+)
+JSON_FIELDS = ('options', 'errors', 'result')
+
+def _now() -> str:
+    """Timestamp format used for all stored times"""
+    return datetime.now().isoformat()
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    """Whether a process with this pid is still running on this host"""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+class JobStore:
+    """SQLite-backed record of scrape runs and their per-source counters"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv('SCRAPER_JOB_DB', DEFAULT_PATH)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection, committed on success (safe to use from any thread)"""
+        with closing(sqlite3.connect(self.path, timeout=10)) as conn:
+            conn.row_factory = sqlite3.Row
+            with conn:
+                yield conn
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a row to a dict, decoding JSON columns"""
+        data = dict(row)
+        for field in JSON_FIELDS:
+            if field in data and data[field] is not None:
+                data[field] = json.loads(data[field])
+        return data
+
+    def create_run(self, options: Dict[str, Any]) -> str:
+        """Record a new running job and return its id"""
+        run_id = uuid.uuid4().hex
+        now = _now()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO scrape_runs (id, status, options, pid, started_at, updated_at)
+                VALUES (?, 'running', ?, ?, ?, ?)
+                """,
+                (run_id, json.dumps(options), os.getpid(), now, now)
+            )
+        return run_id
+
+    def update_run(self, run_id: str, **fields):
+        """Update run columns (see RUN_FIELDS); JSON columns take Python values"""
+        unknown = set(fields) - set(RUN_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown scrape_runs fields: {', '.join(sorted(unknown))}")
+
+        values = {
+            key: json.dumps(value, default=str) if key in JSON_FIELDS else value
+            for key, value in fields.items()
+        }
+        values['updated_at'] = _now()
+        assignments = ', '.join(f"{key} = ?" for key in values)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE scrape_runs SET {assignments} WHERE id = ?", (*values.values(), run_id))
+
+    def update_source(
+        self,
+        run_id: str,
+        source: str,
+        status: str,
+        articles_scraped: int = 0,
+        articles_skipped: int = 0,
+        errors: Optional[List[str]] = None,
+        runtime_seconds: float = 0
+    ):
+        """Upsert the counters for one source and roll the totals up into the run"""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO scrape_run_sources
+                    (run_id, source, status, articles_scraped, articles_skipped, errors, runtime_seconds, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (run_id, source) DO UPDATE SET
+                    status = excluded.status,
+                    articles_scraped = excluded.articles_scraped,
+                    articles_skipped = excluded.articles_skipped,
+                    errors = excluded.errors,
+                    runtime_seconds = excluded.runtime_seconds,
+                    updated_at = excluded.updated_at
+                """,
+                (run_id, source, status, articles_scraped, articles_skipped,
+                 json.dumps(errors or []), runtime_seconds, _now())
+            )
+            conn.execute(
+                """
+                UPDATE scrape_runs SET
+                    articles_scraped = (SELECT COALESCE(SUM(articles_scraped), 0) FROM scrape_run_sources WHERE run_id = ?),
+                    articles_skipped = (SELECT COALESCE(SUM(articles_skipped), 0) FROM scrape_run_sources WHERE run_id = ?),
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (run_id, run_id, _now(), run_id)
+            )
+
+    def finish_run(self, run_id: str, status: str, **fields) -> Optional[str]:
+        """
+        Close a run with its final status and return the status stored
+
+        A run cancelled in the meantime (from any process) stays cancelled; the
+        other fields are still recorded. Sources still marked running take the
+        stored status.
+        """
+        unknown = set(fields) - set(RUN_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown scrape_runs fields: {', '.join(sorted(unknown))}")
+
+        fields.setdefault('completed_at', _now())
+        values = {
+            key: json.dumps(value, default=str) if key in JSON_FIELDS else value
+            for key, value in fields.items()
+        }
+        values['updated_at'] = _now()
+        assignments = ''.join(f", {key} = ?" for key in values)
+        with self._connect() as conn:
+            conn.execute(
+                f"UPDATE scrape_runs SET status = CASE WHEN status = 'cancelled' THEN status ELSE ? END{assignments} WHERE id = ?",
+                (status, *values.values(), run_id)
+            )
+            row = conn.execute("SELECT status FROM scrape_runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE scrape_run_sources SET status = ?, updated_at = ? WHERE run_id = ? AND status = 'running'",
+                (row['status'], _now(), run_id)
+            )
+        return row['status']
+
+    def cancel_run(self, run_id: str) -> bool:
+        """Mark a running run as cancelled; returns False if it had already finished"""
+        now = _now()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE scrape_runs SET status = 'cancelled', completed_at = ?, updated_at = ?
+                WHERE id = ? AND status = 'running'
+                """,
+                (now, now, run_id)
+            )
+            if cursor.rowcount == 0:
+                return False
+            conn.execute(
+                "UPDATE scrape_run_sources SET status = 'cancelled', updated_at = ? WHERE run_id = ? AND status = 'running'",
+                (now, run_id)
+            )
+        return True
+
+    def run_status(self, run_id: str) -> Optional[str]:
+        """Just the status of a run (cheap enough to poll), or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT status FROM scrape_runs WHERE id = ?", (run_id,)).fetchone()
+        return row['status'] if row else None
+
+    def _with_sources(self, conn: sqlite3.Connection, run: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach per-source counters to a run dict"""
+        rows = conn.execute(
+            "SELECT * FROM scrape_run_sources WHERE run_id = ? ORDER BY source", (run['id'],)
+        ).fetchall()
+        run['sources'] = {}
+        for row in rows:
+            source = self._row_to_dict(row)
+            del source['run_id']
+            run['sources'][source.pop('source')] = source
+        return run
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """A run with its per-source counters, or None"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM scrape_runs WHERE id = ?", (run_id,)).fetchone()
+            return self._with_sources(conn, self._row_to_dict(row)) if row else None
+
+    def latest_run(self, with_result: bool = False) -> Optional[Dict[str, Any]]:
+        """The most recently started run (optionally the latest one with a result)"""
+        query = "SELECT * FROM scrape_runs"
+        if with_result:
+            query += " WHERE result IS NOT NULL"
+        query += " ORDER BY started_at DESC LIMIT 1"
+        with self._connect() as conn:
+            row = conn.execute(query).fetchone()
+            return self._with_sources(conn, self._row_to_dict(row)) if row else None
+
+    def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Recent runs, newest first, without per-source detail or results"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, status, articles_scraped, articles_skipped, started_at, completed_at
+                FROM scrape_runs ORDER BY started_at DESC LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def fail_orphaned_runs(self) -> int:
+        """Mark runs whose owning process has died as failed; returns how many"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT id, pid, errors FROM scrape_runs WHERE status = 'running'").fetchall()
+            orphaned = [row for row in rows if not _pid_alive(row['pid'])]
+            now = _now()
+            for row in orphaned:
+                errors = json.loads(row['errors']) + ["Scraping process exited before the run finished"]
+                conn.execute(
+                    """
+                    UPDATE scrape_runs SET status = 'failed', errors = ?, completed_at = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (json.dumps(errors), now, now, row['id'])
+                )
+                conn.execute(
+                    "UPDATE scrape_run_sources SET status = 'failed', updated_at = ? WHERE run_id = ? AND status = 'running'",
+                    (now, row['id'])
+                )
+        if orphaned:
+            logger.warning(f"Marked {len(orphaned)} orphaned scrape run(s) as failed")
+        return len(orphaned)
+
+# Process-wide store
+_job_store = None
+_job_store_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """Get the global job store instance"""
+    global _job_store
+    with _job_store_lock:
+        if _job_store is None:
+            _job_store = JobStore()
+        return _job_store
@@ -0,0 +1,143 @@
+"""
+Versioned schema migrations for the scraper database
+Ordered SQL files in migrations/ are applied once each and recorded in the
+schema_migrations table; scrapers only check the recorded version on startup
+"""
+
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import List
+
+from psycopg2 import errors
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+# Arbitrary key for pg_advisory_xact_lock so concurrent runners migrate one at a time
+MIGRATION_LOCK_ID = 724_115_001
+
+_FILENAME_PATTERN = re.compile(r'^(\d+)_([\w-]+)\.sql$')
+
+@dataclass
+class Migration:
+    """A single migration file"""
+    version: int
+    name: str
+    path: str
+
+    def read_sql(self) -> str:
+        """Read the migration's SQL"""
+        with open(self.path, encoding='utf-8') as f:
+            return f.read()
+
+def load_migrations(directory: str = MIGRATIONS_DIR) -> List[Migration]:
+    """Load migration files named NNNN_description.sql, ordered by version"""
+    migrations = []
+    for filename in os.listdir(directory):
+        match = _FILENAME_PATTERN.match(filename)
+        if match:
+            migrations.append(Migration(int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+
+    migrations.sort(key=lambda m: m.version)
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+def latest_version() -> int:
+    """Version of the newest migration shipped with the code"""
+    migrations = load_migrations()
+    return migrations[-1].version if migrations else 0
+
+def current_version(conn) -> int:
+    """Highest migration version recorded in the database (0 if never migrated)"""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+            return cursor.fetchone()[0]
+    except errors.UndefinedTable:
+        conn.rollback()
+        return 0
+
+def migrate(conn) -> List[Migration]:
+    """
+    Apply all pending migrations in one transaction and commit
+
+    Returns:
+        The migrations that were applied (empty if already up to date)
+    """
+    applied = []
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    applied_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("SELECT version FROM schema_migrations")
+            done = {row[0] for row in cursor.fetchall()}
+
+            for migration in load_migrations():
+                if migration.version in done:
+                    continue
+                logger.info(f"Applying migration {migration.version:04d}_{migration.name}")
+                cursor.execute(migration.read_sql())
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                    (migration.version, migration.name)
+                )
+                applied.append(migration)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+    if applied:
+        logger.info(f"Applied {len(applied)} migration(s), schema now at version {applied[-1].version}")
+    return applied
+
+# Set once this process has seen an up-to-date schema
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+def ensure_schema(conn):
+    """
+    Make sure the database schema is current before scraping
+
+    A single version query per process; pending migrations are applied only
+    when the database is behind the code (e.g. a fresh database).
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+
+    with _schema_lock:
+        if _schema_ready:
+            return
+
+        target = latest_version()
+        version = current_version(conn)
+        if version < target:
+            logger.info(f"Database schema at version {version}, migrating to {target}")
+            migrate(conn)
+        elif version > target:
+            logger.warning(f"Database schema version {version} is newer than this code ({target})")
+        else:
+            logger.debug(f"Database schema up to date (version {version})")
+
+        _schema_ready = True
+
+def reset_schema_cache():
+    """Forget the cached schema check (after wiping the database)"""
+    global _schema_ready
+    with _schema_lock:
+        _schema_ready = False
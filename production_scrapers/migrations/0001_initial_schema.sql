@@ -0,0 +1,31 @@
+-- Article content shared by the GKToday and DrishtiIAS scrapers
+CREATE TABLE IF NOT EXISTS gk_today_content (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    title TEXT NOT NULL,
+    url TEXT UNIQUE NOT NULL,
+    image_url TEXT,
+    published_date DATE,
+    source_name TEXT DEFAULT 'GKToday',
+    scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    intro TEXT,
+    sequence_order INTEGER,
+    importance_rating TEXT,
+    date TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS sections (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    article_id UUID REFERENCES gk_today_content(id) ON DELETE CASCADE,
+    heading TEXT,
+    content TEXT,
+    type TEXT CHECK (type IN ('paragraph', 'list')),
+    sequence_order INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS section_bullets (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    section_id UUID REFERENCES sections(id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    bullet_order INTEGER
+);
@@ -0,0 +1,10 @@
+-- Databases created by older scraper versions may predate these columns
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS image_url TEXT;
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS published_date DATE;
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS source_name TEXT DEFAULT 'GKToday';
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS intro TEXT;
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS sequence_order INTEGER;
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS importance_rating TEXT;
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS date TEXT;
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE gk_today_content ADD COLUMN IF NOT EXISTS created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
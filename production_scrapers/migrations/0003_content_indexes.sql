@@ -0,0 +1,3 @@
+CREATE INDEX IF NOT EXISTS idx_gk_today_content_source_name ON gk_today_content(source_name);
+CREATE INDEX IF NOT EXISTS idx_gk_today_content_published_date ON gk_today_content(published_date);
+CREATE INDEX IF NOT EXISTS idx_gk_today_content_scraped_at ON gk_today_content(scraped_at);
@@ -0,0 +1,17 @@
+-- Flat articles table read by get_latest_articles and managed by db_manager.py
+CREATE TABLE IF NOT EXISTS articles (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    source TEXT NOT NULL,
+    url TEXT UNIQUE NOT NULL,
+    published_date DATE,
+    importance TEXT,
+    tags TEXT[],
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
+CREATE INDEX IF NOT EXISTS idx_articles_published_date ON articles(published_date);
+CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at);
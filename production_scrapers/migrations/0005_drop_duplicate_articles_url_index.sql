@@ -0,0 +1,2 @@
+-- idx_articles_url duplicated the index behind articles.url's UNIQUE constraint
+DROP INDEX IF EXISTS idx_articles_url;
@@ -0,0 +1,88 @@
+"""
+Process pool for the scrapers' parse stage
+BeautifulSoup parsing is CPU-bound and holds the GIL, so threads parsing in
+parallel (CombinedScraper sources, pipeline parse workers) take turns; with
+SCRAPER_PARSE_PROCESSES > 0 raw page bytes are parsed in worker processes
+instead and plain article dicts come back, so parse throughput scales with cores
+"""
+
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Worker processes parsing pages (0 = parse in the calling thread)
+PARSE_PROCESSES = int(os.getenv('SCRAPER_PARSE_PROCESSES', '0'))
+
+class ParsePool:
+    """
+    Lazily started pool of parse worker processes
+
+    Workers are spawned rather than forked, since the scrapers' processes run
+    the fetch engine and pipeline threads. Functions sent to the pool must be
+    module-level so they can be pickled by reference.
+    """
+
+    def __init__(self, processes: int = PARSE_PROCESSES):
+        self.processes = processes
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Start the worker processes on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+                logger.info(f"Parse pool started with {self.processes} processes")
+            return self._executor
+
+    def map(self, func: Callable[..., Any], calls: Sequence[tuple]) -> List[Any]:
+        """Run func(*args) for each args in calls on the worker processes; results in call order"""
+        if not calls:
+            return []
+        executor = self._ensure_started()
+        futures = [executor.submit(func, *args) for args in calls]
+        try:
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool on the next call
+            logger.error("Parse pool worker died; restarting the pool")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        """Stop the worker processes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+            logger.debug("Parse pool closed")
+
+# Process-wide pool shared by every scraper and pipeline
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def get_parse_pool() -> Optional[ParsePool]:
+    """Get the global parse pool, or None when SCRAPER_PARSE_PROCESSES is 0"""
+    global _parse_pool
+    if PARSE_PROCESSES <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool(PARSE_PROCESSES)
+        return _parse_pool
@@ -0,0 +1,146 @@
+"""
+Selectable HTML parser backend for the scrapers
+SCRAPER_HTML_PARSER picks what turns page bytes into the BeautifulSoup tree
+that the extraction code walks: 'html.parser' (pure Python, the default),
+'lxml' (libxml2) or 'selectolax' (lexbor). The fast backends need their
+optional package installed; without it the scrapers fall back to html.parser.
+Listing and day pages are parsed with a TagFilter so only the article,
+heading and pagination subtrees are built
+"""
+
+import logging
+import os
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from bs4 import BeautifulSoup, Comment, UnicodeDammit
+from bs4.builder import HTMLTreeBuilder
+from bs4.filter import ElementFilter
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = 'html.parser'
+BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+HTML_PARSER = os.getenv('SCRAPER_HTML_PARSER', DEFAULT_BACKEND)
+
+# Build only the parts of listing and day pages the extractors read (0 = full DOM)
+PARTIAL_PARSE = os.getenv('SCRAPER_PARTIAL_PARSE', '1') != '0'
+
+class SelectolaxTreeBuilder(HTMLTreeBuilder):
+    """Builds a BeautifulSoup tree from a document parsed by selectolax's lexbor engine"""
+
+    NAME = 'selectolax'
+    ALTERNATE_NAMES = ['lexbor']
+    features = [NAME, 'html', 'fast']
+    is_xml = False
+    picklable = True
+
+    def prepare_markup(self, markup, user_specified_encoding=None, document_declared_encoding=None, exclude_encodings=None):
+        """Decode bytes the way BeautifulSoup does, so every backend sees the same text"""
+        if isinstance(markup, str):
+            yield markup, None, None, False
+            return
+        known = [user_specified_encoding] if user_specified_encoding else []
+        dammit = UnicodeDammit(markup, known, is_html=True, exclude_encodings=exclude_encodings)
+        yield dammit.unicode_markup, dammit.original_encoding, dammit.declared_html_encoding, dammit.contains_replacement_characters
+
+    def feed(self, markup: str):
+        """Replay the lexbor tree as start tag / data / end tag events"""
+        from selectolax.lexbor import LexborHTMLParser
+
+        # Iterative walk: (node, closing) pairs, children pushed in reverse
+        stack = [(LexborHTMLParser(markup).root, False)]
+        while stack:
+            node, closing = stack.pop()
+            if closing:
+                self.soup.endData()
+                self.soup.handle_endtag(node.tag)
+                continue
+            if node.tag == '-text':
+                self.soup.handle_data(node.text_content)
+            elif node.tag == '-comment':
+                self.soup.endData()
+                self.soup.handle_data(node.comment_content or '')
+                self.soup.endData(Comment)
+            elif node.tag and node.tag[0] not in '-#_':
+                attrs = {name: value if value is not None else '' for name, value in node.attributes.items()}
+                self.soup.handle_starttag(node.tag, None, None, attrs)
+                stack.append((node, True))
+                children = []
+                child = node.child
+                while child is not None:
+                    children.append(child)
+                    child = child.next
+                stack.extend((child, False) for child in reversed(children))
+
+    def test_fragment_to_document(self, fragment: str) -> str:
+        """See HTMLTreeBuilder"""
+        return f"<html><head></head><body>{fragment}</body></html>"
+
+class TagFilter(ElementFilter):
+    """
+    parse_only filter that builds only the subtrees an extractor reads
+
+    A tag is kept, with everything inside it, when its name is in names, its
+    class attribute contains one of class_substrings, or keep(name, attrs) is
+    true. Nothing outside kept tags is built, so selectors that match kept tags
+    find exactly what they find in the full tree, minus the cost of the rest.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        class_substrings: Iterable[str] = (),
+        keep: Optional[Callable[[str, Dict[str, str]], bool]] = None
+    ):
+        self.names = frozenset(names)
+        self.class_substrings = tuple(class_substrings)
+        self.keep = keep
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Optional[Dict[str, str]]) -> bool:
+        """Called for tags outside every kept subtree (attribute values are still raw strings)"""
+        if name in self.names:
+            return True
+        attrs = attrs or {}
+        classes = attrs.get('class') or ''
+        if any(substring in classes for substring in self.class_substrings):
+            return True
+        return bool(self.keep and self.keep(name, attrs))
+
+    def allow_string_creation(self, string: str) -> bool:
+        """Text outside kept tags is dropped"""
+        return False
+
+def available_backends() -> List[str]:
+    """Backends whose packages are installed"""
+    available = [DEFAULT_BACKEND]
+    for backend, module in (('lxml', 'lxml'), ('selectolax', 'selectolax.lexbor')):
+        try:
+            __import__(module)
+            available.append(backend)
+        except ImportError:
+            pass
+    return available
+
+@lru_cache(maxsize=None)
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """Backend to use for a requested name (default SCRAPER_HTML_PARSER), falling back to html.parser"""
+    backend = backend or HTML_PARSER
+    if backend not in BACKENDS:
+        logger.warning(f"Unknown HTML parser backend {backend!r}; using {DEFAULT_BACKEND}")
+        return DEFAULT_BACKEND
+    if backend not in available_backends():
+        logger.warning(f"HTML parser backend {backend!r} is not installed; using {DEFAULT_BACKEND}")
+        return DEFAULT_BACKEND
+    return backend
+
+def make_soup(content: Union[bytes, str], backend: Optional[str] = None, parse_only: Optional[ElementFilter] = None) -> BeautifulSoup:
+    """Parse page content into a BeautifulSoup tree with the configured backend (only parse_only's subtrees if given)"""
+    backend = resolve_backend(backend)
+    if parse_only is not None and not PARTIAL_PARSE:
+        parse_only = None
+    if backend == 'selectolax':
+        return BeautifulSoup(content, builder=SelectolaxTreeBuilder(), parse_only=parse_only)
+    return BeautifulSoup(content, backend, parse_only=parse_only)
@@ -0,0 +1,250 @@
+"""
+Staged fetch -> parse -> write pipeline for the scrapers
+Work items (a GKToday listing page, a DrishtiIAS day) flow from a source
+through stages connected by bounded queues, so network, parsing and database
+time overlap; when a stage falls behind (e.g. Postgres is slow) its input
+queue fills up and the stages before it block instead of racing ahead
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from cancellation import CancellationToken
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Work items buffered between two stages
+QUEUE_SIZE = int(os.getenv('SCRAPER_PIPELINE_QUEUE_SIZE', '2'))
+# Worker threads of the fetch and parse stages (the write stage is a single ordered worker)
+FETCH_WORKERS = int(os.getenv('SCRAPER_PIPELINE_FETCH_WORKERS', '2'))
+PARSE_WORKERS = int(os.getenv('SCRAPER_PIPELINE_PARSE_WORKERS', '1'))
+
+# How often blocked workers check whether the pipeline was stopped
+POLL_SECONDS = 0.1
+
+_DONE = object()
+
+@dataclass
+class Stage:
+    """A pipeline stage: func maps each work item to the item passed downstream"""
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    ordered: bool = False  # receive items in source order (single worker only)
+
+@dataclass
+class StageMetrics:
+    """Where a stage spent its time, summed over its workers"""
+    name: str
+    workers: int
+    items: int = 0
+    busy_seconds: float = 0.0     # running the stage function
+    starved_seconds: float = 0.0  # waiting for the previous stage
+    blocked_seconds: float = 0.0  # waiting for room in the next stage's queue (backpressure)
+    max_queue: int = 0            # deepest input queue seen
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        data = asdict(self)
+        for key in ('busy_seconds', 'starved_seconds', 'blocked_seconds'):
+            data[key] = round(data[key], 3)
+        return data
+
+def format_metrics(metrics: Dict[str, Dict[str, Any]]) -> str:
+    """One-line summary of stage metrics as returned by Pipeline.metrics_dict()"""
+    return " | ".join(
+        f"{name}: {m['items']} items, {m['busy_seconds']:.2f}s busy, "
+        f"{m['starved_seconds']:.2f}s starved, {m['blocked_seconds']:.2f}s blocked"
+        for name, m in metrics.items()
+    )
+
+class Pipeline:
+    """
+    Runs work items through a chain of stages on worker threads
+
+    queues[i] feeds stages[i] and queues[-1] holds finished items; every queue
+    holds at most queue_size items. The first exception raised by the source
+    or a stage stops the pipeline and is re-raised by run(). Stage functions
+    should fetch with pipeline.token so that close() also cancels their
+    in-flight requests.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = QUEUE_SIZE, token: Optional[CancellationToken] = None):
+        for stage in stages:
+            if stage.ordered and stage.workers != 1:
+                raise ValueError(f"Ordered stage {stage.name} must have a single worker")
+        self.stages = stages
+        self.token = CancellationToken(parent=token)
+        self.queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in range(len(stages) + 1)]
+        self.metrics = {'source': StageMetrics('source', 1)}
+        for stage in stages:
+            self.metrics[stage.name] = StageMetrics(stage.name, max(1, stage.workers))
+        self._stopped = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self.token.add_callback(self._stopped.set)
+
+    def metrics_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage metrics, source first"""
+        with self._lock:
+            return {name: metrics.to_dict() for name, metrics in self.metrics.items()}
+
+    def run(self, items: Iterable[Any]) -> Iterator[Any]:
+        """Feed items through the stages, yielding the last stage's results in source order"""
+        self._start(items)
+        pending = {}
+        next_seq = 0
+        try:
+            while True:
+                entry = self._get(self.queues[-1])
+                if entry is None or entry is _DONE:
+                    break
+                seq, result = entry
+                pending[seq] = result
+                while next_seq in pending:
+                    yield pending.pop(next_seq)
+                    next_seq += 1
+            if self._error is not None:
+                raise self._error
+            self.token.raise_if_cancelled()
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop the pipeline, cancel in-flight work and wait for the workers to exit"""
+        self.token.cancel("pipeline closed")
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.token.close()
+
+    def _start(self, items: Iterable[Any]):
+        """Start the source thread and every stage's workers"""
+        self._threads.append(threading.Thread(target=self._feed, args=(items,), name="pipeline-source", daemon=True))
+        for index, stage in enumerate(self.stages):
+            remaining = [max(1, stage.workers)]
+            for n in range(max(1, stage.workers)):
+                self._threads.append(threading.Thread(
+                    target=self._work,
+                    args=(index, stage, remaining),
+                    name=f"pipeline-{stage.name}-{n}",
+                    daemon=True
+                ))
+        for thread in self._threads:
+            thread.start()
+
+    def _fail(self, error: BaseException):
+        """Record the first error and stop every stage"""
+        with self._lock:
+            if self._error is None and not self._stopped.is_set():
+                self._error = error
+        self._stopped.set()
+
+    def _get(self, inbox: queue.Queue):
+        """Next entry of inbox, or None once the pipeline is stopped"""
+        while not self._stopped.is_set():
+            try:
+                return inbox.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return None
+
+    def _put(self, outbox: queue.Queue, entry) -> bool:
+        """Put entry on outbox, waiting for room; False once the pipeline is stopped"""
+        while not self._stopped.is_set():
+            try:
+                outbox.put(entry, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _record(self, metrics: StageMetrics, busy: float = 0.0, starved: float = 0.0, blocked: float = 0.0, depth: int = 0):
+        """Add timings to a stage's metrics"""
+        with self._lock:
+            metrics.busy_seconds += busy
+            metrics.starved_seconds += starved
+            metrics.blocked_seconds += blocked
+            metrics.max_queue = max(metrics.max_queue, depth)
+
+    def _feed(self, items: Iterable[Any]):
+        """Source thread: number the items and queue them for the first stage"""
+        metrics = self.metrics['source']
+        outbox = self.queues[0]
+        try:
+            iterator = iter(items)
+            seq = 0
+            while not self._stopped.is_set():
+                started = time.monotonic()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self._put(outbox, _DONE)
+                    return
+                produced = time.monotonic()
+                metrics.items += 1
+                if not self._put(outbox, (seq, item)):
+                    return
+                self._record(metrics, busy=produced - started, blocked=time.monotonic() - produced)
+                seq += 1
+        except BaseException as e:
+            self._fail(e)
+
+    def _work(self, index: int, stage: Stage, remaining: List[int]):
+        """Stage worker: apply stage.func to each item and pass the result on"""
+        metrics = self.metrics[stage.name]
+        inbox, outbox = self.queues[index], self.queues[index + 1]
+        pending = {}  # ordered stages: items that arrived ahead of their turn
+        next_seq = 0
+        try:
+            while True:
+                waiting = time.monotonic()
+                if stage.ordered:
+                    while next_seq not in pending:
+                        entry = self._get(inbox)
+                        if entry is None or entry is _DONE:
+                            break
+                        pending[entry[0]] = entry[1]
+                    else:
+                        entry = (next_seq, pending.pop(next_seq))
+                        next_seq += 1
+                else:
+                    entry = self._get(inbox)
+
+                if entry is None:
+                    return
+                if entry is _DONE:
+                    # Let sibling workers see the end too; the last one out passes it on
+                    with self._lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last:
+                        self._put(outbox, _DONE)
+                    else:
+                        self._put(inbox, _DONE)
+                    return
+
+                started = time.monotonic()
+                seq, item = entry
+                result = stage.func(item)
+                finished = time.monotonic()
+                with self._lock:
+                    metrics.items += 1
+                if not self._put(outbox, (seq, result)):
+                    return
+                self._record(
+                    metrics,
+                    busy=finished - started,
+                    starved=started - waiting,
+                    blocked=time.monotonic() - finished,
+                    depth=inbox.qsize() + 1
+                )
+        except BaseException as e:
+            self._fail(e)
@@ -0,0 +1,165 @@
+"""
+Structured progress events emitted by the scrapers during a run
+The scrapers report each step (page discovered, URL resolved, fetched, parsed,
+written, skipped, error) through an event callback; ScraperService adds
+run-level events and publishes everything on an EventStream that the daemon
+serves as NDJSON or Server-Sent Events
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Scraper events
+PAGE_DISCOVERED = 'page_discovered'  # listing/day page visited; count = article links found
+URL_RESOLVED = 'url_resolved'        # article URL is new and queued for fetching
+FETCHED = 'fetched'                  # article page downloaded
+PARSED = 'parsed'                    # article page parsed into a record
+WRITTEN = 'written'                  # article inserted into the database
+SKIPPED = 'skipped'                  # article already stored
+ERROR = 'error'                      # a page or article failed; see message
+SCRAPER_EVENTS = (PAGE_DISCOVERED, URL_RESOLVED, FETCHED, PARSED, WRITTEN, SKIPPED, ERROR)
+
+# Run events added by ScraperService
+RUN_STARTED = 'run_started'
+SOURCE_FINISHED = 'source_finished'
+PROGRESS = 'progress'                # rolled-up counters, throughput and ETA in data
+RUN_FINISHED = 'run_finished'
+
+@dataclass
+class ProgressEvent:
+    """A single progress event"""
+    type: str
+    source: Optional[str] = None
+    url: Optional[str] = None
+    page: Optional[int] = None
+    count: Optional[int] = None
+    message: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    timestamp: float = field(default_factory=time.time)
+    run_id: Optional[str] = None
+    seq: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization, omitting empty fields"""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+class EventStream:
+    """
+    Sequence-numbered buffer of a run's events that any number of readers can tail
+
+    The most recent maxlen events are kept, so a reader that connects late (or
+    reconnects with the last sequence number it saw) catches up before
+    receiving new events.
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._events = deque(maxlen=maxlen)
+        self._seq = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the run has finished publishing"""
+        return self._closed
+
+    def publish(self, event: ProgressEvent) -> ProgressEvent:
+        """Assign the next sequence number and wake up readers"""
+        with self._cond:
+            self._seq += 1
+            event.seq = self._seq
+            self._events.append(event)
+            self._cond.notify_all()
+        return event
+
+    def close(self):
+        """Mark the stream finished; readers stop once they have drained it"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def since(self, seq: int = 0, timeout: Optional[float] = None) -> List[ProgressEvent]:
+        """Events after seq, waiting up to timeout for one to arrive (empty on timeout or close)"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq > seq or self._closed, timeout)
+            return [event for event in self._events if event.seq > seq]
+
+    def follow(self, since: int = 0, heartbeat: float = 15) -> Iterator[Optional[ProgressEvent]]:
+        """
+        Yield events after sequence number since as they are published, until the stream is closed
+
+        Yields None every heartbeat seconds without events so callers can keep
+        their connection alive (and notice a disconnected client).
+        """
+        seq = since
+        while True:
+            events = self.since(seq, heartbeat)
+            if not events:
+                if self._closed:
+                    return
+                yield None
+                continue
+            for event in events:
+                seq = event.seq
+                yield event
+
+class ProgressEstimator:
+    """
+    Estimates run completion from listing/day pages visited against the plan
+
+    plan maps each source to the number of pages (GKToday) or days (Drishti)
+    it may visit. A page counts as done once the next one is discovered; a
+    finished source counts as fully done, since it may stop early once it
+    reaches articles that are already stored.
+    """
+
+    def __init__(self, plan: Dict[str, int]):
+        self.plan = {source: max(1, pages) for source, pages in plan.items()}
+        self.pages_seen = {source: 0 for source in plan}
+        self.finished = set()
+        self.started_at = time.time()
+
+    def page_discovered(self, source: str):
+        """Count a listing/day page visited by source"""
+        if source in self.pages_seen:
+            self.pages_seen[source] += 1
+
+    def source_finished(self, source: str):
+        """Mark source as done, however many pages it visited"""
+        self.finished.add(source)
+
+    def fraction_done(self) -> float:
+        """Completed share of the planned pages, 0.0 - 1.0"""
+        done = 0
+        for source, pages in self.plan.items():
+            if source in self.finished:
+                done += pages
+            else:
+                done += min(max(self.pages_seen[source] - 1, 0), pages)
+        return done / sum(self.plan.values()) if self.plan else 1.0
+
+    def estimate(self, articles_scraped: int, articles_skipped: int) -> Dict[str, Any]:
+        """Progress percentage, ETA and throughput for a PROGRESS event"""
+        elapsed = time.time() - self.started_at
+        fraction = self.fraction_done()
+        if fraction >= 1:
+            remaining = 0
+        elif fraction > 0:
+            remaining = int(elapsed * (1 - fraction) / fraction)
+        else:
+            remaining = None  # nothing to extrapolate from yet
+        return {
+            "articles_scraped": articles_scraped,
+            "articles_skipped": articles_skipped,
+            "progress_percentage": round(10.0 + 90.0 * fraction, 1),
+            "estimated_remaining_seconds": remaining,
+            "articles_per_second": round(articles_scraped / elapsed, 2) if elapsed > 0 else 0.0,
+            "elapsed_seconds": round(elapsed, 1)
+        }
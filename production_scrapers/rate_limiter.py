@@ -0,0 +1,116 @@
+"""
+Per-host politeness scheduler for the production scrapers
+Token buckets shared by every thread, asyncio task and scraper in the process
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Tokens are reserved rather than waited for under the lock: reserve() charges
+    one token immediately (the balance may go negative) and returns how long the
+    caller must wait before sending its request. Concurrent callers therefore
+    queue up fairly without holding the lock while they sleep.
+    """
+
+    def __init__(self, min_interval: float, burst: int = 1):
+        self.min_interval = max(0.0, min_interval)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def update(self, min_interval: float, burst: int = 1):
+        """Change the bucket's rate without resetting outstanding reservations"""
+        with self._lock:
+            self.min_interval = max(0.0, min_interval)
+            self.burst = max(1, burst)
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def reserve(self) -> float:
+        """Charge one token and return the delay in seconds before it may be used"""
+        if self.min_interval == 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(float(self.burst), self._tokens + elapsed / self.min_interval)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens * self.min_interval
+
+class PolitenessScheduler:
+    """Registry of per-host token buckets"""
+
+    def __init__(self, default_interval: Optional[float] = None, default_burst: Optional[int] = None):
+        self.default_interval = (
+            default_interval if default_interval is not None
+            else float(os.getenv('SCRAPER_RATE_LIMIT', '2'))
+        )
+        self.default_burst = default_burst or int(os.getenv('SCRAPER_RATE_BURST', '1'))
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host: str, min_interval: float, burst: Optional[int] = None):
+        """Set the minimum interval between requests (and burst size) for a host"""
+        burst = burst or self.default_burst
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                self._buckets[host] = TokenBucket(min_interval, burst)
+            else:
+                bucket.update(min_interval, burst)
+        logger.debug(f"Rate limit for {host}: {min_interval}s interval, burst {burst}")
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.default_interval, self.default_burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def reserve(self, host: str) -> float:
+        """Charge one request to a host and return the delay before sending it"""
+        return self._bucket(host).reserve()
+
+    def acquire(self, host: str):
+        """Block the current thread until a request to host is allowed"""
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, host: str):
+        """Wait (without blocking the event loop) until a request to host is allowed"""
+        delay = self.reserve(host)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+def source_rate_limit(source: str) -> float:
+    """Minimum request interval for a source, e.g. SCRAPER_RATE_LIMIT_GKTODAY"""
+    return float(os.getenv(f'SCRAPER_RATE_LIMIT_{source.upper()}', os.getenv('SCRAPER_RATE_LIMIT', '2')))
+
+# Process-wide scheduler so every runner shares the same per-host budget
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> PolitenessScheduler:
+    """Get the global politeness scheduler instance"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = PolitenessScheduler()
+        return _scheduler
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Resident scraper daemon with a loopback HTTP control API
+Keeps one warm ScraperService (imports, fetch engine, DB pool) so the web
+app can start, monitor and cancel scrapes without spawning a new interpreter
+
+Endpoints (JSON):
+  GET  /health            - liveness check
+  GET  /status            - current ScraperService progress
+  GET  /result            - result of the last completed run
+  GET  /runs?limit=N      - recent runs from the job store
+  GET  /runs/<id>         - status, options and result of one run
+  GET  /events            - live progress events of the latest (or ?run_id=) run,
+                            as NDJSON or, with ?format=sse / Accept: text/event-stream,
+                            Server-Sent Events; resume with ?since=N or Last-Event-ID
+  GET  /latest?limit=N    - latest articles from the database
+  POST /start             - start a run; body takes start_scraping() arguments
+  POST /cancel            - cancel the current run
+"""
+
+import argparse
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib import error as urllib_error
+from urllib import request as urllib_request
+from urllib.parse import parse_qs, urlparse
+
+# Add current directory to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from progress_events import EventStream
+from scraper_service import ScraperService, get_latest_articles, get_scraper_service
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = os.getenv('SCRAPER_SERVICE_HOST', '127.0.0.1')
+DEFAULT_PORT = int(os.getenv('SCRAPER_SERVICE_PORT', '8765'))
+
+# Seconds between keep-alive lines on an idle event stream
+EVENT_HEARTBEAT_SECONDS = 15
+
+# Keyword arguments accepted by POST /start, and their JSON types
+START_OPTIONS = {
+    'gktoday_enabled': bool,
+    'drishti_enabled': bool,
+    'max_pages': int,
+    'max_articles': int,
+    'parallel': bool
+}
+
+class DaemonUnavailable(ConnectionError):
+    """Raised by call_daemon when no daemon is listening"""
+
+class ControlRequestHandler(BaseHTTPRequestHandler):
+    """Routes control API requests to the server's ScraperService"""
+
+    server_version = 'ScraperDaemon/1.0'
+
+    @property
+    def service(self) -> ScraperService:
+        """The daemon's shared ScraperService"""
+        return self.server.service
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == '/health':
+            self._send_json({"success": True, "status": "ok"})
+        elif url.path == '/status':
+            self._send_json(self.service.get_status())
+        elif url.path == '/result':
+            result = self.service.get_result()
+            self._send_json(result if result else {"message": "No result available"})
+        elif url.path == '/runs':
+            limit = self._int_param(url.query, 'limit', 20)
+            if limit is not None:
+                self._send_json(self.service.list_runs(limit))
+        elif url.path.startswith('/runs/'):
+            run = self.service.get_run(url.path[len('/runs/'):])
+            if run:
+                self._send_json(run)
+            else:
+                self._send_json({"success": False, "error": "Run not found"}, 404)
+        elif url.path == '/events':
+            self._handle_events(url.query)
+        elif url.path == '/latest':
+            limit = self._int_param(url.query, 'limit', 10)
+            if limit is not None:
+                self._send_json(get_latest_articles(limit=limit))
+        else:
+            self._send_json({"success": False, "error": f"Unknown endpoint: {url.path}"}, 404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path == '/start':
+            options, error = self._read_start_options()
+            if error:
+                self._send_json({"success": False, "error": error}, 400)
+                return
+            result = self.service.start_scraping(**options)
+            self._send_json(result, 202 if result["success"] else 409)
+        elif url.path == '/cancel':
+            result = self.service.cancel_scraping()
+            self._send_json(result, 200 if result["success"] else 409)
+        else:
+            self._send_json({"success": False, "error": f"Unknown endpoint: {url.path}"}, 404)
+
+    def _int_param(self, query: str, name: str, default: int) -> Optional[int]:
+        """Read an integer query parameter, answering 400 (and returning None) if invalid"""
+        try:
+            return int(parse_qs(query).get(name, [default])[0])
+        except ValueError:
+            self._send_json({"success": False, "error": f"{name} must be an integer"}, 400)
+            return None
+
+    def _handle_events(self, query: str):
+        """Stream a run's progress events until the run finishes or the client disconnects"""
+        params = parse_qs(query)
+        stream = self.service.event_stream(params.get('run_id', [None])[0])
+        if stream is None:
+            self._send_json({"success": False, "error": "No events for this run in the daemon"}, 404)
+            return
+
+        last_event_id = self.headers.get('Last-Event-ID', '')
+        since = self._int_param(query, 'since', int(last_event_id) if last_event_id.isdigit() else 0)
+        if since is None:
+            return
+        sse = params.get('format', [''])[0] == 'sse' or 'text/event-stream' in self.headers.get('Accept', '')
+        self._stream_events(stream, since, sse)
+
+    def _stream_events(self, stream: EventStream, since: int, sse: bool):
+        """Write events as SSE frames or NDJSON lines, with keep-alives while idle"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream' if sse else 'application/x-ndjson')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        try:
+            for event in stream.follow(since, heartbeat=EVENT_HEARTBEAT_SECONDS):
+                if event is None:
+                    chunk = ': keep-alive\n\n' if sse else '\n'
+                else:
+                    data = json.dumps(event.to_dict(), default=str)
+                    chunk = f"id: {event.seq}\nevent: {event.type}\ndata: {data}\n\n" if sse else data + '\n'
+                self.wfile.write(chunk.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Event stream client disconnected")
+
+    def _read_start_options(self) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Parse and validate the JSON body of POST /start"""
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        # A negative length would read until the client closes the connection
+        if length < 0:
+            return {}, "Content-Length must be a non-negative integer"
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            return {}, "Request body must be JSON"
+        if not isinstance(body, dict):
+            return {}, "Request body must be a JSON object"
+
+        unknown = sorted(set(body) - set(START_OPTIONS))
+        if unknown:
+            return {}, f"Unknown options: {', '.join(unknown)}"
+        for name, value in body.items():
+            if START_OPTIONS[name] is bool and not isinstance(value, bool):
+                return {}, f"{name} must be true or false"
+            # bool is an int subclass, so true/false are not counts
+            if START_OPTIONS[name] is int and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                return {}, f"{name} must be a positive integer"
+        return body, None
+
+    def _send_json(self, payload: Any, status: int = 200):
+        """Write a JSON response"""
+        data = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+class ScraperDaemon:
+    """Loopback HTTP server wrapping a single ScraperService"""
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, service: Optional[ScraperService] = None):
+        self.httpd = ThreadingHTTPServer((host, port), ControlRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.service = service or get_scraper_service()
+        self._thread: Optional[threading.Thread] = None
+        self._serving = False
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        """Serve requests on the current thread until shutdown()"""
+        logger.info(f"Scraper daemon listening on {self.url}")
+        self._serving = True
+        self.httpd.serve_forever()
+
+    def start(self):
+        """Serve requests on a background thread"""
+        self._serving = True
+        self._thread = threading.Thread(target=self.serve_forever, name='scraper-daemon', daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """Stop serving and release the listening socket"""
+        if self._serving:
+            # BaseServer.shutdown() would block forever if serve_forever() never ran
+            self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("Scraper daemon stopped")
+
+# The daemon only listens on loopback, so never route control calls through an HTTP proxy
+_opener = urllib_request.build_opener(urllib_request.ProxyHandler({}))
+
+def daemon_url() -> str:
+    """Base URL of the daemon, overridable with SCRAPER_SERVICE_URL"""
+    return os.getenv('SCRAPER_SERVICE_URL', f"http://{DEFAULT_HOST}:{DEFAULT_PORT}")
+
+def call_daemon(method: str, path: str, payload: Optional[Dict] = None, timeout: float = 10) -> Any:
+    """
+    Send a control request to a running daemon and return its JSON response
+
+    Raises:
+        DaemonUnavailable: if nothing is listening at daemon_url()
+    """
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    req = urllib_request.Request(
+        daemon_url() + path,
+        data=data,
+        method=method,
+        headers={'Content-Type': 'application/json'}
+    )
+    try:
+        with _opener.open(req, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib_error.HTTPError as e:
+        # Non-2xx responses still carry a JSON body (e.g. 409 when already running)
+        return json.loads(e.read())
+    except (urllib_error.URLError, ConnectionError) as e:
+        raise DaemonUnavailable(f"Scraper daemon not reachable at {daemon_url()}: {e}")
+
+def stream_daemon_events(path: str = '/events', timeout: float = EVENT_HEARTBEAT_SECONDS * 2) -> Iterator[Dict]:
+    """
+    Follow a daemon NDJSON event stream, yielding each event as a dict
+
+    Ends when the run finishes; yields nothing if the daemon has no events
+    for the run.
+
+    Raises:
+        DaemonUnavailable: if nothing is listening at daemon_url()
+    """
+    try:
+        response = _opener.open(daemon_url() + path, timeout=timeout)
+    except urllib_error.HTTPError as e:
+        e.close()
+        return
+    except (urllib_error.URLError, ConnectionError) as e:
+        raise DaemonUnavailable(f"Scraper daemon not reachable at {daemon_url()}: {e}")
+
+    with response:
+        for line in response:
+            if line.strip():
+                yield json.loads(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Resident scraper daemon")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind (keep on loopback)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    parser.add_argument("--log-level", default=os.getenv('SCRAPER_LOG_LEVEL', 'INFO'), help="Logging level")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper()),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    daemon = ScraperDaemon(args.host, args.port)
+    stop = threading.Event()
+
+    # pm2 stops processes with SIGINT/SIGTERM; shut down cleanly on either
+    def handle_signal(signum, frame):
+        logger.info(f"Received signal {signum}, shutting down")
+        stop.set()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    daemon.start()
+    stop.wait()
+    daemon.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ import json
 import threading
 import queue
 import time
+from collections import OrderedDict
 from enum import Enum
 
 # Add current directory to path for imports
@@ -21,11 +22,24 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+from cancellation import CancellationToken
 from combined_scraper import CombinedScraper, CombinedScrapingResult
+from job_store import JobStore, get_job_store
+import progress_events
+from progress_events import EventStream, ProgressEstimator, ProgressEvent
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# How often a running service checks the job store for a cancel from another process
+CANCEL_POLL_SECONDS = 1.0
+
+# Event streams kept for recent runs so late readers can still replay them
+MAX_EVENT_STREAMS = 5
+
+# Days of DrishtiIAS pages checked per run
+DRISHTI_DAYS = 3
+
 class ScrapingStatus(Enum):
     """Status of scraping operation"""
     IDLE = "idle"
@@ -62,10 +76,21 @@ class ScrapingProgress:
         }
 
 class ScraperService:
-    """Production-ready scraper service for API integration"""
+    """
+    Production-ready scraper service for API integration
     
-    def __init__(self):
+    Runs are recorded in the durable job store as they progress, so status and
+    results are visible to every process (daemon, cli.py, API routes), not just
+    the one that started the run. Each run has a CancellationToken; a cancel
+    from any process stops the scrapers at their next page or pending fetch.
+    Progress events from the scrapers are published on a per-run EventStream
+    in the process running the scrape (served by the daemon's /events).
+    """
+    
+    def __init__(self, store: Optional[JobStore] = None):
         self.current_task = None
+        self.run_id = None
+        self.store = store or get_job_store()
         self.progress = ScrapingProgress(
             status=ScrapingStatus.IDLE,
             current_scraper=None,
@@ -78,24 +103,65 @@ class ScraperService:
             progress_percentage=0.0
         )
         self.result = None
+        self._source_totals: Dict[str, Any] = {}
+        self._cancel_token: Optional[CancellationToken] = None
+        self._estimator: Optional[ProgressEstimator] = None
+        self._event_streams: "OrderedDict[str, EventStream]" = OrderedDict()
         self._lock = threading.Lock()
-        
+    
+    @staticmethod
+    def _run_status(run: Dict[str, Any]) -> Dict[str, Any]:
+        """Status dict (same keys as ScrapingProgress.to_dict) for a stored run"""
+        return {
+            "run_id": run["id"],
+            "status": run["status"],
+            "current_scraper": run["current_scraper"],
+            "articles_scraped": run["articles_scraped"],
+            "articles_skipped": run["articles_skipped"],
+            "errors": run["errors"],
+            "started_at": run["started_at"],
+            "completed_at": run["completed_at"],
+            "estimated_remaining_seconds": run["estimated_remaining_seconds"],
+            "progress_percentage": run["progress_percentage"],
+            "sources": run["sources"]
+        }
+    
     def get_status(self) -> Dict[str, Any]:
-        """Get current scraping status and progress"""
-        with self._lock:
-            return self.progress.to_dict()
+        """Get current scraping status and progress (latest run in the job store)"""
+        self.store.fail_orphaned_runs()
+        run = self.store.latest_run()
+        if run is None:
+            with self._lock:
+                return self.progress.to_dict()
+        return self._run_status(run)
+    
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Get status and result of a specific run"""
+        run = self.store.get_run(run_id)
+        if run is None:
+            return None
+        status = self._run_status(run)
+        status["options"] = run["options"]
+        status["result"] = run["result"]
+        return status
+    
+    def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get a summary of recent runs, newest first"""
+        return self.store.list_runs(limit)
     
     def get_result(self) -> Optional[Dict[str, Any]]:
         """Get the result of the last completed scraping operation"""
+        run = self.store.latest_run(with_result=True)
+        return run["result"] if run else None
+    
+    def event_stream(self, run_id: Optional[str] = None) -> Optional[EventStream]:
+        """Progress events of a run started by this service (default: the latest one)"""
         with self._lock:
-            if self.result and hasattr(self.result, '__dict__'):
-                return asdict(self.result)
-            return None
+            return self._event_streams.get(run_id or self.run_id)
     
     def is_running(self) -> bool:
-        """Check if a scraping operation is currently running"""
-        with self._lock:
-            return self.progress.status == ScrapingStatus.RUNNING
+        """Check if a scraping operation is currently running (in any process)"""
+        return self.get_status()["status"] == ScrapingStatus.RUNNING.value
     
     def start_scraping(
         self,
@@ -120,14 +186,33 @@ class ScraperService:
         Returns:
             Dict with operation status
         """
+        status = self.get_status()
         with self._lock:
-            if self.progress.status == ScrapingStatus.RUNNING:
+            if self.progress.status == ScrapingStatus.RUNNING or status["status"] == ScrapingStatus.RUNNING.value:
                 return {
                     "success": False,
                     "message": "Scraping operation already in progress",
-                    "status": self.progress.status.value
+                    "status": ScrapingStatus.RUNNING.value,
+                    "run_id": status.get("run_id")
+                }
+            # A cancelled run is marked cancelled at once but its thread may still be unwinding
+            if self.current_task is not None and self.current_task.is_alive():
+                return {
+                    "success": False,
+                    "message": "Previous scraping operation is still shutting down",
+                    "status": status["status"],
+                    "run_id": self.run_id
                 }
             
+            options = {
+                "gktoday_enabled": gktoday_enabled,
+                "drishti_enabled": drishti_enabled,
+                "max_pages": max_pages,
+                "max_articles": max_articles,
+                "parallel": parallel
+            }
+            self.run_id = self.store.create_run(options)
+            
             # Reset progress
             self.progress = ScrapingProgress(
                 status=ScrapingStatus.RUNNING,
@@ -141,42 +226,142 @@ class ScraperService:
                 progress_percentage=0.0
             )
             self.result = None
+            self._source_totals = {}
+            self._cancel_token = CancellationToken()
+            self._estimator = None
+            self._event_streams[self.run_id] = EventStream()
+            while len(self._event_streams) > MAX_EVENT_STREAMS:
+                self._event_streams.popitem(last=False)
+            run_id = self.run_id
+            token = self._cancel_token
+            
+            # Start scraping in background thread
+            self.current_task = threading.Thread(
+                target=self._run_scraping,
+                args=(run_id, token, gktoday_enabled, drishti_enabled, max_pages, max_articles, parallel, progress_callback),
+                daemon=True
+            )
         
-        # Start scraping in background thread
-        self.current_task = threading.Thread(
-            target=self._run_scraping,
-            args=(gktoday_enabled, drishti_enabled, max_pages, max_articles, parallel, progress_callback),
-            daemon=True
-        )
+        self._publish(run_id, ProgressEvent(progress_events.RUN_STARTED, data=options))
         self.current_task.start()
+        threading.Thread(target=self._watch_for_cancel, args=(run_id, token), daemon=True).start()
         
         return {
             "success": True,
             "message": "Scraping operation started",
-            "status": ScrapingStatus.RUNNING.value
+            "status": ScrapingStatus.RUNNING.value,
+            "run_id": run_id
         }
     
     def cancel_scraping(self) -> Dict[str, Any]:
-        """Cancel the current scraping operation"""
+        """
+        Cancel the current scraping operation
+        
+        Works from any process: the run is marked cancelled in the job store and
+        the process running it stops within about CANCEL_POLL_SECONDS.
+        """
+        status = self.get_status()
+        run_id = status.get("run_id")
+        if status["status"] != ScrapingStatus.RUNNING.value or not self.store.cancel_run(run_id):
+            return {
+                "success": False,
+                "message": "No scraping operation in progress",
+                "status": self.get_status()["status"]
+            }
+        
         with self._lock:
-            if self.progress.status != ScrapingStatus.RUNNING:
-                return {
-                    "success": False,
-                    "message": "No scraping operation in progress",
-                    "status": self.progress.status.value
-                }
-            
-            self.progress.status = ScrapingStatus.CANCELLED
-            self.progress.completed_at = datetime.now()
+            if run_id == self.run_id and self._cancel_token:
+                self._cancel_token.cancel("Cancelled by user")
+                self.progress.status = ScrapingStatus.CANCELLED
+                self.progress.completed_at = datetime.now()
             
         return {
             "success": True,
             "message": "Scraping operation cancelled",
-            "status": ScrapingStatus.CANCELLED.value
+            "status": ScrapingStatus.CANCELLED.value,
+            "run_id": run_id
         }
     
+    def _watch_for_cancel(self, run_id: str, token: CancellationToken):
+        """Cancel the token if another process cancels the run; exits when the run finishes"""
+        while not token.wait(CANCEL_POLL_SECONDS):
+            try:
+                status = self.store.run_status(run_id)
+            except Exception as e:
+                logger.error(f"Could not check run {run_id} for cancellation: {e}")
+                continue
+            if status == ScrapingStatus.CANCELLED.value:
+                token.cancel("Cancelled by user")
+            elif status != ScrapingStatus.RUNNING.value:
+                return
+    
+    def _publish(self, run_id: str, event: ProgressEvent):
+        """Publish an event on the run's stream"""
+        stream = self.event_stream(run_id)
+        if stream is not None:
+            event.run_id = run_id
+            stream.publish(event)
+    
+    def _update_estimate(self, run_id: str):
+        """Recompute progress percentage, ETA and throughput; store and publish them"""
+        with self._lock:
+            if run_id != self.run_id or self._estimator is None:
+                return
+            estimate = self._estimator.estimate(self.progress.articles_scraped, self.progress.articles_skipped)
+            self.progress.progress_percentage = estimate["progress_percentage"]
+            self.progress.estimated_remaining_seconds = estimate["estimated_remaining_seconds"]
+        
+        self.store.update_run(
+            run_id,
+            progress_percentage=estimate["progress_percentage"],
+            estimated_remaining_seconds=estimate["estimated_remaining_seconds"]
+        )
+        self._publish(run_id, ProgressEvent(progress_events.PROGRESS, data=estimate))
+    
+    def _on_event(self, run_id: str, event: ProgressEvent):
+        """Forward a scraper event to the run's stream; page events also advance the estimate"""
+        self._publish(run_id, event)
+        if event.type == progress_events.PAGE_DISCOVERED:
+            with self._lock:
+                if run_id == self.run_id and self._estimator:
+                    self._estimator.page_discovered(event.source)
+            self._update_estimate(run_id)
+    
+    def _on_source_progress(self, run_id: str, source: str, status: str, result: Optional[Any]):
+        """Record per-source progress from CombinedScraper in memory and in the job store"""
+        with self._lock:
+            if run_id == self.run_id:
+                if result is not None:
+                    self._source_totals[source] = result
+                self.progress.articles_scraped = sum(r.articles_scraped for r in self._source_totals.values())
+                self.progress.articles_skipped = sum(r.articles_skipped for r in self._source_totals.values())
+                if status != ScrapingStatus.RUNNING.value and self._estimator:
+                    self._estimator.source_finished(source)
+        
+        self.store.update_source(
+            run_id,
+            source,
+            status,
+            articles_scraped=result.articles_scraped if result else 0,
+            articles_skipped=result.articles_skipped if result else 0,
+            errors=result.errors if result else [],
+            runtime_seconds=result.runtime_seconds if result else 0
+        )
+        
+        if status != ScrapingStatus.RUNNING.value:
+            self._publish(run_id, ProgressEvent(
+                progress_events.SOURCE_FINISHED,
+                source=source,
+                message=status,
+                data=asdict(result) if result else None
+            ))
+        if result is not None:
+            self._update_estimate(run_id)
+    
     def _run_scraping(
         self,
+        run_id: str,
+        token: CancellationToken,
         gktoday_enabled: bool,
         drishti_enabled: bool,
         max_pages: int,
@@ -186,14 +371,16 @@ class ScraperService:
     ):
         """Run the scraping operation in background"""
         try:
-            logger.info(f"Starting scraping operation: GKToday={gktoday_enabled}, Drishti={drishti_enabled}, Parallel={parallel}")
+            logger.info(f"Starting scraping operation {run_id}: GKToday={gktoday_enabled}, Drishti={drishti_enabled}, Parallel={parallel}")
             
             scraper = CombinedScraper()
             
             # Update progress
             with self._lock:
-                self.progress.current_scraper = "combined"
-                self.progress.progress_percentage = 10.0
+                if run_id == self.run_id:
+                    self.progress.current_scraper = "combined"
+                    self.progress.progress_percentage = 10.0
+            self.store.update_run(run_id, current_scraper="combined", progress_percentage=10.0)
             
             if progress_callback:
                 progress_callback(self.progress)
@@ -209,24 +396,68 @@ class ScraperService:
             if not sources:
                 sources = ['gktoday', 'drishti']
             
+            plan = {'gktoday': max_pages, 'drishti': DRISHTI_DAYS}
+            with self._lock:
+                if run_id == self.run_id:
+                    self._estimator = ProgressEstimator({source: plan[source] for source in sources})
+            
             # Run the scraping
             result = scraper.sync_articles(
                 sources=sources,
-                max_days=3,
+                max_days=DRISHTI_DAYS,
                 max_articles_per_source=max_articles,
                 max_pages_gktoday=max_pages,
-                parallel=parallel
+                parallel=parallel,
+                progress_callback=lambda source, status, source_result: self._on_source_progress(
+                    run_id, source, status, source_result
+                ),
+                cancel_token=token,
+                event_callback=lambda event: self._on_event(run_id, event)
             )
             
-            # Update final progress
+            # Update final progress (a cancelled run keeps its cancelled status)
+            if token.cancelled:
+                final_status = ScrapingStatus.CANCELLED
+            else:
+                final_status = ScrapingStatus.COMPLETED if result.success else ScrapingStatus.FAILED
             with self._lock:
-                self.progress.status = ScrapingStatus.COMPLETED if result.success else ScrapingStatus.FAILED
-                self.progress.articles_scraped = result.total_articles_scraped
-                self.progress.articles_skipped = result.total_articles_skipped
-                self.progress.errors = result.total_errors
-                self.progress.completed_at = datetime.now()
-                self.progress.progress_percentage = 100.0
-                self.result = result
+                if run_id == self.run_id:
+                    self.progress.status = final_status
+                    if not self.progress.completed_at:
+                        self.progress.completed_at = datetime.now()
+                    self.progress.articles_scraped = result.total_articles_scraped
+                    self.progress.articles_skipped = result.total_articles_skipped
+                    self.progress.errors = result.total_errors
+                    self.progress.progress_percentage = 100.0
+                    self.progress.estimated_remaining_seconds = 0
+                    self.result = result
+            
+            stored_status = self.store.finish_run(
+                run_id,
+                final_status.value,
+                articles_scraped=result.total_articles_scraped,
+                articles_skipped=result.total_articles_skipped,
+                errors=result.total_errors,
+                progress_percentage=100.0,
+                estimated_remaining_seconds=0,
+                result=asdict(result)
+            )
+            # Another process may have cancelled the run after the scrape returned
+            if stored_status and stored_status != final_status.value:
+                final_status = ScrapingStatus(stored_status)
+                with self._lock:
+                    if run_id == self.run_id:
+                        self.progress.status = final_status
+            self._publish(run_id, ProgressEvent(
+                progress_events.RUN_FINISHED,
+                message=final_status.value,
+                data={
+                    "articles_scraped": result.total_articles_scraped,
+                    "articles_skipped": result.total_articles_skipped,
+                    "errors": len(result.total_errors),
+                    "runtime_seconds": result.runtime_seconds
+                }
+            ))
             
             if progress_callback:
                 progress_callback(self.progress)
@@ -236,13 +467,34 @@ class ScraperService:
         except Exception as e:
             logger.error(f"Error in scraping operation: {e}")
             with self._lock:
-                self.progress.status = ScrapingStatus.FAILED
-                self.progress.errors.append(f"Scraping failed: {str(e)}")
-                self.progress.completed_at = datetime.now()
-                self.progress.progress_percentage = 0.0
+                if run_id == self.run_id:
+                    self.progress.status = ScrapingStatus.FAILED
+                    self.progress.errors.append(f"Scraping failed: {str(e)}")
+                    self.progress.completed_at = datetime.now()
+                    self.progress.progress_percentage = 0.0
+                    errors = list(self.progress.errors)
+                else:
+                    errors = [f"Scraping failed: {str(e)}"]
+            
+            final_status = ScrapingStatus.FAILED
+            try:
+                stored_status = self.store.finish_run(run_id, final_status.value, errors=errors, progress_percentage=0.0)
+                if stored_status and stored_status != final_status.value:
+                    final_status = ScrapingStatus(stored_status)
+                    with self._lock:
+                        if run_id == self.run_id:
+                            self.progress.status = final_status
+            except Exception as store_error:
+                logger.error(f"Could not record failed run {run_id}: {store_error}")
+            self._publish(run_id, ProgressEvent(progress_events.RUN_FINISHED, message=final_status.value))
             
             if progress_callback:
                 progress_callback(self.progress)
+        
+        finally:
+            stream = self.event_stream(run_id)
+            if stream is not None:
+                stream.close()
 
 # Global service instance for singleton usage
 _scraper_service = None
@@ -302,7 +554,7 @@ def quick_scrape(
     scraper = CombinedScraper()
     return scraper.sync_articles(
         sources=sources,
-        max_days=3,
+        max_days=DRISHTI_DAYS,
         max_articles_per_source=max_articles,
         max_pages_gktoday=max_pages,
         parallel=True
@@ -318,9 +570,9 @@ def get_latest_articles(limit: int = 10) -> List[Dict[str, Any]]:
     Returns:
         List of article dictionaries
     """
-    import psycopg2
     from psycopg2.extras import DictCursor
     from dotenv import load_dotenv
+    from db_pool import get_pool
     
     # Load environment variables
     root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -332,7 +584,7 @@ def get_latest_articles(limit: int = 10) -> List[Dict[str, Any]]:
         return []
     
     try:
-        with psycopg2.connect(database_url) as conn:
+        with get_pool().connection() as conn:
             with conn.cursor(cursor_factory=DictCursor) as cursor:
                 # First, check what columns exist
                 cursor.execute("""
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test cooperative cancellation of scraping runs
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import scraper_service
+from cancellation import CancellationToken, ScrapeCancelled
+from combined_scraper import CombinedScrapingResult, GKTodayResult
+from fetcher import AsyncFetchEngine
+from job_store import JobStore
+from rate_limiter import PolitenessScheduler
+from scraper_service import ScraperService
+
+def test_token():
+    """Parent cancels propagate to children, timeouts stay local"""
+    parent = CancellationToken()
+    child = CancellationToken(parent=parent)
+    timed = CancellationToken(parent=parent, timeout=0.05)
+    calls = []
+    child.add_callback(lambda: calls.append('child'))
+
+    assert timed.wait(2) and timed.reason.startswith("timed out")
+    assert not parent.cancelled and not child.cancelled
+
+    parent.cancel("Cancelled by user")
+    assert child.cancelled and child.reason == "Cancelled by user"
+    assert calls == ['child']
+    try:
+        child.raise_if_cancelled()
+        raise AssertionError("expected ScrapeCancelled")
+    except ScrapeCancelled:
+        pass
+
+    # Closed children no longer follow their parent
+    parent = CancellationToken()
+    child = CancellationToken(parent=parent, timeout=60)
+    child.close()
+    parent.cancel()
+    assert not child.cancelled
+    print("✅ Cancellation tokens propagate and time out")
+
+def test_pending_fetch_cancelled():
+    """A fetch waiting on the politeness scheduler returns as soon as its token is cancelled"""
+    scheduler = PolitenessScheduler(default_interval=60)
+    scheduler.reserve('scraper.invalid')  # next request to the host must wait a minute
+    engine = AsyncFetchEngine(scheduler=scheduler)
+    token = CancellationToken()
+    threading.Timer(0.2, token.cancel, args=("Cancelled by user",)).start()
+
+    start = time.time()
+    try:
+        engine.fetch_many(['http://scraper.invalid/a', 'http://scraper.invalid/b'], token=token)
+        raise AssertionError("expected ScrapeCancelled")
+    except ScrapeCancelled:
+        pass
+    finally:
+        engine.close()
+    assert time.time() - start < 2
+    print("✅ Pending fetches cancelled promptly")
+
+class UnwindingScraper:
+    """Stands in for CombinedScraper: reports progress, then keeps unwinding after a cancel until released"""
+    release = threading.Event()
+
+    def sync_articles(self, progress_callback=None, cancel_token=None, **kwargs):
+        source_result = GKTodayResult(True, 3, 1, [], 0.1)
+        progress_callback('gktoday', 'running', source_result)
+        cancel_token.wait(10)
+        self.release.wait(10)
+        progress_callback('gktoday', 'cancelled', source_result)
+        return CombinedScrapingResult(True, source_result, None, 3, 1, [], 0.1)
+
+def test_restart_waits_for_cancelled_run():
+    """A new run is refused until the cancelled run's thread exits, and the old run never touches it"""
+    handle, path = tempfile.mkstemp(suffix='.db')
+    os.close(handle)
+    service = ScraperService(store=JobStore(path))
+    original = scraper_service.CombinedScraper
+    scraper_service.CombinedScraper = UnwindingScraper
+    try:
+        first = service.start_scraping(max_pages=1)
+        while service.progress.articles_scraped != 3:
+            time.sleep(0.01)
+        assert service.cancel_scraping()['success']
+
+        refused = service.start_scraping(max_pages=1)
+        assert refused['success'] is False and refused['run_id'] == first['run_id']
+
+        UnwindingScraper.release.set()
+        service.current_task.join(10)
+        assert service.get_run(first['run_id'])['status'] == 'cancelled'
+
+        UnwindingScraper.release.clear()
+        second = service.start_scraping(max_pages=1)
+        assert second['success'] and service.run_id == second['run_id']
+        # Progress still arriving for the old run leaves the new run's state alone
+        service._on_source_progress(first['run_id'], 'drishti', 'completed', GKTodayResult(True, 9, 9, [], 1))
+        assert 'drishti' not in service._source_totals
+        assert service.progress.status.value == 'running' and service.result is None
+        service.cancel_scraping()
+        UnwindingScraper.release.set()
+        service.current_task.join(10)
+    finally:
+        scraper_service.CombinedScraper = original
+    print("✅ New runs wait for a cancelled run to shut down")
+
+def main():
+    """Run all tests"""
+    test_token()
+    test_pending_fetch_cancelled()
+    test_restart_waits_for_cancelled_run()
+    print("🎉 Cancellation tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
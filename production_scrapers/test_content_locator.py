@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass main content locator against max(divs, key=get_text length)
+"""
+
+import os
+import sys
+import time
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from content_locator import largest_text_container, text_lengths
+from parser_backend import available_backends, make_soup
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+
+def naive_largest(soup):
+    """What the scrapers computed before"""
+    return max(soup.find_all('div'), key=lambda x: len(x.get_text()), default=None)
+
+def deep_page(depth: int, width: int = 3) -> str:
+    """Article page whose content sits under depth nested divs, with a paragraph at every level"""
+    opening = ''.join(f'<div class="level-{i}"><p>Paragraph {i} of the article body.</p>' for i in range(depth))
+    sidebar = ''.join(f'<div class="widget"><a href="/tag/{i}/">Tag {i}</a></div>' for i in range(width))
+    return f"<html><body><div class=\"sidebar\">{sidebar}</div>{opening}{'</div>' * depth}</body></html>"
+
+def test_matches_naive_max():
+    """Same container as the naive max on the fixtures and on tricky markup"""
+    pages = [open(os.path.join(FIXTURES_DIR, name), 'rb').read() for name in sorted(os.listdir(FIXTURES_DIR))]
+    pages += [
+        deep_page(40).encode(),
+        # Ties go to the first div; comments, scripts and styles don't count as text
+        b"<div id='a'><p>same</p></div><div id='b'><p>same</p></div>",
+        b"<div id='a'><!-- a very long comment that get_text skips --><p>x</p></div>"
+        b"<div id='b'><script>var long_script_body = 1;</script><p>xy</p></div><div id='c'><style>p{}</style>z</div>",
+        b"<p>no divs at all</p>"
+    ]
+    for backend in available_backends():
+        for page in pages:
+            soup = make_soup(page, backend)
+            assert largest_text_container(soup) is naive_largest(soup)
+            lengths = text_lengths(soup)
+            assert all(lengths[id(tag)] == len(tag.get_text()) for tag in soup.find_all(True) if tag.name not in ('script', 'style', 'template'))
+    print(f"✅ Content locator matches max(get_text) on {len(pages)} pages: {', '.join(available_backends())}")
+
+def benchmark_deep_page():
+    """Report locator and naive max timings on a deep page (not collected by pytest: timings flake under load)"""
+    soup = make_soup(deep_page(600), 'html.parser')
+
+    start = time.perf_counter()
+    naive = naive_largest(soup)
+    naive_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    located = largest_text_container(soup)
+    located_seconds = time.perf_counter() - start
+
+    assert located is naive and located['class'] == ['level-0']
+    print(f"✅ Deep page (600 levels): locator {located_seconds * 1000:.1f}ms vs max(get_text) {naive_seconds * 1000:.1f}ms")
+
+def main():
+    """Run all tests"""
+    test_matches_naive_max()
+    benchmark_deep_page()
+    print("🎉 Content locator tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test the shared date extraction engine against the per-scraper code it replaced
+Runs on the date strings in fixtures/date_strings.txt (the forms GKToday and
+DrishtiIAS pages use) and on the text of the saved pages
+"""
+
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+from dateutil import parser as date_parser
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from date_extraction import extract_date, find_listing_date, parse_date
+from parser_backend import make_soup
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+
+with open(os.path.join(FIXTURES_DIR, 'date_strings.txt')) as f:
+    DATE_STRINGS = [line.strip() for line in f if line.strip()]
+
+def legacy_extract_date(text):
+    """EnhancedDrishtiScraperFixed.extract_date before the shared engine"""
+    if not text:
+        return None
+    months = 'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+    full = 'January|February|March|April|May|June|July|August|September|October|November|December'
+    date_patterns = [
+        rf'(\d{{1,2}})\s+({months})[a-z]*,?\s+(\d{{4}})', rf'({months})[a-z]*\s+(\d{{1,2}}),?\s+(\d{{4}})',
+        rf'(\d{{1,2}})\s+({full}),?\s+(\d{{4}})', rf'({full})\s+(\d{{1,2}}),?\s+(\d{{4}})',
+        rf'(\d{{1,2}})(st|nd|rd|th)\s+({months})[a-z]*,?\s+(\d{{4}})', rf'(\d{{1,2}})(st|nd|rd|th)\s+({full}),?\s+(\d{{4}})',
+        r'(\d{1,2})/(\d{1,2})/(\d{4})', r'(\d{4})-(\d{1,2})-(\d{1,2})', r'(\d{1,2})-(\d{1,2})-(\d{4})'
+    ]
+    for i, pattern in enumerate(date_patterns):
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            groups = match.groups()
+            if i < 4:
+                month, day, year = (groups[1], groups[0], groups[2]) if pattern.startswith(r'(\d') else groups
+                return f"{month} {day}, {year}"
+            if i < 6:
+                return f"{groups[2]} {groups[0]}, {groups[3]}"
+            if i == 7:
+                year, month, day = groups
+            else:
+                day, month, year = groups
+            try:
+                return datetime(int(year), int(month), int(day)).strftime('%B %d, %Y')
+            except ValueError:
+                continue
+    return None
+
+def legacy_parse(date_string):
+    """dateutil, as the scrapers called it before"""
+    try:
+        return date_parser.parse(date_string)
+    except (ValueError, OverflowError):
+        return None
+
+def page_texts():
+    """Text of every saved page, as extract_date sees it"""
+    texts = []
+    for name in sorted(os.listdir(FIXTURES_DIR)):
+        if name.endswith('.html'):
+            with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+                texts.append(make_soup(f.read()).get_text())
+    return texts
+
+def test_extract_date_matches_legacy():
+    """Precompiled patterns find the same date as the per-call searches did"""
+    texts = DATE_STRINGS + page_texts() + [' '.join(DATE_STRINGS[::-1]), "Filed 45/13/2025, decided 2025-02-03"]
+    for text in texts:
+        assert extract_date(text) == legacy_extract_date(text), text
+    assert extract_date("29 January, 2025") == "Jan 29, 2025"
+    assert extract_date("Filed 45/13/2025, decided 2025-02-03") == "February 03, 2025"
+    print(f"✅ extract_date matches the legacy patterns on {len(texts)} texts")
+
+def test_parse_date_matches_dateutil():
+    """Cached fast-path parsing gives what dateutil gives, for any year"""
+    for date_string in DATE_STRINGS:
+        assert parse_date(date_string) == legacy_parse(date_string), date_string
+        assert parse_date(f"  {date_string}\n") == legacy_parse(date_string), date_string
+    assert parse_date("17 Oct, 2026") == datetime(2026, 10, 17)
+    assert parse_date("05/01/2025", dayfirst=True) == datetime(2025, 1, 5)
+    assert parse_date("2025-01-05", dayfirst=True) == datetime(2025, 1, 5)
+    assert parse_date("Feb 30, 2025") is None and parse_date("") is None
+    print(f"✅ parse_date matches dateutil on {len(DATE_STRINGS)} date strings")
+
+def test_listing_dates_any_year():
+    """GKToday listing dates are no longer limited to 2025"""
+    assert find_listing_date("Posted May 5, 2025 by GKToday") == "May 5, 2025"
+    assert find_listing_date("May 4 2026") == "May 4, 2026"
+    assert find_listing_date("Published on June 1, 2031") == "June 1, 2031"
+    assert find_listing_date("May 5, 20256") is None and find_listing_date("No date") is None
+    print("✅ Listing dates are found for any year")
+
+def benchmark():
+    """Report shared engine and legacy timings on the corpus (not collected by pytest: timings flake under load)"""
+    texts = DATE_STRINGS + page_texts()
+    rounds = 50
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            legacy_extract_date(text)
+        for date_string in DATE_STRINGS:
+            legacy_parse(date_string)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in texts:
+            extract_date(text)
+        for date_string in DATE_STRINGS:
+            parse_date(date_string)
+    shared_seconds = time.perf_counter() - start
+
+    print(f"✅ {rounds} passes over the corpus: {shared_seconds * 1000:.0f}ms vs {legacy_seconds * 1000:.0f}ms before")
+
+def main():
+    """Run all tests"""
+    test_extract_date_matches_legacy()
+    test_parse_date_matches_dateutil()
+    test_listing_dates_any_year()
+    benchmark()
+    print("🎉 Date extraction tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test reading DrishtiIAS articles that a day page renders in full, so the sync
+only fetches the article pages of entries the day page merely teases
+"""
+
+import os
+import sys
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from drishti_scraper import DAY_PAGE_FILTER, EnhancedDrishtiScraperFixed
+from parser_backend import available_backends, make_soup
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+ARTICLE_BASE = "https://www.drishtiias.com/daily-updates/daily-news-analysis/"
+
+def load_fixture(name: str) -> bytes:
+    """Raw bytes of a saved page"""
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+class SavedPage:
+    """Stands in for a requests.Response of a saved page"""
+    def __init__(self, content: bytes):
+        self.content = content
+
+class SavedPageFetcher:
+    """Serves the full day page for today and nothing for other days"""
+    def __init__(self, scraper: EnhancedDrishtiScraperFixed):
+        self.today_url = scraper.get_date_url(0)
+        self.requested = []
+
+    def fetch_many(self, urls, token=None):
+        self.requested.extend(urls)
+        return [SavedPage(load_fixture('drishti_day_full.html')) if url == self.today_url else None for url in urls]
+
+def test_full_articles_read_from_day_page():
+    """Full articles match their own pages; teasers and summaries are left to be fetched"""
+    for backend in available_backends():
+        scraper = EnhancedDrishtiScraperFixed()
+        scraper.html_parser = backend
+        own_page = scraper.parse_article_html(ARTICLE_BASE + "india-eu-free-trade-agreement-talks", load_fixture('drishti_article.html'))
+        for parse_only in (DAY_PAGE_FILTER, None):
+            soup = make_soup(load_fixture('drishti_day_full.html'), backend, parse_only=parse_only)
+            links = scraper.extract_article_links(soup)
+            articles = scraper.extract_day_page_articles(soup, links)
+
+            # The hydrogen article's title has no link; it is matched by title text
+            assert list(articles) == [ARTICLE_BASE + "india-eu-free-trade-agreement-talks",
+                                      ARTICLE_BASE + "national-green-hydrogen-mission-progress"]
+            assert articles[ARTICLE_BASE + "india-eu-free-trade-agreement-talks"] == own_page
+            hydrogen = articles[ARTICLE_BASE + "national-green-hydrogen-mission-progress"]
+            assert hydrogen['date'] == "29 Jan, 2025" and hydrogen['intro'].startswith("For Prelims: Green Hydrogen")
+            assert [section['heading'] for section in hydrogen['sections']] == ["", "Why in News?", "What are the Targets of the Mission?"]
+
+        # Day pages that only list their articles have nothing to read
+        day_soup = make_soup(load_fixture('drishti_day.html'), backend, parse_only=DAY_PAGE_FILTER)
+        assert scraper.extract_day_page_articles(day_soup, scraper.extract_article_links(day_soup)) == {}
+    print(f"✅ Full articles are read from the day page: {', '.join(available_backends())}")
+
+def test_day_links_carry_articles():
+    """fetch_day_pages attaches day-page articles to their links and the parse stage keeps link order"""
+    scraper = EnhancedDrishtiScraperFixed()
+    scraper.fetcher = SavedPageFetcher(scraper)
+    days = scraper.fetch_day_pages(2)
+
+    _, _, _, links = days[0]
+    assert days[1][3] is None
+    assert [link["link"].rsplit('/', 1)[-1] for link in links if "article" not in link] == [
+        "supreme-court-on-electoral-bonds", "indian-navy-commissions-ins-arnala"]
+
+    # One article fetched, two read from the day page
+    complete = {link["link"]: link["article"] for link in links if "article" in link}
+    fetched_url = ARTICLE_BASE + "supreme-court-on-electoral-bonds"
+    responses = {fetched_url: SavedPage(load_fixture('drishti_article.html'))}
+    _, parsed = scraper.parse_day_articles((days[0], responses, complete))
+    assert list(parsed) == [link["link"] for link in links if link["link"] != ARTICLE_BASE + "indian-navy-commissions-ins-arnala"]
+    assert parsed[fetched_url]['title'] == "India-EU Free Trade Agreement Talks"
+    assert all(parsed[url] is article for url, article in complete.items())
+    print(f"✅ Day page requests: {len(scraper.fetcher.requested)}, articles read from the day page: {len(complete)} of {len(links)}")
+
+def main():
+    """Run all tests"""
+    test_full_articles_read_from_day_page()
+    test_day_links_carry_articles()
+    print("🎉 Day page article tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the single-walk DrishtiIAS link harvester against the three-scan
+implementation it replaced
+"""
+
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from drishti_scraper import DAY_PAGE_FILTER, EnhancedDrishtiScraperFixed
+from parser_backend import available_backends, make_soup
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+DAY_PAGES = ['drishti_day.html', 'drishti_day_full.html']
+
+# Precedence and context rules the harvester has to reproduce
+TRICKY_DAY = b"""<html><body>
+<div class="article-detail"><a href="/daily-updates/daily-news-analysis/only-if-no-detail-content">Link in an article-detail div before the content area</a></div>
+<h1 id="dynamic-title"><a href="/free-downloads/notes">Dynamic titles take any link</a></h1>
+<h1 id="dynamic-title"><a name="anchor">No href</a><a href="/daily-updates/daily-news-analysis/second-link">Second link of a heading</a></h1>
+<h2><a href="/daily-updates/daily-news-analysis/image-link"><img src="/i.png"></a></h2>
+<h3>No link in this heading</h3><a href="/daily-news-analysis/after-heading">Link after a heading is not its link</a>
+<h2><span><a href="/daily-news-analysis/outer">Outer</a></span><h3><a href="/daily-news-analysis/inner">Inner heading link</a></h3></h2>
+<a href="/x"><h3>Heading inside a link</h3></a>
+<div class="row detail-content">
+  <p><a href="/daily-updates/daily-news-analysis/image-link">Image link with its title in the content area</a></p>
+  <p><a href="/daily-news-analysis/outer">Outer heading link again, with a longer title</a></p>
+  <p><a href="">Empty href</a> <a href="/daily-news-analysis/short">Short</a></p>
+  <h3><a href="/daily-news-analysis/heading-in-area">Heading inside the content area</a></h3>
+</div>
+<div class="detail-content"><a href="/daily-news-analysis/second-area">Only the first content area counts</a></div>
+</body></html>"""
+
+def legacy_extract_article_links(scraper, soup):
+    """EnhancedDrishtiScraperFixed.extract_article_links before the single walk"""
+    if not soup:
+        return []
+    articles = []
+    for h1 in soup.find_all('h1', id='dynamic-title'):
+        a_tag = h1.find('a')
+        if a_tag and a_tag.get('href'):
+            articles.append({"title": a_tag.get_text(strip=True), "link": urljoin(scraper.base_url, a_tag['href'])})
+    for heading in soup.find_all(['h1', 'h2', 'h3']):
+        a_tag = heading.find('a')
+        if a_tag and a_tag.get('href'):
+            href = a_tag.get('href')
+            if '/daily-news-analysis/' in href or '/daily-updates/' in href:
+                articles.append({"title": a_tag.get_text(strip=True), "link": urljoin(scraper.base_url, href)})
+    content_area = soup.find('div', class_='detail-content') or soup.find('div', class_='article-detail')
+    if content_area:
+        for a_tag in content_area.find_all('a', href=True):
+            href = a_tag.get('href')
+            if '/daily-news-analysis/' in href or '/daily-updates/' in href:
+                title = a_tag.get_text(strip=True)
+                if title and len(title) > 10:
+                    articles.append({"title": title, "link": urljoin(scraper.base_url, href)})
+    seen = set()
+    unique_articles = []
+    for art in articles:
+        if art["link"] not in seen and art["title"]:
+            unique_articles.append(art)
+            seen.add(art["link"])
+    return unique_articles
+
+def load_fixture(name: str) -> bytes:
+    """Raw bytes of a saved page"""
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+def test_matches_legacy():
+    """Same links in the same order as the three scans, with every backend, partial parse or not"""
+    scraper = EnhancedDrishtiScraperFixed()
+    pages = [load_fixture(name) for name in DAY_PAGES] + [TRICKY_DAY, b"<html><body><p>No links</p></body></html>"]
+    for backend in available_backends():
+        for page in pages:
+            for parse_only in (None, DAY_PAGE_FILTER):
+                soup = make_soup(page, backend, parse_only=parse_only)
+                assert scraper.extract_article_links(soup) == legacy_extract_article_links(scraper, soup)
+    assert scraper.extract_article_links(None) == []
+
+    links = scraper.extract_article_links(make_soup(TRICKY_DAY))
+    # Heading links first (a dynamic title's even if not an article link), then the content area's
+    assert [link["link"].rsplit('/', 1)[-1] for link in links] == ["notes", "outer", "inner", "heading-in-area", "image-link"]
+    titles = {link["link"].rsplit('/', 1)[-1]: link["title"] for link in links}
+    assert titles["outer"] == "Outer" and titles["image-link"] == "Image link with its title in the content area"
+    assert not {"second-link", "after-heading", "second-area", "only-if-no-detail-content", "short"} & set(titles)
+    print(f"✅ Links match the three-scan harvester on {len(pages)} pages: {', '.join(available_backends())}")
+
+def benchmark():
+    """Report single walk and three-scan timings on the saved day pages (not collected by pytest: timings flake under load)"""
+    scraper = EnhancedDrishtiScraperFixed()
+    soups = [make_soup(load_fixture(name), parse_only=DAY_PAGE_FILTER) for name in DAY_PAGES]
+    rounds = 200
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        expected = [legacy_extract_article_links(scraper, soup) for soup in soups]
+    legacy_seconds = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        harvested = [scraper.extract_article_links(soup) for soup in soups]
+    walk_seconds = (time.perf_counter() - start) / rounds
+
+    assert harvested == expected
+    print(f"✅ Saved day pages: {walk_seconds * 1e6:.0f}us vs {legacy_seconds * 1e6:.0f}us before")
+
+def main():
+    """Run all tests"""
+    test_matches_legacy()
+    benchmark()
+    print("🎉 Drishti link harvesting tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
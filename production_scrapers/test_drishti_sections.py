@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass DrishtiIAS section extractor against the find_all/copy
+implementation it replaced
+"""
+
+import os
+import sys
+import time
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from drishti_scraper import EnhancedDrishtiScraperFixed
+from parser_backend import available_backends, make_soup
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+
+# Nesting and skipping the extractor has to reproduce
+TRICKY_ARTICLE = b"""<html><body><div class="detail-content">
+<p class="next-post">Skipped first paragraph still becomes the intro text</p>
+<p>Paragraph before any heading, long enough to keep.</p>
+<h2>Lists <em>inside</em> lists</h2>
+<ul>
+  <li>Outer bullet one with <a href="/x">a link</a> and text
+    <ul>
+      <li>Nested bullet A has text
+        <ol><li>Third level bullet</li></ol>
+      </li>
+      <li>Short</li>
+    </ul>
+    trailing words after the nested list
+  </li>
+  <li>Bullet with a wrapped list <div><ul><li>Wrapped nested bullet</li></ul></div></li>
+  <li>Tiny<ul><li>Sub-point under a dropped bullet</li></ul></li>
+  <li><p>Paragraph inside a bullet is a paragraph too</p></li>
+  <li>Bullet holding a heading <h3>Heading inside a bullet</h3> after it</li>
+</ul>
+<ul class="actions"><li>Skipped list bullet<ul><li>Nested list of a skipped list</li></ul></li></ul>
+<h3 class="starRating">Skipped heading</h3>
+<p>Text <!-- a comment --> with <script>var s = 1;</script>script &amp; comment</p>
+<h4>Empty section</h4>
+<h4>Last</h4>
+<ol><li>Only bullets in the last section</li></ol>
+</div></body></html>"""
+
+def legacy_extract_content_sections(scraper, soup):
+    """EnhancedDrishtiScraperFixed.extract_content_sections before the single-pass walk"""
+    intro = ""
+    sections = []
+    article_detail = soup.find('div', class_='article-detail')
+    if not article_detail:
+        article_detail = soup.find('div', class_='detail-content')
+    if not article_detail:
+        return intro, sections
+    intro_p = article_detail.find('p')
+    if intro_p:
+        intro = scraper.clean_text(intro_p.get_text())
+    current_section = {"heading": "", "content": "", "bullet_points": []}
+    for element in article_detail.find_all(['h2', 'h3', 'h4', 'p', 'ul', 'ol']):
+        if element.get('class') and any(cls in element.get('class', []) for cls in ['next-post', 'tags-new', 'starRating', 'actions']):
+            continue
+        if element.name in ['h2', 'h3', 'h4']:
+            if current_section["content"] or current_section["bullet_points"]:
+                sections.append(current_section)
+            current_section = {"heading": scraper.clean_text(element.get_text()), "content": "", "bullet_points": []}
+        elif element.name == 'p':
+            text = scraper.clean_text(element.get_text())
+            if text and len(text) > 10:
+                if current_section["content"]:
+                    current_section["content"] += " " + text
+                else:
+                    current_section["content"] = text
+        elif element.name in ['ul', 'ol']:
+            for li in element.find_all('li', recursive=False):
+                li_clone = li.__copy__()
+                for nested in li_clone.find_all(['ul', 'ol']):
+                    nested.decompose()
+                main_text = scraper.clean_text(li_clone.get_text())
+                if main_text and len(main_text) > 5:
+                    current_section["bullet_points"].append(main_text)
+                    for nested_list in li.find_all(['ul', 'ol'], recursive=False):
+                        for nested_li in nested_list.find_all('li', recursive=False):
+                            nested_text = scraper.clean_text(nested_li.get_text())
+                            if nested_text and len(nested_text) > 5:
+                                current_section["bullet_points"].append(f"  • {nested_text}")
+    if current_section["content"] or current_section["bullet_points"]:
+        sections.append(current_section)
+    return intro, sections
+
+def long_article(sections: int) -> bytes:
+    """A long article: every section has paragraphs and a two-level list"""
+    body = []
+    for i in range(sections):
+        nested = ''.join(f'<li>Sub-point {j} of section {i} with <b>bold</b> text</li>' for j in range(4))
+        bullets = ''.join(f'<li>Bullet {j} of section {i} explains a point<ul>{nested}</ul></li>' for j in range(5))
+        body.append(f'<h2>Section {i}</h2><p>Paragraph one of section {i}, long enough to keep.</p>'
+                    f'<p>Paragraph two of section {i} with <a href="/l">a link</a>.</p><ul>{bullets}</ul>')
+    return f'<html><body><div class="article-detail">{"".join(body)}</div></body></html>'.encode()
+
+def test_matches_legacy():
+    """Same intro and sections as before on the fixture and the tricky markup, with every backend"""
+    scraper = EnhancedDrishtiScraperFixed()
+    with open(os.path.join(FIXTURES_DIR, 'drishti_article.html'), 'rb') as f:
+        pages = [f.read(), TRICKY_ARTICLE, long_article(3), b"<html><body><p>No article</p></body></html>"]
+    for backend in available_backends():
+        for page in pages:
+            soup = make_soup(page, backend)
+            assert scraper.extract_content_sections(soup) == legacy_extract_content_sections(scraper, soup)
+
+    intro, sections = scraper.extract_content_sections(make_soup(TRICKY_ARTICLE))
+    assert intro == "Skipped first paragraph still becomes the intro text"
+    bullets = sections[1]['bullet_points']
+    assert bullets[:2] == ["Outer bullet one with a link and text trailing words after the nested list",
+                           "  • Nested bullet A has text Third level bullet"]
+    assert "  • Wrapped nested bullet" not in bullets and "Wrapped nested bullet" in bullets
+    assert "  • Sub-point under a dropped bullet" not in bullets and "Sub-point under a dropped bullet" in bullets
+    assert "Skipped list bullet" not in str(sections) and "Nested list of a skipped list" in str(sections)
+    assert sections[-1] == {"heading": "Last", "content": "", "bullet_points": ["Only bullets in the last section"]}
+    print(f"✅ Sections match the previous extractor on {len(pages)} pages: {', '.join(available_backends())}")
+
+def benchmark():
+    """Report single walk and find_all/copy timings (not collected by pytest: timings flake under load)"""
+    scraper = EnhancedDrishtiScraperFixed()
+    soup = make_soup(long_article(40))
+    rounds = 5
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        expected = legacy_extract_content_sections(scraper, soup)
+    legacy_seconds = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        extracted = scraper.extract_content_sections(soup)
+    walk_seconds = (time.perf_counter() - start) / rounds
+
+    assert extracted == expected
+    print(f"✅ 40-section article: {walk_seconds * 1000:.1f}ms vs {legacy_seconds * 1000:.1f}ms before")
+
+def main():
+    """Run all tests"""
+    test_matches_legacy()
+    benchmark()
+    print("🎉 Drishti section extraction tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
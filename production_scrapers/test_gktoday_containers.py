@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test GKToday article container selection: overlapping selectors yield each
+article once, and the winning selector is tried first on later pages, also
+when listing pages are parsed in the parse pool
+"""
+
+import os
+import sys
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import gktoday_scraper
+from gktoday_scraper import EnhancedGKTodayScraper
+from parse_pool import ParsePool
+from parser_backend import make_soup
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+
+# Cards inside a list wrapper that itself matches div[class*="post"]
+WRAPPED_LISTING = b"""<html><body><div class="posts-list">
+<div class="post-card"><h2><a href="https://www.gktoday.in/rbi-policy/">RBI keeps repo rate unchanged</a></h2><div class="post-meta">May 5, 2025</div></div>
+<div class="post-card"><h2><a href="https://www.gktoday.in/new-bridge/">New bridge opened in Assam</a></h2></div>
+</div></body></html>"""
+
+# Articles that also carry a post class, so 'article' and '.post' tie until one is preferred
+TIED_LISTING = b"""<html><body><main>
+<div class="post"><article><h2><a href="https://www.gktoday.in/rbi-policy/">RBI keeps repo rate unchanged</a></h2></article></div>
+<div class="post"><article><h2><a href="https://www.gktoday.in/new-bridge/">New bridge opened in Assam</a></h2></article></div>
+</main></body></html>"""
+
+def load_fixture(name: str) -> bytes:
+    """Raw bytes of a saved page"""
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+def test_article_containers_deduplicated():
+    """Overlapping selectors yield each article once, and the winning selector is tried first"""
+    gk = EnhancedGKTodayScraper()
+    gktoday_scraper._preferred_selectors.clear()
+    articles, _ = gk.parse_listing_html("https://www.gktoday.in/", load_fixture('gktoday_listing.html'))
+    urls = [a['url'] for a in articles]
+    assert len(urls) == len(set(urls)) == 4
+    assert gktoday_scraper._preferred_selectors[gk.base_url] == 'article'
+
+    articles, _ = gk.parse_listing_html("https://www.gktoday.in/", WRAPPED_LISTING)
+    assert [a['title'] for a in articles] == ["RBI keeps repo rate unchanged", "New bridge opened in Assam"]
+    assert articles[0]['date'] == "May 5, 2025"
+    assert gktoday_scraper._preferred_selectors[gk.base_url] == 'div[class*="post"]'
+    soup = make_soup(WRAPPED_LISTING)
+    assert [c['class'] for c in gk.collect_article_containers(soup)] == [['post-card'], ['post-card']]
+    gktoday_scraper._preferred_selectors.clear()
+    print("✅ Article containers are deduplicated")
+
+def test_pool_uses_parent_selector():
+    """Parse-pool workers start from the parent's selector and the parent learns theirs"""
+    gk = EnhancedGKTodayScraper()
+    pool = ParsePool(2)
+    try:
+        gktoday_scraper._preferred_selectors.clear()
+        calls = [(gk.base_url, gk.base_url, TIED_LISTING, None)] * 2
+        assert [selector for _, _, selector in pool.map(gktoday_scraper.parse_listing_page, calls)] == ['article'] * 2
+
+        # With '.post' preferred, every worker picks the same containers as in-thread parsing
+        calls = [(gk.base_url, gk.base_url, TIED_LISTING, '.post')] * 4
+        results = pool.map(gktoday_scraper.parse_listing_page, calls)
+        assert {selector for _, _, selector in results} == {'.post'}
+        gktoday_scraper._preferred_selectors[gk.base_url] = '.post'
+        expected, _ = gk.parse_listing_html(gk.base_url, TIED_LISTING)
+        assert all([a['url'] for a in articles] == [a['url'] for a in expected] for articles, _, _ in results)
+    finally:
+        pool.close()
+        gktoday_scraper._preferred_selectors.clear()
+    print("✅ Parse-pool workers share the parent's article selector")
+
+def main():
+    """Run all tests"""
+    test_article_containers_deduplicated()
+    test_pool_uses_parent_selector()
+    print("🎉 GKToday container selection tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Test the single-pass GKToday detail extractor against the find_all/sibling
+implementation it replaced
+"""
+
+import os
+import sys
+import time
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from content_locator import largest_text_container
+from date_extraction import find_listing_date
+from gktoday_scraper import EnhancedGKTodayScraper
+from parser_backend import available_backends, make_soup
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+
+# Nesting, anchoring and sibling rules the extractor has to reproduce
+TRICKY_ARTICLE = b"""<html><body><div class="entry-content">
+<p>Paragraph before any heading is in no section</p>
+<div class="meta"><p>Lead inside the date's element</p>Posted May 5 2026 by GKToday</div>
+<p>First paragraph <em>after</em> the date</p>
+<img src="/wp-content/lead.jpg">
+<h2>Section <span>one</span></h2>
+<p>Text with <!-- a comment --> <script>var s = 1;</script>a script</p>
+<p></p>
+<ul>
+  <li>Outer bullet <ul><li>Nested bullet</li><li></li></ul></li>
+  <li><h3>Heading inside a bullet</h3><p>Paragraph of the inner heading</p></li>
+</ul>
+<ol><li>Ordered lists are not bullets</li></ol>
+<div><h4>Heading in a wrapper</h4><p>Wrapped paragraph</p></div>
+<p>Still section one after the wrapper</p>
+<h3>Empty section</h3>
+<h3>Only bullets</h3>
+<ul><li>Lone bullet</li></ul>
+</div>
+<img src="https://cdn.example/after-container.jpg">
+</body></html>"""
+
+# The only image and paragraph after the date are past the end of the container
+OUTSIDE_ANCHOR = b"""<html><body><div class="post-content">
+<img src="/before-date.jpg"><h2>Heading</h2><p>January 2, 2025</p>
+</div><p>Paragraph outside</p><img src="relative.jpg"></body></html>"""
+
+def legacy_parse_detailed_html(scraper, content):
+    """EnhancedGKTodayScraper.parse_detailed_html before the single-pass walk"""
+    soup = make_soup(content, scraper.html_parser)
+    article_content = {"content": "", "sections": [], "image_url": ""}
+    content_selectors = ['.post-content', '.entry-content', 'article', '.single-post-content', '.content', 'main']
+    main_content = None
+    for selector in content_selectors:
+        content_container = soup.select_one(selector)
+        if content_container:
+            main_content = content_container
+            break
+    if not main_content:
+        main_content = largest_text_container(soup)
+    if main_content:
+        article_content.update(legacy_extract_detail_content(scraper, main_content))
+    return article_content
+
+def legacy_extract_detail_content(scraper, main_content):
+    """The date anchor and heading scans on the main content container"""
+    article_content = {"content": "", "sections": [], "image_url": ""}
+    if main_content:
+        date_element = main_content.find(string=lambda s: isinstance(s, str) and find_listing_date(s))
+        if date_element and date_element.parent:
+            img_element = date_element.parent.find_next('img')
+            if img_element and 'src' in img_element.attrs:
+                article_content["image_url"] = img_element['src']
+                if not article_content["image_url"].startswith('http'):
+                    article_content["image_url"] = scraper.base_url + article_content["image_url"]
+            next_p = date_element.parent.find_next('p')
+            if next_p:
+                article_content["content"] = next_p.get_text(strip=True)
+        headings = main_content.find_all(['h2', 'h3', 'h4'])
+        for heading in headings:
+            section_title = heading.get_text(strip=True)
+            section_content = ""
+            bullet_points = []
+            current = heading.find_next_sibling()
+            while current and current.name not in ['h2', 'h3', 'h4']:
+                if current.name == 'p':
+                    section_content += current.get_text(strip=True) + " "
+                elif current.name == 'ul':
+                    for li in current.find_all('li'):
+                        bullet_point = li.get_text(strip=True)
+                        if bullet_point:
+                            bullet_points.append(bullet_point)
+                current = current.find_next_sibling()
+            if section_content.strip() or bullet_points:
+                article_content["sections"].append({
+                    "title": section_title,
+                    "content": section_content.strip(),
+                    "bullet_points": bullet_points
+                })
+    return article_content
+
+def long_article(sections: int) -> bytes:
+    """A long article: a dated header, then sections of paragraphs and two-level lists"""
+    body = ['<div class="post-meta">Published on May 5, 2025</div><img src="/lead.jpg"><p>Lead paragraph.</p>']
+    for i in range(sections):
+        nested = ''.join(f'<li>Sub-point {j} of section {i} with <b>bold</b> text</li>' for j in range(4))
+        bullets = ''.join(f'<li>Bullet {j} of section {i} explains a point<ul>{nested}</ul></li>' for j in range(5))
+        body.append(f'<h2>Section {i}</h2><p>Paragraph one of section {i}, long enough to keep.</p>'
+                    f'<p>Paragraph two of section {i} with <a href="/l">a link</a>.</p><ul>{bullets}</ul>')
+    return f'<html><body><div class="post-content">{"".join(body)}</div></body></html>'.encode()
+
+def test_matches_legacy():
+    """Same intro, image and sections as before on the fixture and tricky markup, with every backend"""
+    with open(os.path.join(FIXTURES_DIR, 'gktoday_article.html'), 'rb') as f:
+        pages = [f.read(), TRICKY_ARTICLE, OUTSIDE_ANCHOR, long_article(3),
+                 b"<html><body><div><p>No date, no headings</p></div></body></html>"]
+    for backend in available_backends():
+        scraper = EnhancedGKTodayScraper()
+        scraper.html_parser = backend
+        for page in pages:
+            assert scraper.parse_detailed_html(page) == legacy_parse_detailed_html(scraper, page)
+
+    scraper = EnhancedGKTodayScraper()
+    detail = scraper.parse_detailed_html(TRICKY_ARTICLE)
+    assert detail["content"] == "Lead inside the date's element"
+    assert detail["image_url"] == scraper.base_url + "/wp-content/lead.jpg"
+    titles = [section["title"] for section in detail["sections"]]
+    assert titles == ["Sectionone", "Heading inside a bullet", "Heading in a wrapper", "Only bullets"]
+    assert detail["sections"][0]["content"] == "Text witha script  Still section one after the wrapper"
+    assert detail["sections"][0]["bullet_points"][:2] == ["Outer bulletNested bullet", "Nested bullet"]
+    outside = scraper.parse_detailed_html(OUTSIDE_ANCHOR)
+    assert outside["content"] == "Paragraph outside" and outside["image_url"] == scraper.base_url + "relative.jpg"
+    print(f"✅ Detail content matches the previous extractor on {len(pages)} pages: {', '.join(available_backends())}")
+
+def benchmark():
+    """Report single walk and per-heading sibling walk timings (not collected by pytest: timings flake under load)"""
+    scraper = EnhancedGKTodayScraper()
+    main_content = make_soup(long_article(40)).select_one('.post-content')
+    rounds = 5
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        expected = legacy_extract_detail_content(scraper, main_content)
+    legacy_seconds = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        extracted = scraper.extract_detail_content(main_content)
+    walk_seconds = (time.perf_counter() - start) / rounds
+
+    assert extracted == expected
+    print(f"✅ 40-section article: {walk_seconds * 1000:.1f}ms vs {legacy_seconds * 1000:.1f}ms before")
+
+def main():
+    """Run all tests"""
+    test_matches_legacy()
+    benchmark()
+    print("🎉 GKToday detail extraction tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
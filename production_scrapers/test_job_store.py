@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test the durable scrape run job store
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from job_store import JobStore
+
+def new_store() -> JobStore:
+    """Job store backed by a fresh temporary file"""
+    handle, path = tempfile.mkstemp(suffix='.db')
+    os.close(handle)
+    return JobStore(path)
+
+def test_run_lifecycle():
+    """Runs are visible to other store instances as they progress"""
+    store = new_store()
+    reader = JobStore(store.path)  # e.g. another process polling status
+
+    run_id = store.create_run({"max_pages": 2})
+    assert reader.latest_run()['status'] == 'running'
+
+    store.update_source(run_id, 'gktoday', 'running', articles_scraped=3, articles_skipped=1)
+    store.update_source(run_id, 'drishti', 'running', articles_scraped=2, errors=['timeout'])
+    run = reader.get_run(run_id)
+    assert (run['articles_scraped'], run['articles_skipped']) == (5, 1)
+    assert run['sources']['drishti']['errors'] == ['timeout']
+
+    store.update_source(run_id, 'gktoday', 'completed', articles_scraped=4, articles_skipped=1)
+    store.finish_run(run_id, 'completed', result={"success": True})
+    run = reader.latest_run()
+    assert run['status'] == 'completed' and run['completed_at']
+    assert run['articles_scraped'] == 6
+    assert run['sources']['drishti']['status'] == 'completed'
+    assert reader.latest_run(with_result=True)['result'] == {"success": True}
+    print("✅ Run lifecycle recorded incrementally")
+
+def test_finish_keeps_cancel():
+    """A run cancelled before it finishes stays cancelled, with its results recorded"""
+    store = new_store()
+    run_id = store.create_run({})
+    store.update_source(run_id, 'gktoday', 'running', articles_scraped=2)
+    assert store.cancel_run(run_id)
+
+    assert store.finish_run(run_id, 'completed', articles_scraped=2, result={"success": True}) == 'cancelled'
+    run = store.get_run(run_id)
+    assert run['status'] == 'cancelled' and run['result'] == {"success": True}
+    assert run['sources']['gktoday']['status'] == 'cancelled'
+    assert not store.cancel_run(run_id)
+
+    other_id = store.create_run({})
+    assert store.finish_run(other_id, 'failed', errors=['boom']) == 'failed'
+    assert store.finish_run('missing', 'completed') is None
+    print("✅ Finishing a cancelled run keeps it cancelled")
+
+def test_orphaned_runs():
+    """Runs left 'running' by a dead process are marked failed"""
+    store = new_store()
+    run_id = store.create_run({})
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("UPDATE scrape_runs SET pid = ? WHERE id = ?", (2 ** 22 + 12345, run_id))
+
+    live_id = store.create_run({})
+    assert store.fail_orphaned_runs() == 1
+    assert store.get_run(run_id)['status'] == 'failed'
+    assert store.get_run(live_id)['status'] == 'running'
+    print("✅ Orphaned runs marked failed")
+
+def main():
+    """Run all tests"""
+    test_run_lifecycle()
+    test_finish_keeps_cancel()
+    test_orphaned_runs()
+    print("🎉 Job store tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
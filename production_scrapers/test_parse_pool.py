@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test parsing pages in the parse pool's worker processes
+"""
+
+import os
+import sys
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from parse_pool import ParsePool
+import drishti_scraper
+import gktoday_scraper
+
+GKTODAY_ARTICLE = b"""<html><body><div class="entry-content"><h1>RBI policy</h1><p>May 5, 2025</p>
+<img src="/img/rbi.png"><p>The RBI kept the repo rate unchanged.</p>
+<h2>Background</h2><p>Inflation eased.</p><ul><li>CPI at 3%</li><li>Growth steady</li></ul>
+<h3>Details</h3><ul><li>Repo at 6.5%</li></ul></div></body></html>"""
+
+GKTODAY_LISTING = b"""<html><body><main>
+<article class="post type-post"><h2 class="entry-title"><a href="https://www.gktoday.in/rbi-policy/">RBI keeps repo rate unchanged</a></h2><p>May 5, 2025</p></article>
+<article class="post type-post"><h2 class="entry-title"><a href="https://www.gktoday.in/new-bridge/">New bridge opened in Assam</a></h2><p>May 4, 2025</p></article>
+</main><nav class="navigation pagination"><div class="nav-links">
+<a class="page-numbers current" href="https://www.gktoday.in/page/1/">1</a><a class="page-numbers" href="https://www.gktoday.in/page/2/">2</a>
+</div></nav></body></html>"""
+
+DRISHTI_ARTICLE = b"""<html><body><h1 id="dynamic-title">India-EU Trade Talks</h1>
+<ul class="actions"><li class="date">29 Jan, 2025</li></ul>
+<div class="article-detail"><p>India and the EU resumed trade talks this week.</p>
+<h2>Why in News?</h2><p>Both sides agreed on a new timeline.</p><ul><li>Tariffs to be discussed</li></ul></div>
+<div class="starRating"><span class="checked"></span><span class="checked"></span></div></body></html>"""
+
+def without_timestamps(articles):
+    """Listing articles minus the per-parse scraped_at timestamp"""
+    return [{key: value for key, value in article.items() if key != 'scraped_at'} for article in articles]
+
+def test_pool_matches_in_thread_parsing():
+    """Worker processes return the same plain dicts as parsing in-thread"""
+    gk = gktoday_scraper.EnhancedGKTodayScraper()
+    dr = drishti_scraper.EnhancedDrishtiScraperFixed()
+    url = "https://www.drishtiias.com/daily-news-analysis/india-eu-trade-talks"
+    pool = ParsePool(2)
+    try:
+        detail = pool.map(gktoday_scraper.parse_detail_page, [(gk.base_url, GKTODAY_ARTICLE)])
+        listing = pool.map(gktoday_scraper.parse_listing_page, [(gk.base_url, "https://www.gktoday.in/", GKTODAY_LISTING)])
+        article = pool.map(drishti_scraper.parse_article_page, [(dr.base_url, url, DRISHTI_ARTICLE)])[0]
+        many = pool.map(gktoday_scraper.parse_detail_page, [(gk.base_url, GKTODAY_ARTICLE)] * 8)
+    finally:
+        pool.close()
+
+    assert detail[0] == gk.parse_detailed_html(GKTODAY_ARTICLE)
+    assert detail[0]["sections"] and detail[0]["image_url"] == "https://www.gktoday.in/img/rbi.png"
+
+    articles, next_url, selector = listing[0]
+    expected_articles, expected_next = gk.parse_listing_html("https://www.gktoday.in/", GKTODAY_LISTING)
+    assert without_timestamps(articles) == without_timestamps(expected_articles)
+    assert next_url == expected_next == "https://www.gktoday.in/page/2/"
+    assert selector == 'article'
+
+    assert article == dr.parse_article_html(url, DRISHTI_ARTICLE)
+    assert article["title"] == "India-EU Trade Talks"
+    assert many == [detail[0]] * 8
+    print("✅ Parse pool matches in-thread parsing")
+
+def main():
+    """Run all tests"""
+    test_pool_matches_in_thread_parsing()
+    print("🎉 Parse pool tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test that every installed HTML parser backend extracts the same articles
+Runs the scrapers' extraction on the saved pages in fixtures/ with each
+backend and compares against html.parser
+"""
+
+import os
+import sys
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from drishti_scraper import DAY_PAGE_FILTER, EnhancedDrishtiScraperFixed
+from gktoday_scraper import LISTING_PAGE_FILTER, EnhancedGKTodayScraper
+import parser_backend
+from parser_backend import BACKENDS, DEFAULT_BACKEND, available_backends, make_soup, resolve_backend
+
+FIXTURES_DIR = os.path.join(current_dir, 'fixtures')
+
+DRISHTI_ARTICLE_URL = "https://www.drishtiias.com/daily-updates/daily-news-analysis/india-eu-free-trade-agreement-talks"
+
+# Listing without article containers, so parse_listing_html falls back to link discovery
+FALLBACK_LISTING = b"""<html><body><div class="grid">
+<div class="card"><h2><a href="https://www.gktoday.in/2025/05/rbi-policy/">RBI keeps repo rate unchanged</a></h2><p>May 5, 2025</p></div>
+<div class="card"><h2><a href="https://www.gktoday.in/2025/05/new-bridge/">New bridge opened in Assam</a></h2></div>
+</div></body></html>"""
+
+def load_fixture(name: str) -> bytes:
+    """Raw bytes of a saved page"""
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+def extract_all(backend: str) -> dict:
+    """Everything the scrapers extract from the fixtures with one backend"""
+    gk = EnhancedGKTodayScraper()
+    dr = EnhancedDrishtiScraperFixed()
+    gk.html_parser = dr.html_parser = backend
+
+    articles, next_url = gk.parse_listing_html("https://www.gktoday.in/", load_fixture('gktoday_listing.html'))
+    for article in articles:
+        article.pop('scraped_at')
+    soup = make_soup(load_fixture('drishti_article.html'), backend)
+    return {
+        'gktoday_listing': (articles, next_url),
+        'gktoday_article': gk.parse_detailed_html(load_fixture('gktoday_article.html')),
+        'drishti_links': dr.extract_article_links(make_soup(load_fixture('drishti_day.html'), backend)),
+        'drishti_metadata': dr.extract_metadata(soup),
+        'drishti_sections': dr.extract_content_sections(soup),
+        'drishti_article': dr.parse_article_html(DRISHTI_ARTICLE_URL, load_fixture('drishti_article.html'))
+    }
+
+def test_fixture_extraction():
+    """The fixtures exercise every extractor (guards the parity test against empty output)"""
+    extracted = extract_all(DEFAULT_BACKEND)
+    articles, next_url = extracted['gktoday_listing']
+    assert [a['title'] for a in articles][:2] == ["RBI Keeps Repo Rate Unchanged at 6.5%", "India Launches National Critical Mineral Mission"]
+    assert next_url == "https://www.gktoday.in/page/2/"
+    assert len(extracted['gktoday_article']['sections']) >= 3
+    assert extracted['gktoday_article']['image_url'].endswith('/rbi-mpc.jpg')
+    assert len(extracted['drishti_links']) == 4
+    assert extracted['drishti_metadata']['importance_rating'] == "3/5"
+    intro, sections = extracted['drishti_sections']
+    assert intro and [s['heading'] for s in sections][1:3] == ["Why in News?", "What are the Key Highlights of the Negotiations?"]
+    assert extracted['drishti_article']['image_url'].endswith('India-EU-FTA.png')
+    print("✅ Fixtures exercise every extractor")
+
+def test_backends_match_html_parser():
+    """lxml and selectolax extract exactly what html.parser does"""
+    expected = extract_all(DEFAULT_BACKEND)
+    checked = []
+    for backend in available_backends():
+        if backend == DEFAULT_BACKEND:
+            continue
+        extracted = extract_all(backend)
+        for key in expected:
+            assert extracted[key] == expected[key], f"{backend} differs on {key}:\n{extracted[key]}\n!=\n{expected[key]}"
+        checked.append(backend)
+    skipped = [backend for backend in BACKENDS if backend not in available_backends()]
+    print(f"✅ Backends match html.parser: {', '.join(checked) or 'none installed'}"
+          + (f" (not installed: {', '.join(skipped)})" if skipped else ""))
+
+def extract_listing_and_day(backend: str) -> dict:
+    """What the scrapers extract from the listing and day fixtures (partial parse if enabled)"""
+    gk = EnhancedGKTodayScraper()
+    dr = EnhancedDrishtiScraperFixed()
+    gk.html_parser = backend
+    articles, next_url = gk.parse_listing_html("https://www.gktoday.in/", load_fixture('gktoday_listing.html'))
+    for article in articles:
+        article.pop('scraped_at')
+    fallback, _ = gk.parse_listing_html("https://www.gktoday.in/", FALLBACK_LISTING)
+    for article in fallback:
+        article.pop('scraped_at')
+    day_soup = make_soup(load_fixture('drishti_day.html'), backend, parse_only=DAY_PAGE_FILTER)
+    return {
+        'gktoday_listing': (articles, next_url),
+        'gktoday_fallback': fallback,
+        'drishti_links': dr.extract_article_links(day_soup)
+    }
+
+def test_partial_parse_matches_full_parse():
+    """Listing and day pages parsed partially extract exactly what the full DOM does"""
+    for backend in available_backends():
+        partial = extract_listing_and_day(backend)
+        parser_backend.PARTIAL_PARSE = False
+        try:
+            full = extract_listing_and_day(backend)
+        finally:
+            parser_backend.PARTIAL_PARSE = True
+        for key in full:
+            assert partial[key] == full[key], f"{backend} partial parse differs on {key}:\n{partial[key]}\n!=\n{full[key]}"
+        assert partial['gktoday_fallback'] and partial['drishti_links']
+
+        listing = load_fixture('gktoday_listing.html')
+        assert len(make_soup(listing, backend, parse_only=LISTING_PAGE_FILTER).find_all(True)) < len(make_soup(listing, backend).find_all(True))
+        assert not make_soup(listing, backend, parse_only=LISTING_PAGE_FILTER).find_all(['script', 'header', 'footer', 'aside'])
+    print(f"✅ Partial parse matches full parse: {', '.join(available_backends())}")
+
+def test_unknown_backend_falls_back():
+    """Unknown backends fall back to html.parser"""
+    assert resolve_backend('html5-turbo') == DEFAULT_BACKEND
+    print("✅ Unknown backend falls back to html.parser")
+
+def main():
+    """Run all tests"""
+    test_fixture_extraction()
+    test_backends_match_html_parser()
+    test_partial_parse_matches_full_parse()
+    test_unknown_backend_falls_back()
+    print("🎉 Parser backend tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test the staged fetch -> parse -> write pipeline
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from cancellation import CancellationToken, ScrapeCancelled
+from gktoday_scraper import EnhancedGKTodayScraper
+from pipeline import Pipeline, Stage
+
+def test_order_and_overlap():
+    """Results keep source order with several workers, and stages overlap"""
+    def fetch(n):
+        time.sleep(random.uniform(0, 0.02))
+        return n
+
+    written = []
+    pipeline = Pipeline([
+        Stage('fetch', fetch, workers=4),
+        Stage('parse', lambda n: n * 10, workers=2),
+        Stage('write', lambda n: written.append(n) or n, ordered=True)
+    ])
+    start = time.time()
+    results = list(pipeline.run(range(40)))
+    assert results == [n * 10 for n in range(40)]
+    assert written == results
+    assert time.time() - start < 40 * 0.02
+
+    metrics = pipeline.metrics_dict()
+    assert list(metrics) == ['source', 'fetch', 'parse', 'write']
+    assert all(m['items'] == 40 for m in metrics.values())
+    assert metrics['fetch']['workers'] == 4
+    print("✅ Pipeline keeps source order across workers")
+
+def test_backpressure():
+    """A slow write stage stops the source from running ahead of the queues"""
+    produced = []
+
+    def source():
+        for n in range(20):
+            produced.append(n)
+            yield n
+
+    def write(n):
+        time.sleep(0.05)
+        return n
+
+    pipeline = Pipeline([
+        Stage('fetch', lambda n: n),
+        Stage('parse', lambda n: n),
+        Stage('write', write, ordered=True)
+    ], queue_size=1)
+    for result in pipeline.run(source()):
+        # queues of one item each plus one item in every stage
+        assert len(produced) - result <= 8, (len(produced), result)
+
+    metrics = pipeline.metrics_dict()
+    assert metrics['write']['busy_seconds'] >= 0.9
+    assert metrics['source']['blocked_seconds'] > 0.5
+    assert metrics['write']['starved_seconds'] < metrics['source']['blocked_seconds']
+    print("✅ Slow writes apply backpressure to earlier stages")
+
+def test_errors_and_close():
+    """Stage errors are re-raised; closing early and cancelling stop every worker"""
+    def parse(n):
+        if n == 3:
+            raise ValueError("bad page")
+        return n
+
+    pipeline = Pipeline([Stage('parse', parse, workers=2)])
+    try:
+        list(pipeline.run(range(10)))
+        raise AssertionError("expected ValueError")
+    except ValueError as e:
+        assert str(e) == "bad page"
+
+    threads_before = threading.active_count()
+    pipeline = Pipeline([Stage('fetch', lambda n: n, workers=3)])
+    for result in pipeline.run(range(1000)):
+        if result == 5:
+            break
+    pipeline.close()
+    assert threading.active_count() <= threads_before
+
+    token = CancellationToken()
+    pipeline = Pipeline([Stage('fetch', lambda n: time.sleep(0.01) or n)], token=token)
+    threading.Timer(0.1, token.cancel, args=("Cancelled by user",)).start()
+    try:
+        list(pipeline.run(range(1000)))
+        raise AssertionError("expected ScrapeCancelled")
+    except ScrapeCancelled as e:
+        assert str(e) == "Cancelled by user"
+    print("✅ Pipeline errors, early stop and cancellation")
+
+def test_gktoday_fetch_plan():
+    """GKToday pages are cut to the articles the write stage can still accept, and listing stops there"""
+    def listing(pages, pulled):
+        for page, urls in enumerate(pages, 1):
+            pulled.append(page)
+            yield page, f"page-{page}", [{"url": url} for url in urls]
+
+    scraper = EnhancedGKTodayScraper()
+    existing = {"old-1", "old-2", "old-3", "old-4", "old-5", "old-6"}
+    scraper.mark_existing_articles = lambda articles: [a.update(exists=a["url"] in existing) for a in articles]
+
+    # max_articles reached part-way through page 2: its tail and page 3 are never fetched
+    pulled = []
+    pages = list(scraper.plan_listing_pages(listing([["a", "old-1", "b"], ["c", "d", "e"], ["f"]], pulled), 4, 5))
+    assert [[a["url"] for a in articles] for _, _, articles in pages] == [["a", "old-1", "b"], ["c", "d"]]
+    assert pulled == [1, 2]
+
+    # Five consecutive existing articles stop the sync after the page they end on
+    pulled = []
+    pages = list(scraper.plan_listing_pages(listing([["a", "old-1", "old-2"], [], ["old-3", "old-4", "old-5", "old-6"], ["g"]], pulled), 10, 5))
+    assert [page for page, _, _ in pages] == [1, 2, 3] and pulled == [1, 2, 3]
+    print("✅ GKToday fetch stage only gets articles the sync will write")
+
+def main():
+    """Run all tests"""
+    test_order_and_overlap()
+    test_backpressure()
+    test_errors_and_close()
+    test_gktoday_fetch_plan()
+    print("🎉 Pipeline tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -53,7 +53,7 @@ def test_database_connection():
     
     try:
         from dotenv import load_dotenv
-        import psycopg2
+        from db_pool import get_pool
         
         # Load environment variables
         load_dotenv('../.env.local')
@@ -63,13 +63,12 @@ def test_database_connection():
             print("❌ DATABASE_URL not found in environment")
             return False
         
-        # Test connection
-        conn = psycopg2.connect(database_url)
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        # Test connection through the shared pool
+        with get_pool().connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            result = cursor.fetchone()
+            cursor.close()
         
         if result and result[0] == 1:
             print("✅ Database connection successful")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test progress event streams and run estimates
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import progress_events
+from progress_events import EventStream, ProgressEstimator, ProgressEvent
+
+def test_event_stream():
+    """Readers replay buffered events, follow new ones and stop when the stream closes"""
+    stream = EventStream()
+    stream.publish(ProgressEvent(progress_events.RUN_STARTED))
+    stream.publish(ProgressEvent(progress_events.PAGE_DISCOVERED, source='gktoday', page=1, count=12))
+
+    def publish_rest():
+        time.sleep(0.1)
+        stream.publish(ProgressEvent(progress_events.WRITTEN, source='gktoday', url='https://example.com/a'))
+        stream.close()
+
+    threading.Thread(target=publish_rest).start()
+    events = [event for event in stream.follow(since=1, heartbeat=5) if event is not None]
+    assert [event.seq for event in events] == [2, 3]
+    assert events[1].to_dict() == {
+        'type': 'written', 'source': 'gktoday', 'url': 'https://example.com/a',
+        'timestamp': events[1].timestamp, 'seq': 3
+    }
+    assert list(stream.follow(since=3)) == []
+    print("✅ Event stream replays and follows events")
+
+def test_heartbeat():
+    """An idle stream yields None so servers can send keep-alives"""
+    stream = EventStream()
+    follower = stream.follow(heartbeat=0.05)
+    assert next(follower) is None
+    stream.close()
+    assert list(follower) == []
+    print("✅ Idle streams yield heartbeats")
+
+def test_estimator():
+    """Progress and ETA follow pages visited; finished sources count as done"""
+    estimator = ProgressEstimator({'gktoday': 3, 'drishti': 3})
+    assert estimator.estimate(0, 0)['estimated_remaining_seconds'] is None
+
+    for _ in range(2):
+        estimator.page_discovered('gktoday')
+    estimator.page_discovered('drishti')
+    assert abs(estimator.fraction_done() - 1 / 6) < 1e-9
+    assert estimator.estimate(5, 0)['estimated_remaining_seconds'] is not None
+
+    estimator.source_finished('gktoday')
+    estimator.source_finished('drishti')
+    estimate = estimator.estimate(5, 2)
+    assert estimate['progress_percentage'] == 100.0
+    assert estimate['estimated_remaining_seconds'] == 0
+    print("✅ Estimator reports progress and ETA")
+
+def main():
+    """Run all tests"""
+    test_event_stream()
+    test_heartbeat()
+    test_estimator()
+    print("🎉 Progress event tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
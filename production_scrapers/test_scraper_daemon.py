@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the scraper daemon's loopback control API
+"""
+
+import http.client
+import os
+import sys
+from urllib.parse import urlparse
+
+# Add production_scrapers to path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import scraper_daemon
+from scraper_daemon import ScraperDaemon, call_daemon
+from scraper_service import ScraperService
+
+def run_with_daemon(check):
+    """Run check() against a daemon on an ephemeral port with a fresh service"""
+    daemon = ScraperDaemon('127.0.0.1', 0, service=ScraperService())
+    daemon.start()
+    previous_url = os.environ.get('SCRAPER_SERVICE_URL')
+    os.environ['SCRAPER_SERVICE_URL'] = daemon.url
+    try:
+        check()
+    finally:
+        if previous_url is None:
+            os.environ.pop('SCRAPER_SERVICE_URL', None)
+        else:
+            os.environ['SCRAPER_SERVICE_URL'] = previous_url
+        daemon.shutdown()
+
+def test_status_endpoints():
+    """Health, status and result respond while idle"""
+    def check():
+        assert call_daemon('GET', '/health') == {"success": True, "status": "ok"}
+        assert call_daemon('GET', '/status')['status'] == 'idle'
+        assert call_daemon('GET', '/result') == {"message": "No result available"}
+        print("✅ Idle daemon reports status")
+
+    run_with_daemon(check)
+
+def test_control_errors():
+    """Bad requests are rejected without touching the service"""
+    def check():
+        result = call_daemon('POST', '/start', {"max_pages": 1, "bogus": True})
+        assert result['success'] is False and 'bogus' in result['error']
+
+        for body, name in (({"max_pages": "5"}, 'max_pages'), ({"max_articles": True}, 'max_articles'),
+                           ({"max_pages": 0}, 'max_pages'), ({"parallel": "no"}, 'parallel')):
+            result = call_daemon('POST', '/start', body)
+            assert result['success'] is False and name in result['error'], body
+        assert call_daemon('GET', '/status')['status'] == 'idle'
+
+        # Malformed Content-Length headers are rejected, not left to hang or crash the handler
+        daemon_url = urlparse(os.environ['SCRAPER_SERVICE_URL'])
+        for length in ('abc', '-1'):
+            conn = http.client.HTTPConnection(daemon_url.hostname, daemon_url.port, timeout=5)
+            conn.putrequest('POST', '/start')
+            conn.putheader('Content-Length', length)
+            conn.endheaders()
+            response = conn.getresponse()
+            assert response.status == 400 and b'Content-Length' in response.read(), length
+            conn.close()
+
+        result = call_daemon('POST', '/cancel')
+        assert result['success'] is False and result['status'] == 'idle'
+
+        result = call_daemon('GET', '/nope')
+        assert result['success'] is False
+        print("✅ Invalid control requests rejected")
+
+    run_with_daemon(check)
+
+def test_daemon_unavailable():
+    """call_daemon raises DaemonUnavailable when nothing is listening"""
+    daemon = ScraperDaemon('127.0.0.1', 0, service=ScraperService())
+    url = daemon.url
+    daemon.shutdown()
+
+    os.environ['SCRAPER_SERVICE_URL'] = url
+    try:
+        call_daemon('GET', '/status', timeout=2)
+        raise AssertionError("expected DaemonUnavailable")
+    except scraper_daemon.DaemonUnavailable:
+        print("✅ Missing daemon detected")
+    finally:
+        os.environ.pop('SCRAPER_SERVICE_URL', None)
+
+def main():
+    """Run all tests"""
+    test_status_endpoints()
+    test_control_errors()
+    test_daemon_unavailable()
+    print("🎉 Scraper daemon tests passed")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
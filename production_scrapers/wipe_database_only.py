@@ -7,7 +7,6 @@ This allows us to test the production scrapers on a clean database
 import os
 import sys
 import logging
-import psycopg2
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -25,34 +24,39 @@ DATABASE_URL = os.getenv('DATABASE_URL')
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
+from db_pool import get_pool
+from migrations import migrate, reset_schema_cache
+
 def wipe_database():
     """Wipe the PostgreSQL database tables completely"""
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-        
-        logger.info("Wiping database tables...")
-        
-        # Drop tables in correct order (considering foreign key constraints)
-        tables_to_drop = [
-            'section_bullets',
-            'sections', 
-            'gk_today_content',
-            'quiz_attempts',
-            'student_invitations',
-            'scraped_content'
-        ]
-        
-        for table in tables_to_drop:
-            try:
-                cursor.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
-                logger.info(f"Dropped table: {table}")
-            except Exception as e:
-                logger.warning(f"Could not drop table {table}: {e}")
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pool().connection() as conn:
+            cursor = conn.cursor()
+            
+            logger.info("Wiping database tables...")
+            
+            # Drop tables in correct order (considering foreign key constraints);
+            # schema_migrations too, so the migrations run again on the empty database
+            tables_to_drop = [
+                'section_bullets',
+                'sections', 
+                'gk_today_content',
+                'quiz_attempts',
+                'student_invitations',
+                'scraped_content',
+                'schema_migrations'
+            ]
+            
+            for table in tables_to_drop:
+                try:
+                    cursor.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
+                    logger.info(f"Dropped table: {table}")
+                except Exception as e:
+                    logger.warning(f"Could not drop table {table}: {e}")
+            
+            conn.commit()
+            cursor.close()
+        reset_schema_cache()
         logger.info("Database wiped successfully")
         return True
     except Exception as e:
@@ -60,55 +64,11 @@ def wipe_database():
         return False
 
 def initialize_database():
-    """Initialize a fresh database with required tables"""
+    """Initialize a fresh database by applying the schema migrations"""
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-        
         logger.info("Initializing database tables...")
-        
-        # Create main content table for both GKToday and DrishtiIAS
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS gk_today_content (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                title TEXT NOT NULL,
-                url TEXT UNIQUE NOT NULL,
-                image_url TEXT,
-                published_date DATE,
-                source_name TEXT DEFAULT 'GKToday',
-                scraped_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-                intro TEXT,
-                sequence_order INTEGER,
-                date TEXT,
-                importance_rating VARCHAR(10)
-            )
-        ''')
-        
-        # Create sections table for structured content
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sections (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                article_id UUID REFERENCES gk_today_content(id) ON DELETE CASCADE,
-                heading TEXT,
-                content TEXT,
-                type TEXT CHECK (type IN ('paragraph', 'list')),
-                sequence_order INTEGER
-            )
-        ''')
-        
-        # Create section_bullets table for bullet points
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS section_bullets (
-                id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                section_id UUID REFERENCES sections(id) ON DELETE CASCADE,
-                content TEXT NOT NULL,
-                bullet_order INTEGER
-            )
-        ''')
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pool().connection() as conn:
+            migrate(conn)
         logger.info("Database initialized successfully")
         return True
     except Exception as e: